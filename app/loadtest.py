@@ -0,0 +1,410 @@
+"""
+Load test for the web app against a local stub of GitHub's GraphQL API.
+
+Starts a stub answering contribution queries with synthetic calendars,
+launches the app (uvicorn main:app) pointed at it through
+GH_SPACE_SHOOTER_GRAPHQL_URL, sends /api/generate requests at a fixed
+concurrency and reports latency percentiles, throughput and the app's peak
+resident memory. Nothing leaves the machine, so runs are reproducible and
+can be compared across changes.
+
+Server settings (RENDER_WORKERS, RENDER_CACHE_MAX_BYTES, ...) are taken from
+the environment, like when running the app directly.
+
+Usage (from the app directory):
+    python loadtest.py --requests 500 --concurrency 32 --users 100 --distribution zipf
+"""
+
+import asyncio
+import json
+import os
+import random
+import socket
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+from dataclasses import asdict, dataclass
+from datetime import date
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+
+import httpx
+import typer
+from gh_space_shooter.contribution_history import group_weeks
+from gh_space_shooter.github_client import ContributionData
+from gh_space_shooter.synthetic import calendar_response, synthetic_contribution_data, user_node
+
+APP_DIR = Path(__file__).parent / "src"
+
+# Exponent of the zipf key distribution; the k-th most popular user gets 1/k**s of the traffic
+ZIPF_EXPONENT = 1.1
+
+# Seconds between samples of the app's memory
+RSS_SAMPLE_INTERVAL = 0.1
+
+
+class GraphQLStub:
+    """
+    Local stand-in for GitHub's GraphQL endpoint.
+
+    Every user exists and has a synthetic calendar derived from their
+    username. Each response is held back by a fixed latency to mimic the
+    round trip to GitHub.
+    """
+
+    def __init__(self, density: float, latency: float, seed: int = 0):
+        """
+        Start the stub on a free local port.
+
+        Args:
+            density: Fraction of days with contributions in each calendar
+            latency: Seconds to wait before answering each request
+            seed: Varies the calendars generated for the same usernames
+        """
+        self.density = density
+        self.latency = latency
+        self.seed = seed
+        self.request_count = 0
+        self._calendars: dict[str, ContributionData] = {}
+        stub = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_POST(self) -> None:
+                payload = json.loads(self.rfile.read(int(self.headers["Content-Length"])))
+                stub.request_count += 1
+                time.sleep(stub.latency)
+                body = json.dumps(stub.answer(payload)).encode()
+                self.send_response(200)
+                self.send_header("Content-Type", "application/json")
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, format, *args) -> None:
+                pass
+
+        self.server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+        self.url = f"http://127.0.0.1:{self.server.server_address[1]}/graphql"
+        self.thread = threading.Thread(target=self.server.serve_forever, daemon=True)
+        self.thread.start()
+
+    def answer(self, payload: dict) -> dict:
+        """Build the response to one of the clients' queries."""
+        query = payload["query"]
+        variables = payload.get("variables") or {}
+        if "username" not in variables:
+            # Batched query: one aliased user per variable (u0, u1, ...)
+            return {"data": {alias: user_node(self.calendar(username)) for alias, username in variables.items()}}
+
+        data = self.calendar(variables["username"])
+        if "weeks" not in query:
+            # Revalidation asks for the total only
+            calendar = {"totalContributions": data["total_contributions"]}
+            return {"data": {"user": {"contributionsCollection": {"contributionCalendar": calendar}}}}
+        if "from" in variables:
+            data = _window(data, date.fromisoformat(variables["from"][:10]), date.fromisoformat(variables["to"][:10]))
+        return calendar_response(data)
+
+    def calendar(self, username: str) -> ContributionData:
+        if username not in self._calendars:
+            self._calendars[username] = synthetic_contribution_data(username, self.density, self.seed)
+        return self._calendars[username]
+
+    def stop(self) -> None:
+        self.server.shutdown()
+        self.server.server_close()
+
+
+@dataclass
+class Report:
+    """Outcome of a load test run; latencies in seconds."""
+
+    requests: int
+    concurrency: int
+    users: int
+    distribution: str
+    duration: float
+    throughput: float
+    statuses: dict[str, int]
+    p50: float
+    p95: float
+    p99: float
+    max: float
+    peak_rss_bytes: int | None
+    github_requests: int
+    render_cache: dict
+
+    def summary(self) -> str:
+        rss = f"{self.peak_rss_bytes / 2**20:.1f} MiB" if self.peak_rss_bytes is not None else "n/a"
+        statuses = ", ".join(f"{status}: {count}" for status, count in sorted(self.statuses.items()))
+        return "\n".join(
+            [
+                f"requests      {self.requests} ({self.distribution} over {self.users} users, concurrency {self.concurrency})",
+                f"statuses      {statuses}",
+                f"duration      {self.duration:.2f} s",
+                f"throughput    {self.throughput:.1f} req/s",
+                f"latency p50   {self.p50 * 1000:.0f} ms",
+                f"latency p95   {self.p95 * 1000:.0f} ms",
+                f"latency p99   {self.p99 * 1000:.0f} ms",
+                f"latency max   {self.max * 1000:.0f} ms",
+                f"peak RSS      {rss}",
+                f"GitHub calls  {self.github_requests}",
+                f"render cache  {self.render_cache.get('hits', 0)} hits, {self.render_cache.get('misses', 0)} misses",
+            ]
+        )
+
+
+class MemorySampler:
+    """Tracks the peak resident memory of a process and its descendants (Linux only)."""
+
+    def __init__(self, pid: int):
+        self.pid = pid
+        self.peak: int | None = None
+        self._stop = threading.Event()
+        self._thread = threading.Thread(target=self._run, daemon=True)
+
+    def start(self) -> None:
+        self._thread.start()
+
+    def stop(self) -> int | None:
+        self._stop.set()
+        self._thread.join()
+        return self.peak
+
+    def _run(self) -> None:
+        while not self._stop.is_set():
+            rss = tree_rss(self.pid)
+            if rss is not None:
+                self.peak = max(rss, self.peak or 0)
+            self._stop.wait(RSS_SAMPLE_INTERVAL)
+
+
+def tree_rss(pid: int) -> int | None:
+    """
+    Summed resident memory of a process and all its descendants, in bytes.
+
+    Pages shared between processes (e.g. by forked render workers) count once
+    per process, so this is an upper bound. Returns None where /proc is not available.
+    """
+    proc = Path("/proc")
+    if not (proc / str(pid)).exists():
+        return None
+    children: dict[int, list[int]] = {}
+    for stat in proc.glob("[0-9]*/stat"):
+        try:
+            # The command name may contain spaces, so split after its closing parenthesis
+            ppid = int(stat.read_text().rsplit(")", 1)[1].split()[1])
+        except (OSError, IndexError, ValueError):
+            continue
+        children.setdefault(ppid, []).append(int(stat.parent.name))
+
+    total = 0
+    pending = [pid]
+    while pending:
+        current = pending.pop()
+        total += _rss(current)
+        pending.extend(children.get(current, []))
+    return total
+
+
+def percentile(sorted_values: list[float], fraction: float) -> float:
+    """Nearest-rank percentile of an ascending list."""
+    if not sorted_values:
+        return 0.0
+    return sorted_values[max(0, min(len(sorted_values) - 1, round(fraction * len(sorted_values)) - 1))]
+
+
+def key_weights(users: int, distribution: str) -> list[float]:
+    """
+    Relative request frequency of each user.
+
+    Raises:
+        ValueError: If the distribution is unknown
+    """
+    if distribution == "uniform":
+        return [1.0] * users
+    if distribution == "zipf":
+        return [1 / rank**ZIPF_EXPONENT for rank in range(1, users + 1)]
+    raise ValueError(f"Unknown distribution '{distribution}', expected 'uniform' or 'zipf'")
+
+
+async def drive(
+    base_url: str,
+    keys: list[str],
+    concurrency: int,
+    strategy: str,
+    timeout: float,
+) -> tuple[list[tuple[int | str, float]], float]:
+    """
+    Request a GIF for every key, with at most `concurrency` requests in flight.
+
+    Returns:
+        (status or error name, seconds) per request, and the wall time of the run
+    """
+    pending = iter(keys)
+    results: list[tuple[int | str, float]] = []
+
+    async def worker(client: httpx.AsyncClient) -> None:
+        for username in pending:
+            started = time.perf_counter()
+            try:
+                response = await client.get("/api/generate", params={"username": username, "strategy": strategy})
+                outcome: int | str = response.status_code
+            except httpx.HTTPError as e:
+                outcome = type(e).__name__
+            results.append((outcome, time.perf_counter() - started))
+
+    limits = httpx.Limits(max_connections=concurrency, max_keepalive_connections=concurrency)
+    async with httpx.AsyncClient(base_url=base_url, timeout=timeout, limits=limits) as client:
+        started = time.perf_counter()
+        await asyncio.gather(*(worker(client) for _ in range(concurrency)))
+        return results, time.perf_counter() - started
+
+
+def start_app(stub_url: str, cache_dir: str) -> tuple[subprocess.Popen, str]:
+    """Launch the app on a free local port, talking to the stub instead of GitHub."""
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        port = sock.getsockname()[1]
+    env = {
+        **os.environ,
+        "GH_TOKEN": os.getenv("GH_TOKEN", "loadtest"),
+        "GH_SPACE_SHOOTER_GRAPHQL_URL": stub_url,
+        "GH_SPACE_SHOOTER_CACHE_DIR": cache_dir,
+    }
+    command = [sys.executable, "-m", "uvicorn", "main:app", "--host", "127.0.0.1", "--port", str(port), "--log-level", "warning"]
+    return subprocess.Popen(command, cwd=APP_DIR, env=env), f"http://127.0.0.1:{port}"
+
+
+def wait_until_ready(process: subprocess.Popen, base_url: str, timeout: float = 60) -> None:
+    """
+    Block until the app answers requests.
+
+    Raises:
+        RuntimeError: If the app exits or does not come up in time
+    """
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        if process.poll() is not None:
+            raise RuntimeError(f"App exited with status {process.returncode} during startup")
+        try:
+            if httpx.get(f"{base_url}/api/pool/stats", timeout=1).status_code == 200:
+                return
+        except httpx.HTTPError:
+            pass
+        time.sleep(0.2)
+    raise RuntimeError(f"App did not start within {timeout:.0f}s")
+
+
+def run(
+    requests: int,
+    concurrency: int,
+    users: int,
+    distribution: str,
+    strategy: str,
+    density: float,
+    latency: float,
+    seed: int,
+    timeout: float,
+) -> Report:
+    """Run one load test against a freshly started app and stub."""
+    rng = random.Random(seed)
+    usernames = [f"loadtest-user-{idx}" for idx in range(users)]
+    keys = rng.choices(usernames, weights=key_weights(users, distribution), k=requests)
+
+    stub = GraphQLStub(density, latency, seed)
+    try:
+        with tempfile.TemporaryDirectory(prefix="gh-space-shooter-loadtest-") as cache_dir:
+            process, base_url = start_app(stub.url, cache_dir)
+            try:
+                wait_until_ready(process, base_url)
+                sampler = MemorySampler(process.pid)
+                sampler.start()
+                try:
+                    results, duration = asyncio.run(drive(base_url, keys, concurrency, strategy, timeout))
+                finally:
+                    peak_rss = sampler.stop()
+                render_cache = httpx.get(f"{base_url}/api/cache/stats", timeout=timeout).json()
+            finally:
+                process.terminate()
+                process.wait()
+    finally:
+        stub.stop()
+
+    latencies = sorted(seconds for _, seconds in results)
+    statuses: dict[str, int] = {}
+    for outcome, _ in results:
+        statuses[str(outcome)] = statuses.get(str(outcome), 0) + 1
+    return Report(
+        requests=requests,
+        concurrency=concurrency,
+        users=users,
+        distribution=distribution,
+        duration=duration,
+        throughput=len(results) / duration if duration else 0.0,
+        statuses=statuses,
+        p50=percentile(latencies, 0.50),
+        p95=percentile(latencies, 0.95),
+        p99=percentile(latencies, 0.99),
+        max=latencies[-1] if latencies else 0.0,
+        peak_rss_bytes=peak_rss,
+        github_requests=stub.request_count,
+        render_cache=render_cache,
+    )
+
+
+def main(
+    requests: int = typer.Option(200, "--requests", "-n", min=1, help="Total /api/generate requests to send"),
+    concurrency: int = typer.Option(8, "--concurrency", "-c", min=1, help="Requests in flight at once"),
+    users: int = typer.Option(50, "--users", "-u", min=1, help="Distinct usernames requested"),
+    distribution: str = typer.Option("zipf", "--distribution", "-d", help="How requests spread over users: uniform or zipf"),
+    strategy: str = typer.Option("random", "--strategy", help="Animation strategy requested"),
+    density: float = typer.Option(0.5, "--density", min=0.0, max=1.0, help="Fraction of days with contributions"),
+    latency: float = typer.Option(0.1, "--latency", min=0.0, help="Seconds the stub waits before each GraphQL response"),
+    seed: int = typer.Option(0, "--seed", help="Seed for the request sequence and the synthetic calendars"),
+    timeout: float = typer.Option(120.0, "--timeout", min=0.0, help="Seconds before a single request is abandoned"),
+    json_out: Path | None = typer.Option(None, "--json", help="Also write the report to this JSON file"),
+) -> None:
+    """Measure /api/generate latency, throughput and memory against a stub GitHub API."""
+    try:
+        key_weights(1, distribution)
+        report = run(requests, concurrency, users, distribution, strategy, density, latency, seed, timeout)
+    except (ValueError, RuntimeError) as e:
+        typer.echo(f"Error: {e}", err=True)
+        raise typer.Exit(1)
+
+    typer.echo(report.summary())
+    if json_out is not None:
+        json_out.write_text(json.dumps(asdict(report), indent=2) + "\n")
+
+
+def _window(data: ContributionData, start: date, end: date) -> ContributionData:
+    """Days of a calendar between start and end, inclusive."""
+    days = [
+        day
+        for week in data["weeks"]
+        for day in week["days"]
+        if start <= date.fromisoformat(day["date"]) <= end
+    ]
+    return {
+        "username": data["username"],
+        "total_contributions": sum(day["count"] for day in days),
+        "weeks": group_weeks(days),
+    }
+
+
+def _rss(pid: int) -> int:
+    try:
+        status = Path(f"/proc/{pid}/status").read_text()
+    except OSError:
+        return 0
+    for line in status.splitlines():
+        if line.startswith("VmRSS:"):
+            return int(line.split()[1]) * 1024
+    return 0
+
+
+if __name__ == "__main__":
+    typer.run(main)
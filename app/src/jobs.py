@@ -0,0 +1,148 @@
+"""Background render jobs with progress reporting and expiring results."""
+
+import asyncio
+import secrets
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Awaitable, Callable, Literal
+
+JobState = Literal["queued", "running", "done", "failed"]
+
+
+class TooManyJobsError(Exception):
+    """Raised when the store already holds its maximum number of unfinished jobs."""
+
+    pass
+
+
+@dataclass
+class Job:
+    """A render job and, once done, its result."""
+
+    id: str
+    frames_total: int
+    created_at: float
+    state: JobState = "queued"
+    frames_done: int = 0
+    error: str | None = None
+    result: bytes | None = None
+    finished_at: float | None = None
+
+    def status(self) -> dict:
+        return {
+            "id": self.id,
+            "state": self.state,
+            "frames_done": self.frames_done,
+            "frames_total": self.frames_total,
+            "progress": round(self.frames_done / self.frames_total, 3) if self.frames_total else 0.0,
+            "error": self.error,
+            "size_bytes": len(self.result) if self.result is not None else None,
+        }
+
+
+class JobStore:
+    """
+    Runs jobs in the background and keeps their results for a while.
+
+    At most `concurrency` jobs run at once; the rest wait in submission
+    order. Finished jobs are forgotten `ttl` seconds after they finish, or
+    earlier, oldest first, once their results exceed max_bytes in total.
+    """
+
+    def __init__(
+        self,
+        concurrency: int,
+        ttl: float,
+        max_bytes: int,
+        max_pending: int,
+        clock: Callable[[], float] = time.time,
+    ):
+        """
+        Initialize the store; submit() must be called from a running event loop.
+
+        Args:
+            concurrency: Jobs allowed to run at the same time
+            ttl: Seconds a finished job and its result are kept
+            max_bytes: Total size of kept results
+            max_pending: Unfinished jobs accepted before submit() refuses more
+            clock: Source of the current Unix time
+        """
+        self.ttl = ttl
+        self.max_bytes = max_bytes
+        self.max_pending = max_pending
+        self._clock = clock
+        self._slots = asyncio.Semaphore(concurrency)
+        self._jobs: OrderedDict[str, Job] = OrderedDict()
+        self._tasks: set[asyncio.Task[None]] = set()
+        self._size = 0
+
+    def submit(self, frames_total: int, work: Callable[[Job], Awaitable[bytes]]) -> Job:
+        """
+        Start a job; work(job) produces its result and may update job.frames_done.
+
+        Raises:
+            TooManyJobsError: If max_pending jobs are already unfinished
+        """
+        self._expire()
+        if self.pending >= self.max_pending:
+            raise TooManyJobsError("Too many render jobs in progress, retry later")
+        job = Job(id=secrets.token_urlsafe(12), frames_total=frames_total, created_at=self._clock())
+        self._jobs[job.id] = job
+        task = asyncio.get_running_loop().create_task(self._run(job, work))
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+        return job
+
+    def get(self, job_id: str) -> Job | None:
+        self._expire()
+        return self._jobs.get(job_id)
+
+    async def stop(self) -> None:
+        for task in self._tasks:
+            task.cancel()
+        await asyncio.gather(*self._tasks, return_exceptions=True)
+
+    @property
+    def pending(self) -> int:
+        """Jobs queued or running."""
+        return len(self._tasks)
+
+    def stats(self) -> dict[str, int]:
+        self._expire()
+        return {
+            "pending": self.pending,
+            "kept": len(self._jobs) - self.pending,
+            "size_bytes": self._size,
+        }
+
+    async def _run(self, job: Job, work: Callable[[Job], Awaitable[bytes]]) -> None:
+        try:
+            async with self._slots:
+                job.state = "running"
+                result = await work(job)
+        except Exception as e:
+            job.state = "failed"
+            job.error = str(e) or type(e).__name__
+        else:
+            job.result = result
+            job.frames_done = job.frames_total
+            job.state = "done"
+            self._size += len(result)
+        job.finished_at = self._clock()
+        # Keep finished jobs in finishing order so expiry and eviction take the oldest first
+        self._jobs.move_to_end(job.id)
+        self._expire()
+
+    def _expire(self) -> None:
+        cutoff = self._clock() - self.ttl
+        finished = [job for job in self._jobs.values() if job.finished_at is not None]
+        for job in finished:
+            if job.finished_at > cutoff and self._size <= self.max_bytes:  # type: ignore[operator]
+                break
+            self._forget(job)
+
+    def _forget(self, job: Job) -> None:
+        del self._jobs[job.id]
+        if job.result is not None:
+            self._size -= len(job.result)
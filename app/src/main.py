@@ -1,46 +1,303 @@
 """FastAPI web app for gh-space-shooter GIF generation."""
 
+import asyncio
 import os
+from contextlib import asynccontextmanager, contextmanager
+from dataclasses import asdict
 from pathlib import Path
 
+import httpx
 from dotenv import load_dotenv
 from fastapi import FastAPI, HTTPException, Query
+from fastapi.concurrency import run_in_threadpool
 from fastapi.requests import Request
-from fastapi.responses import HTMLResponse, Response
+from fastapi.responses import HTMLResponse, JSONResponse, PlainTextResponse, RedirectResponse, Response, StreamingResponse
 # from fastapi.staticfiles import StaticFiles
 from fastapi.templating import Jinja2Templates
 
-from gh_space_shooter.game import Animator, ColumnStrategy, RandomStrategy, RowStrategy, BaseStrategy
-from gh_space_shooter.github_client import GitHubAPIError, GitHubClient
-from gh_space_shooter.output import GifOutputProvider
+from gh_space_shooter import instrumentation
+from gh_space_shooter.contribution_cache import ContributionCache, default_cache_dir
+from gh_space_shooter.contribution_grid import ContributionGrid
+from gh_space_shooter.github_client import AsyncGitHubClient, GitHubAPIError
+
+import metrics
+from jobs import Job, JobStore, TooManyJobsError
+from prewarm import Popularity, Prewarmer
+from render_cache import RenderCache
+from rendering import RENDER_FPS, RENDER_MAX_FRAMES, STRATEGY_MAP, count_frames, render_etag, stream_custom_gif, stream_gif
+from singleflight import ChunkBroadcast, SingleFlight, StreamFlight
+from worker_pool import PoolSaturatedError, RenderPool, RenderTimeoutError
 
 load_dotenv()
 
-app = FastAPI(title="GitHub Space Shooter")
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """Share one pooled HTTP client, one warm render pool and the prewarmer across all requests."""
+    await run_in_threadpool(render_pool.start)
+    try:
+        async with httpx.AsyncClient(
+            timeout=30.0,
+            limits=httpx.Limits(max_connections=100, max_keepalive_connections=20),
+        ) as client:
+            app.state.http_client = client
+            prewarmer.start()
+            try:
+                yield
+            finally:
+                await prewarmer.stop()
+                await job_store.stop()
+    finally:
+        render_pool.shutdown()
+
+
+app = FastAPI(title="GitHub Space Shooter", lifespan=lifespan)
+
+# Profiles change during the day; keep cached data fresher than the CLI does
+contribution_cache = ContributionCache(default_cache_dir(), ttl=60 * 60)
+
+render_cache = RenderCache(max_bytes=int(os.getenv("RENDER_CACHE_MAX_BYTES", 256 * 1024 * 1024)))
+
+# Rendering is CPU bound; run it in worker processes so the event loop stays responsive
+_workers = int(os.getenv("RENDER_WORKERS", os.cpu_count() or 1))
+render_pool = RenderPool(
+    workers=_workers,
+    queue_depth=int(os.getenv("RENDER_QUEUE_DEPTH", 2 * _workers)),
+    timeout=float(os.getenv("RENDER_TIMEOUT", 60)),
+)
+
+# Concurrent requests for the same profile share one GitHub fetch and one render
+fetch_flight: SingleFlight[ContributionGrid] = SingleFlight()
+render_flight = StreamFlight()
+
+# Heavier renders run as background jobs polled by the client, outside any proxy timeout
+JOB_MAX_FRAMES = int(os.getenv("JOB_MAX_FRAMES", 2000))
+JOB_TIMEOUT = float(os.getenv("JOB_TIMEOUT", 15 * 60))
+job_store = JobStore(
+    concurrency=int(os.getenv("JOB_CONCURRENCY", 1)),
+    ttl=float(os.getenv("JOB_RESULT_TTL", 60 * 60)),
+    max_bytes=int(os.getenv("JOB_RESULT_MAX_BYTES", 512 * 1024 * 1024)),
+    max_pending=int(os.getenv("JOB_MAX_PENDING", 20)),
+)
+
+# Popular profiles are re-rendered on idle workers so their views, even right after the
+# daily rollover, are served from cache
+prewarmer = Prewarmer(
+    warm=lambda profile: warm_profile(*profile),
+    has_capacity=lambda: render_pool.pending < render_pool.workers,
+    popularity=Popularity(half_life=24 * 60 * 60),
+    top_n=int(os.getenv("PREWARM_TOP_N", 50)),
+    interval=float(os.getenv("PREWARM_INTERVAL", 30)),
+    refresh=float(os.getenv("PREWARM_REFRESH", 60 * 60)),
+)
+
+# Per-phase timings come from the library's instrumentation hooks, replayed from worker processes
+registry = metrics.MetricsRegistry()
+phase_histograms = {
+    instrumentation.GITHUB_FETCH: registry.register(metrics.Histogram(
+        "ghss_github_fetch_seconds", "GitHub GraphQL request latency, retries included.",
+        [0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10, 30],
+    )),
+    instrumentation.SIMULATE: registry.register(metrics.Histogram(
+        "ghss_simulate_seconds", "Game simulation time per render.",
+        [0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5],
+    )),
+    instrumentation.FRAME_RENDER: registry.register(metrics.Histogram(
+        "ghss_frame_render_seconds", "Time to draw one frame.",
+        [0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1],
+    )),
+    instrumentation.ENCODE: registry.register(metrics.Histogram(
+        "ghss_encode_seconds", "GIF encoding time per render.",
+        [0.1, 0.25, 0.5, 1, 2.5, 5, 10, 30],
+    )),
+    instrumentation.OUTPUT_BYTES: registry.register(metrics.Histogram(
+        "ghss_output_bytes", "Size of each rendered GIF.",
+        [64 * 1024, 256 * 1024, 512 * 1024, 1024**2, 2 * 1024**2, 4 * 1024**2, 8 * 1024**2],
+    )),
+    instrumentation.FRAMES: registry.register(metrics.Histogram(
+        "ghss_frames_per_render", "Frames in each rendered GIF.",
+        [25, 50, 100, 150, 200, 250, 500],
+    )),
+}
+errors_total = registry.register(metrics.Counter("ghss_errors_total", "Failed requests by error type.", label="type"))
+not_modified_total = registry.register(metrics.Counter("ghss_not_modified_total", "Requests answered with 304."))
+registry.register(metrics.Sampled(
+    "ghss_render_cache_requests_total", "Render cache lookups by result.", "counter",
+    lambda: {"hit": render_cache.stats().hits, "miss": render_cache.stats().misses}, label="result",
+))
+registry.register(metrics.Sampled(
+    "ghss_render_cache_bytes", "Total size of cached renders.", "gauge", lambda: render_cache.stats().size_bytes,
+))
+registry.register(metrics.Sampled(
+    "ghss_render_queue_depth", "Render jobs waiting for a worker.", "gauge", lambda: render_pool.queued,
+))
+registry.register(metrics.Sampled(
+    "ghss_render_jobs_in_flight", "Render jobs running in workers.", "gauge", lambda: render_pool.busy,
+))
+registry.register(metrics.Sampled(
+    "ghss_render_streams_in_flight", "Renders currently streaming to clients.", "gauge", lambda: render_flight.in_flight,
+))
+
+
+def record_observation(name: str, value: float) -> None:
+    histogram = phase_histograms.get(name)
+    if histogram is not None:
+        histogram.observe(value)
+
+
+instrumentation.add_hook(record_observation)
+
+# Generated URLs must be revalidated; hash-named URLs never change
+REVALIDATE = "no-cache"
+IMMUTABLE = "public, max-age=31536000, immutable"
 
 templates = Jinja2Templates(directory=Path(__file__).parent / "templates")
 # app.mount("/public", StaticFiles(directory=Path(__file__).parent / "public"), name="public")
 
 
-STRATEGY_MAP: dict[str, type[BaseStrategy]] = {
-    "column": ColumnStrategy,
-    "row": RowStrategy,
-    "random": RandomStrategy,
-}
+async def fetch_grid(http_client: httpx.AsyncClient, token: str, username: str) -> ContributionGrid:
+    """Fetch contribution data, joining an identical in-flight fetch if there is one."""
+
+    async def fetch() -> ContributionGrid:
+        client = AsyncGitHubClient(token, client=http_client, cache=contribution_cache)
+        return ContributionGrid.from_contribution_data(await client.get_contribution_graph(username))
+
+    return await fetch_flight.do(username.lower(), fetch)
+
+
+async def render_streamed(key: str, grid: ContributionGrid, strategy: str, seed: int) -> ChunkBroadcast:
+    """
+    Start (or join) the render for a cache miss and wait for its first bytes.
 
+    The GIF is streamed out of the worker frame by frame and cached once complete.
 
-def generate_gif(username: str, strategy: str, token: str) -> bytes:
-    """Generate a space shooter animation for a GitHub user."""
-    with GitHubClient(token) as client:
-        data = client.get_contribution_graph(username)
+    Raises:
+        PoolSaturatedError: If the render pool is full
+        RenderTimeoutError: If the render times out before producing anything
+    """
 
-    strategy_class: type[BaseStrategy] = STRATEGY_MAP.get(strategy, RandomStrategy)
-    strat = strategy_class()
+    async def produce():
+        chunks = []
+        try:
+            async for chunk in render_pool.stream(stream_gif, grid, strategy, seed):
+                chunks.append(chunk)
+                yield chunk
+        except Exception as e:
+            # Failures before the first chunk reach every caller as HTTP errors and are counted there
+            if chunks:
+                errors_total.inc(type(e).__name__)
+            raise
+        render_cache.put(key, b"".join(chunks))
+
+    broadcast = render_flight.join(key, produce)
+    await broadcast.first_chunk()
+    return broadcast
+
+
+async def warm_profile(username: str, strategy: str, seed: int) -> None:
+    """Render a profile into the cache unless its current render is already there."""
+    grid = await fetch_grid(app.state.http_client, require_token(), username)
+    key = render_etag(grid, strategy, seed)
+    if key not in render_cache:
+        await (await render_streamed(key, grid, strategy, seed)).finished()
+
+
+async def render_job(job: Job, grid: ContributionGrid, strategy: str, seed: int, fps: int, max_frames: int) -> bytes:
+    """Render a job's GIF, waiting for pool capacity instead of failing when it is full."""
+    while True:
+        chunks: list[bytes] = []
+        try:
+            async for chunk in render_pool.stream(
+                stream_custom_gif, grid, strategy, seed, fps, max_frames, timeout=JOB_TIMEOUT
+            ):
+                chunks.append(chunk)
+                # One chunk per frame, then the trailer
+                job.frames_done = min(len(chunks), job.frames_total)
+        except PoolSaturatedError as e:
+            await asyncio.sleep(e.retry_after)
+            continue
+        return b"".join(chunks)
+
+
+async def render_response(
+    request: Request, grid: ContributionGrid, strategy: str, seed: int, cache_control: str
+) -> Response:
+    """
+    Answer with the rendered GIF, or 304 when the client already holds it.
+
+    The ETag names the exact output, so a matching If-None-Match skips rendering entirely.
+    """
+    key = render_etag(grid, strategy, seed)
+    headers = {
+        "ETag": f'"{key}"',
+        "Cache-Control": cache_control,
+    }
+    if etag_matches(request.headers.get("if-none-match"), key):
+        not_modified_total.inc()
+        return Response(status_code=304, headers=headers)
+
+    headers["Response-Type"] = "blob"
+    headers["Content-Disposition"] = f"inline; filename={grid.username}-space-shooter.gif"
+    encoded = render_cache.get(key)
+    if encoded is not None:
+        return Response(content=encoded, media_type="image/gif", headers={**headers, "X-Render-Cache": "HIT"})
+
+    # Send frames as they are encoded rather than after the whole GIF is in memory
+    broadcast = await render_streamed(key, grid, strategy, seed)
+    return StreamingResponse(
+        broadcast.subscribe(),
+        media_type="image/gif",
+        headers={**headers, "X-Render-Cache": "MISS"},
+    )
+
+
+def etag_matches(if_none_match: str | None, key: str) -> bool:
+    """Whether an If-None-Match header lists the ETag (weak comparison, as RFC 9110 requires)."""
+    if not if_none_match:
+        return False
+    tags = [tag.strip().removeprefix("W/") for tag in if_none_match.split(",")]
+    return "*" in tags or f'"{key}"' in tags
+
+
+@contextmanager
+def http_errors():
+    """Translate fetch and render failures into HTTP errors, counting them by type."""
+    try:
+        yield
+    except HTTPException:
+        raise
+    except Exception as e:
+        errors_total.inc(type(e).__name__)
+        raise to_http_error(e)
+
+
+def to_http_error(e: Exception) -> HTTPException:
+    """The HTTP error reported for a fetch or render failure."""
+    if isinstance(e, PoolSaturatedError):
+        return HTTPException(status_code=503, detail=str(e), headers={"Retry-After": str(e.retry_after)})
+    if isinstance(e, RenderTimeoutError):
+        return HTTPException(status_code=504, detail=str(e))
+    if isinstance(e, (ValueError, GitHubAPIError)):
+        return HTTPException(status_code=400, detail=str(e))
+    return HTTPException(status_code=500, detail=f"Failed to generate animation: {e}")
+
+
+def require_token() -> str:
+    """Return the configured GitHub token or fail with 500."""
+    token = os.getenv("GH_TOKEN")
+    if not token:
+        raise HTTPException(status_code=500, detail="GitHub token not configured")
+    return token
+
+
+def require_strategy(strategy: str) -> None:
+    """Reject unknown strategy names with 400."""
+    if strategy not in STRATEGY_MAP:
+        raise HTTPException(
+            status_code=400,
+            detail=f"Invalid strategy. Choose from: {', '.join(STRATEGY_MAP.keys())}",
+        )
 
-    animator = Animator(data, strat, fps=25, watermark=True)
-    provider = GifOutputProvider("dummy.gif")
-    encoded = provider.encode(animator.generate_frames(max_frames=250), frame_duration=1000 // 25)
-    return encoded
 
 @app.get("/", response_class=HTMLResponse)
 async def index(request: Request):
@@ -50,33 +307,138 @@ async def index(request: Request):
 
 @app.get("/api/generate")
 async def generate(
+    request: Request,
     username: str = Query(..., min_length=1, description="GitHub username"),
     strategy: str = Query("random", description="Animation strategy"),
+    seed: int = Query(0, description="Seed for stars, explosions and the random strategy"),
+    immutable: bool = Query(False, description="Redirect to a permanent, content-addressed URL"),
 ):
     """Generate and return a space shooter animation."""
-    token = os.getenv("GH_TOKEN")
-    if not token:
-        raise HTTPException(status_code=500, detail="GitHub token not configured")
+    token = require_token()
+    require_strategy(strategy)
 
-    if strategy not in STRATEGY_MAP:
-        raise HTTPException(
-            status_code=400,
-            detail=f"Invalid strategy. Choose from: {', '.join(STRATEGY_MAP.keys())}",
-        )
+    with http_errors():
+        grid = await fetch_grid(request.app.state.http_client, token, username)
+        prewarmer.record((username.lower(), strategy, seed))
+        if immutable:
+            url = request.url_for(
+                "immutable_gif", username=username, strategy=strategy, seed=str(seed),
+                digest=render_etag(grid, strategy, seed),
+            )
+            return RedirectResponse(str(url), status_code=302, headers={"Cache-Control": REVALIDATE})
+        return await render_response(request, grid, strategy, seed, REVALIDATE)
 
-    try:
-        encoded = generate_gif(username, strategy, token)
-        return Response(
-            content=encoded,
-            media_type="image/gif",
-            headers={
-                "Response-Type": "blob",
-                "Content-Disposition": f"inline; filename={username}-space-shooter.gif"
-            },
-        )
-    except ValueError as e:
-        raise HTTPException(status_code=400, detail=str(e))
-    except GitHubAPIError as e:
-        raise HTTPException(status_code=400, detail=str(e))
-    except Exception as e:
-        raise HTTPException(status_code=500, detail=f"Failed to generate animation: {e}")
+
+@app.get("/api/gif/{username}/{strategy}/{seed}/{digest}.gif", name="immutable_gif")
+async def immutable_gif(request: Request, username: str, strategy: str, seed: int, digest: str):
+    """
+    Serve an animation by content address; the response never changes, so it is cacheable forever.
+
+    Returns 404 once the profile's contributions have changed and the digest no longer matches.
+    """
+    token = require_token()
+    require_strategy(strategy)
+
+    with http_errors():
+        grid = await fetch_grid(request.app.state.http_client, token, username)
+        if render_etag(grid, strategy, seed) != digest:
+            raise HTTPException(status_code=404, detail="Animation is out of date; request /api/generate again")
+        prewarmer.record((username.lower(), strategy, seed))
+        return await render_response(request, grid, strategy, seed, IMMUTABLE)
+
+
+@app.post("/api/warm", status_code=202)
+async def warm(
+    username: str = Query(..., min_length=1, description="GitHub username"),
+    strategy: str = Query("random", description="Animation strategy"),
+    seed: int = Query(0, description="Seed for stars, explosions and the random strategy"),
+):
+    """Hint that a profile is about to be requested; it is rendered in the background if a worker is idle."""
+    require_strategy(strategy)
+    return {"accepted": prewarmer.hint((username.lower(), strategy, seed))}
+
+
+@app.post("/api/jobs", status_code=202)
+async def create_job(
+    request: Request,
+    username: str = Query(..., min_length=1, description="GitHub username"),
+    strategy: str = Query("random", description="Animation strategy"),
+    seed: int = Query(0, description="Seed for stars, explosions and the random strategy"),
+    fps: int = Query(RENDER_FPS, ge=1, le=50, description="Frames per second"),
+    max_frames: int = Query(RENDER_MAX_FRAMES, ge=1, le=JOB_MAX_FRAMES, description="Maximum number of frames"),
+):
+    """Start rendering in the background; poll the returned status URL, then fetch the result."""
+    token = require_token()
+    require_strategy(strategy)
+
+    with http_errors():
+        grid = await fetch_grid(request.app.state.http_client, token, username)
+        # Simulating without drawing is cheap and gives an exact total for progress
+        frames_total = await run_in_threadpool(count_frames, grid, strategy, seed, fps, max_frames)
+        try:
+            job = job_store.submit(
+                frames_total, lambda job: render_job(job, grid, strategy, seed, fps, max_frames)
+            )
+        except TooManyJobsError as e:
+            raise HTTPException(status_code=503, detail=str(e), headers={"Retry-After": "30"})
+
+    status_url = str(request.url_for("job_status", job_id=job.id))
+    return JSONResponse(
+        {**job.status(), "status_url": status_url, "result_url": str(request.url_for("job_result", job_id=job.id))},
+        status_code=202,
+        headers={"Location": status_url},
+    )
+
+
+@app.get("/api/jobs/{job_id}", name="job_status")
+async def job_status(job_id: str):
+    """Report a job's state and progress (frames done out of the total)."""
+    return get_job(job_id).status()
+
+
+@app.get("/api/jobs/{job_id}/result", name="job_result")
+async def job_result(job_id: str):
+    """Serve a finished job's GIF."""
+    job = get_job(job_id)
+    if job.state != "done" or job.result is None:
+        detail = f"Job failed: {job.error}" if job.state == "failed" else f"Job is {job.state}"
+        raise HTTPException(status_code=409, detail=detail)
+    return Response(
+        content=job.result,
+        media_type="image/gif",
+        headers={"Content-Disposition": f"inline; filename={job.id}-space-shooter.gif"},
+    )
+
+
+def get_job(job_id: str) -> Job:
+    """Return a job or fail with 404 once it is unknown or expired."""
+    job = job_store.get(job_id)
+    if job is None:
+        raise HTTPException(status_code=404, detail="Job not found or expired")
+    return job
+
+
+@app.get("/api/cache/stats")
+async def cache_stats():
+    """Report render cache hit, miss and eviction counters."""
+    return asdict(render_cache.stats())
+
+
+@app.get("/api/pool/stats")
+async def pool_stats():
+    """Report render pool occupancy and request coalescing."""
+    return {
+        **render_pool.stats(),
+        "renders_started": render_flight.started,
+        "renders_coalesced": render_flight.coalesced,
+        "fetches_started": fetch_flight.started,
+        "fetches_coalesced": fetch_flight.coalesced,
+        "prewarm": prewarmer.stats(),
+        "jobs": job_store.stats(),
+    }
+
+
+@app.get("/metrics", response_class=PlainTextResponse)
+async def metrics_endpoint():
+    """Expose fetch, render and cache metrics for Prometheus."""
+    return PlainTextResponse(registry.render(), media_type=metrics.CONTENT_TYPE)
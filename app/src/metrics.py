@@ -0,0 +1,132 @@
+"""Minimal Prometheus metrics in the text exposition format."""
+
+import math
+import threading
+from bisect import bisect_left
+from typing import Callable, Iterable, TypeVar
+
+CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+
+class Histogram:
+    """Cumulative histogram with fixed upper bounds."""
+
+    def __init__(self, name: str, help: str, buckets: Iterable[float]):
+        self.name = name
+        self.help = help
+        self.buckets = sorted(buckets)
+        self._lock = threading.Lock()
+        self._counts = [0] * (len(self.buckets) + 1)
+        self._sum = 0.0
+
+    def observe(self, value: float) -> None:
+        with self._lock:
+            self._counts[bisect_left(self.buckets, value)] += 1
+            self._sum += value
+
+    def render(self) -> list[str]:
+        with self._lock:
+            counts = list(self._counts)
+            total = self._sum
+        lines = [f"# HELP {self.name} {self.help}", f"# TYPE {self.name} histogram"]
+        cumulative = 0
+        for bound, count in zip([*self.buckets, math.inf], counts):
+            cumulative += count
+            lines.append(f'{self.name}_bucket{{le="{_format(bound)}"}} {cumulative}')
+        lines.append(f"{self.name}_sum {_format(total)}")
+        lines.append(f"{self.name}_count {cumulative}")
+        return lines
+
+
+class Counter:
+    """Monotonic counter, optionally split by the values of one label."""
+
+    def __init__(self, name: str, help: str, label: str | None = None):
+        self.name = name
+        self.help = help
+        self.label = label
+        self._lock = threading.Lock()
+        self._values: dict[str | None, float] = {} if label else {None: 0.0}
+
+    def inc(self, label_value: str | None = None, amount: float = 1) -> None:
+        with self._lock:
+            self._values[label_value] = self._values.get(label_value, 0.0) + amount
+
+    def render(self) -> list[str]:
+        with self._lock:
+            values = dict(self._values)
+        return _render_samples(self.name, self.help, "counter", self.label, values)
+
+
+class Sampled:
+    """Metric read from its source at scrape time, e.g. a pool's queue depth."""
+
+    def __init__(
+        self,
+        name: str,
+        help: str,
+        metric_type: str,
+        read: Callable[[], float | dict[str, float]],
+        label: str | None = None,
+    ):
+        """
+        Initialize the metric.
+
+        Args:
+            name: Metric name
+            help: Description shown by Prometheus
+            metric_type: "gauge" or "counter"
+            read: Returns the current value, or values by label value when label is set
+            label: Name of the label read() splits its values by
+        """
+        self.name = name
+        self.help = help
+        self.metric_type = metric_type
+        self.read = read
+        self.label = label
+
+    def render(self) -> list[str]:
+        value = self.read()
+        values = value if isinstance(value, dict) else {None: value}
+        return _render_samples(self.name, self.help, self.metric_type, self.label, values)
+
+
+Metric = TypeVar("Metric", Histogram, Counter, Sampled)
+
+
+class MetricsRegistry:
+    """Ordered collection of metrics rendered together for a scrape."""
+
+    def __init__(self) -> None:
+        self._metrics: list[Histogram | Counter | Sampled] = []
+
+    def register(self, metric: Metric) -> Metric:
+        self._metrics.append(metric)
+        return metric
+
+    def render(self) -> str:
+        lines: list[str] = []
+        for metric in self._metrics:
+            lines.extend(metric.render())
+        return "\n".join(lines) + "\n"
+
+
+def _render_samples(
+    name: str, help: str, metric_type: str, label: str | None, values: dict[str | None, float]
+) -> list[str]:
+    lines = [f"# HELP {name} {help}", f"# TYPE {name} {metric_type}"]
+    for label_value, value in sorted(values.items(), key=lambda item: item[0] or ""):
+        if label is None or label_value is None:
+            lines.append(f"{name} {_format(value)}")
+        else:
+            escaped = label_value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+            lines.append(f'{name}{{{label}="{escaped}"}} {_format(value)}')
+    return lines
+
+
+def _format(value: float) -> str:
+    if value == math.inf:
+        return "+Inf"
+    if float(value).is_integer():
+        return str(int(value))
+    return repr(float(value))
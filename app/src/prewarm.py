@@ -0,0 +1,188 @@
+"""Background re-rendering of popular profiles so their views hit the render cache."""
+
+import asyncio
+import time
+from datetime import datetime, timezone
+from typing import Awaitable, Callable, Hashable
+
+# (username, strategy, seed)
+Profile = tuple[str, str, int]
+
+
+class Popularity:
+    """
+    Request counts per profile that decay exponentially over time.
+
+    A profile requested often but long ago ranks below one requested a few
+    times today. Only the most popular max_tracked profiles are remembered.
+    """
+
+    def __init__(self, half_life: float, max_tracked: int = 10_000, clock: Callable[[], float] = time.time):
+        """
+        Initialize the tracker.
+
+        Args:
+            half_life: Seconds after which a request counts half as much
+            max_tracked: Profiles kept before the least popular are forgotten
+            clock: Source of the current Unix time
+        """
+        self.half_life = half_life
+        self.max_tracked = max_tracked
+        self._clock = clock
+        self._scores: dict[Hashable, tuple[float, float]] = {}
+
+    def record(self, profile: Hashable) -> None:
+        """Count one request for a profile."""
+        now = self._clock()
+        self._scores[profile] = (self._score(profile, now) + 1, now)
+        if len(self._scores) > self.max_tracked:
+            keep = self.top(self.max_tracked // 2)
+            self._scores = {profile: self._scores[profile] for profile in keep}
+
+    def top(self, n: int) -> list:
+        """The n most popular profiles, most popular first."""
+        now = self._clock()
+        return sorted(self._scores, key=lambda profile: self._score(profile, now), reverse=True)[:n]
+
+    def _score(self, profile: Hashable, now: float) -> float:
+        score, updated_at = self._scores.get(profile, (0.0, now))
+        return score * 0.5 ** ((now - updated_at) / self.half_life)
+
+    def __len__(self) -> int:
+        return len(self._scores)
+
+
+class Prewarmer:
+    """
+    Keeps the renders of the most requested profiles fresh in the cache.
+
+    Every interval, the top profiles whose last warm-up predates the latest
+    UTC midnight rollover or is older than refresh seconds are re-rendered,
+    one at a time and only while a render worker is idle, so real requests
+    never wait behind pre-warming.
+    """
+
+    def __init__(
+        self,
+        warm: Callable[[Profile], Awaitable[None]],
+        has_capacity: Callable[[], bool],
+        popularity: Popularity,
+        top_n: int,
+        interval: float,
+        refresh: float,
+        clock: Callable[[], float] = time.time,
+    ):
+        """
+        Initialize the prewarmer; call start() from a running event loop.
+
+        Args:
+            warm: Renders a profile into the cache (no-op if already cached)
+            has_capacity: Whether a render worker is free for background work
+            popularity: Tracker of requests per profile
+            top_n: Number of most popular profiles to keep warm
+            interval: Seconds between checks for profiles that need warming
+            refresh: Seconds after which a warmed profile is re-checked, to pick up new contributions
+            clock: Source of the current Unix time
+        """
+        self.warm_profile = warm
+        self.has_capacity = has_capacity
+        self.popularity = popularity
+        self.top_n = top_n
+        self.interval = interval
+        self.refresh = refresh
+        self._clock = clock
+        self._warmed_at: dict[Profile, float] = {}
+        self._hints: set[asyncio.Task[None]] = set()
+        self._task: asyncio.Task[None] | None = None
+        self.warmed = 0
+        self.failed = 0
+        self.hinted = 0
+
+    def start(self) -> None:
+        if self.top_n > 0:
+            self._task = asyncio.get_running_loop().create_task(self._run())
+
+    async def stop(self) -> None:
+        tasks = [task for task in (self._task, *self._hints) if task is not None]
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+        self._task = None
+
+    def record(self, profile: Profile) -> None:
+        """Count a served request towards the profile's popularity."""
+        self.popularity.record(profile)
+
+    def hint(self, profile: Profile) -> bool:
+        """
+        Warm a profile the user is likely to request next, if a worker is idle.
+
+        Only one hint is warmed at a time, so a burst of keystrokes costs at most
+        one render.
+
+        Returns:
+            Whether the warm-up was started
+        """
+        if not self.has_capacity() or len(self._hints) >= 1:
+            return False
+        task = asyncio.get_running_loop().create_task(self._warm(profile))
+        self._hints.add(task)
+        task.add_done_callback(self._hints.discard)
+        self.hinted += 1
+        return True
+
+    async def warm_due(self) -> int:
+        """
+        Warm the popular profiles that are due, while capacity lasts.
+
+        Returns:
+            The number of profiles warmed
+        """
+        warmed = 0
+        top = self.popularity.top(self.top_n)
+        # Forget profiles that dropped out of the top (and one-off hints)
+        self._warmed_at = {profile: self._warmed_at[profile] for profile in top if profile in self._warmed_at}
+        for profile in top:
+            if not self._is_due(profile):
+                continue
+            if not self.has_capacity():
+                break
+            if await self._warm(profile):
+                warmed += 1
+        return warmed
+
+    def stats(self) -> dict[str, int]:
+        return {
+            "tracked_profiles": len(self.popularity),
+            "warmed": self.warmed,
+            "failed": self.failed,
+            "hinted": self.hinted,
+        }
+
+    async def _run(self) -> None:
+        while True:
+            await asyncio.sleep(self.interval)
+            await self.warm_due()
+
+    async def _warm(self, profile: Profile) -> bool:
+        # Failures are not retried before the next refresh either
+        self._warmed_at[profile] = self._clock()
+        try:
+            await self.warm_profile(profile)
+        except Exception:
+            self.failed += 1
+            return False
+        self.warmed += 1
+        return True
+
+    def _is_due(self, profile: Profile) -> bool:
+        warmed_at = self._warmed_at.get(profile)
+        if warmed_at is None:
+            return True
+        now = self._clock()
+        return warmed_at < max(now - self.refresh, _last_rollover(now))
+
+
+def _last_rollover(now: float) -> float:
+    today = datetime.fromtimestamp(now, timezone.utc).date()
+    return datetime.combine(today, datetime.min.time(), timezone.utc).timestamp()
@@ -0,0 +1,114 @@
+"""In-process LRU cache for rendered animations."""
+
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from datetime import datetime, timedelta, timezone
+from typing import Callable, Hashable
+
+
+@dataclass
+class RenderCacheStats:
+    """Counters and current size of a RenderCache."""
+
+    hits: int
+    misses: int
+    evictions: int
+    expirations: int
+    entries: int
+    size_bytes: int
+    max_bytes: int
+
+
+class RenderCache:
+    """
+    Bounded LRU cache of encoded animations, sized by total bytes.
+
+    Entries expire at the next UTC midnight, when GitHub rolls the contribution
+    calendar over to a new day, or earlier if a TTL is given.
+    """
+
+    def __init__(
+        self,
+        max_bytes: int,
+        ttl: float | None = None,
+        clock: Callable[[], float] = time.time,
+    ):
+        """
+        Initialize the cache.
+
+        Args:
+            max_bytes: Total size of cached values before least recently used ones are evicted
+            ttl: Optional maximum age of an entry in seconds
+            clock: Source of the current Unix time
+        """
+        self.max_bytes = max_bytes
+        self.ttl = ttl
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._entries: OrderedDict[Hashable, tuple[bytes, float]] = OrderedDict()
+        self._size = 0
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+        self._expirations = 0
+
+    def get(self, key: Hashable) -> bytes | None:
+        """Return the cached value and mark it recently used, or None."""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and entry[1] <= self._clock():
+                self._remove(key)
+                self._expirations += 1
+                entry = None
+            if entry is None:
+                self._misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self._hits += 1
+            return entry[0]
+
+    def __contains__(self, key: Hashable) -> bool:
+        """Whether a live entry exists; unlike get(), this neither counts nor refreshes it."""
+        with self._lock:
+            entry = self._entries.get(key)
+            return entry is not None and entry[1] > self._clock()
+
+    def put(self, key: Hashable, value: bytes) -> None:
+        """Store a value, evicting least recently used entries to stay within max_bytes."""
+        if len(value) > self.max_bytes:
+            return
+        with self._lock:
+            if key in self._entries:
+                self._remove(key)
+            self._entries[key] = (value, self._expires_at())
+            self._size += len(value)
+            while self._size > self.max_bytes:
+                oldest = next(iter(self._entries))
+                self._remove(oldest)
+                self._evictions += 1
+
+    def stats(self) -> RenderCacheStats:
+        with self._lock:
+            return RenderCacheStats(
+                hits=self._hits,
+                misses=self._misses,
+                evictions=self._evictions,
+                expirations=self._expirations,
+                entries=len(self._entries),
+                size_bytes=self._size,
+                max_bytes=self.max_bytes,
+            )
+
+    def _remove(self, key: Hashable) -> None:
+        value, _ = self._entries.pop(key)
+        self._size -= len(value)
+
+    def _expires_at(self) -> float:
+        now = self._clock()
+        today = datetime.fromtimestamp(now, timezone.utc).date()
+        rollover = datetime.combine(today + timedelta(days=1), datetime.min.time(), timezone.utc).timestamp()
+        if self.ttl is not None:
+            return min(rollover, now + self.ttl)
+        return rollover
@@ -0,0 +1,120 @@
+"""Rendering entry points run inside worker processes."""
+
+import hashlib
+import os
+import time
+from typing import Iterator
+
+from PIL import Image
+
+from gh_space_shooter.contribution_grid import ContributionGrid
+from gh_space_shooter.game import Animator, BaseStrategy, ColumnStrategy, RandomStrategy, RowStrategy
+from gh_space_shooter.manifest import package_version
+from gh_space_shooter.output import GifOutputProvider
+
+RENDER_FPS = 25
+RENDER_MAX_FRAMES = 250
+# Part of every render cache key and ETag, so changed output never serves stale renders. The installed
+# version, since gh_space_shooter.__version__ is not kept in step with releases
+RENDERER_VERSION = f"{package_version()}-{RENDER_FPS}fps-{RENDER_MAX_FRAMES}frames"
+
+STRATEGY_MAP: dict[str, type[BaseStrategy]] = {
+    "column": ColumnStrategy,
+    "row": RowStrategy,
+    "random": RandomStrategy,
+}
+
+
+def render_etag(grid: ContributionGrid, strategy: str, seed: int) -> str:
+    """Digest naming a render's exact output: equal digests mean byte-identical GIFs."""
+    recipe = f"{grid.content_hash}:{strategy}:{seed}:{RENDERER_VERSION}"
+    return hashlib.blake2b(recipe.encode(), digest_size=16).hexdigest()
+
+
+class RenderDeadlineExceeded(Exception):
+    """Raised inside a worker when a render runs past its deadline."""
+
+    pass
+
+
+def render_gif(grid: ContributionGrid, strategy: str, seed: int, deadline: float | None = None) -> bytes:
+    """
+    Render a space shooter animation from contribution data.
+
+    Args:
+        grid: Contribution data to render
+        strategy: Name of the strategy (column, row, random)
+        seed: Seed for the game's randomness
+        deadline: Unix time after which rendering is abandoned
+
+    Raises:
+        RenderDeadlineExceeded: If the deadline passes before encoding finishes
+    """
+    return b"".join(stream_gif(grid, strategy, seed, deadline))
+
+
+def stream_gif(grid: ContributionGrid, strategy: str, seed: int, deadline: float | None = None) -> Iterator[bytes]:
+    """
+    Render a space shooter animation, yielding GIF bytes as each frame is encoded.
+
+    Args:
+        grid: Contribution data to render
+        strategy: Name of the strategy (column, row, random)
+        seed: Seed for the game's randomness
+        deadline: Unix time after which rendering is abandoned
+
+    Raises:
+        RenderDeadlineExceeded: If the deadline passes before encoding finishes
+    """
+    return stream_custom_gif(grid, strategy, seed, RENDER_FPS, RENDER_MAX_FRAMES, deadline)
+
+
+def stream_custom_gif(
+    grid: ContributionGrid,
+    strategy: str,
+    seed: int,
+    fps: int,
+    max_frames: int,
+    deadline: float | None = None,
+) -> Iterator[bytes]:
+    """
+    Like stream_gif, with a custom frame rate and length.
+
+    One chunk is yielded per frame (the first also carries the GIF header),
+    followed by the one-byte trailer.
+    """
+    animator = _animator(grid, strategy, seed, fps)
+    provider = GifOutputProvider("dummy.gif")
+    frames = animator.generate_frames(max_frames=max_frames)
+    if deadline is not None:
+        frames = _until(frames, deadline)
+    return provider.iter_encode(frames, frame_duration=1000 // fps)
+
+
+def count_frames(grid: ContributionGrid, strategy: str, seed: int, fps: int, max_frames: int) -> int:
+    """Number of frames stream_custom_gif produces for the same arguments."""
+    return _animator(grid, strategy, seed, fps).count_frames(max_frames)
+
+
+def warm_worker() -> None:
+    """Process pool initializer: pay import and first-render costs before serving."""
+    grid = ContributionGrid.from_contribution_data({"username": "warmup", "total_contributions": 0, "weeks": []})
+    render_gif(grid, "column", 0)
+
+
+def worker_pid() -> int:
+    """Trivial task used to start every worker up front."""
+    return os.getpid()
+
+
+def _animator(grid: ContributionGrid, strategy: str, seed: int, fps: int) -> Animator:
+    strategy_class: type[BaseStrategy] = STRATEGY_MAP.get(strategy, RandomStrategy)
+    return Animator(grid, strategy_class(), fps=fps, watermark=True, seed=seed)
+
+
+def _until(frames: Iterator[Image.Image], deadline: float) -> Iterator[Image.Image]:
+    # Checked between frames so a stuck job frees its worker
+    for frame in frames:
+        if time.time() > deadline:
+            raise RenderDeadlineExceeded("Render deadline exceeded")
+        yield frame
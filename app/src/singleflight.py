@@ -0,0 +1,138 @@
+"""Coalescing of concurrent identical async computations."""
+
+import asyncio
+from typing import AsyncIterator, Awaitable, Callable, Generic, Hashable, TypeVar
+
+T = TypeVar("T")
+
+
+class SingleFlight(Generic[T]):
+    """
+    Runs at most one computation per key at a time.
+
+    Callers arriving while a computation for their key is in flight await that
+    computation and share its result (or exception) instead of starting their own.
+    The computation runs as its own task, so a caller disconnecting does not
+    cancel it for the others.
+    """
+
+    def __init__(self) -> None:
+        self._in_flight: dict[Hashable, asyncio.Task[T]] = {}
+        self.started = 0
+        self.coalesced = 0
+
+    async def do(self, key: Hashable, fn: Callable[[], Awaitable[T]]) -> T:
+        """Return fn()'s result, joining an in-flight call for the same key if there is one."""
+        task = self._in_flight.get(key)
+        if task is None:
+            task = asyncio.ensure_future(fn())
+            self._in_flight[key] = task
+            task.add_done_callback(lambda _: self._in_flight.pop(key, None))
+            self.started += 1
+        else:
+            self.coalesced += 1
+        return await asyncio.shield(task)
+
+    @property
+    def in_flight(self) -> int:
+        return len(self._in_flight)
+
+
+class ChunkBroadcast:
+    """
+    Fans one stream of byte chunks out to any number of subscribers.
+
+    Chunks are kept until the stream ends, so subscribers joining late replay
+    it from the start while sharing the same chunk objects.
+    """
+
+    def __init__(self) -> None:
+        self._chunks: list[bytes] = []
+        self._done = False
+        self._error: BaseException | None = None
+        self._changed = asyncio.Condition()
+
+    async def feed(self, chunks: AsyncIterator[bytes]) -> None:
+        """Publish every chunk of a stream, then mark the broadcast complete."""
+        try:
+            async for chunk in chunks:
+                async with self._changed:
+                    self._chunks.append(chunk)
+                    self._changed.notify_all()
+        except Exception as e:
+            self._error = e
+        finally:
+            async with self._changed:
+                self._done = True
+                self._changed.notify_all()
+
+    async def first_chunk(self) -> None:
+        """
+        Wait until the stream has produced data or ended.
+
+        Raises:
+            Exception: The stream's error, if it failed before producing anything
+        """
+        async with self._changed:
+            await self._changed.wait_for(lambda: bool(self._chunks) or self._done)
+        if not self._chunks and self._error is not None:
+            raise self._error
+
+    async def finished(self) -> None:
+        """
+        Wait until the stream has ended.
+
+        Raises:
+            Exception: The stream's error, if it failed
+        """
+        async with self._changed:
+            await self._changed.wait_for(lambda: self._done)
+        if self._error is not None:
+            raise self._error
+
+    async def subscribe(self) -> AsyncIterator[bytes]:
+        """Yield the stream from its first chunk, waiting for chunks not yet published."""
+        index = 0
+        while True:
+            async with self._changed:
+                await self._changed.wait_for(lambda: index < len(self._chunks) or self._done)
+                available = self._chunks[index:]
+            if available:
+                index += len(available)
+                yield b"".join(available)
+            elif self._error is not None:
+                raise self._error
+            else:
+                return
+
+
+class StreamFlight:
+    """
+    Runs at most one stream per key at a time.
+
+    Callers arriving while a stream for their key is being produced subscribe to
+    it instead of starting their own. The stream is fed by its own task, so a
+    subscriber disconnecting does not stop it for the others.
+    """
+
+    def __init__(self) -> None:
+        self._in_flight: dict[Hashable, ChunkBroadcast] = {}
+        self.started = 0
+        self.coalesced = 0
+
+    def join(self, key: Hashable, produce: Callable[[], AsyncIterator[bytes]]) -> ChunkBroadcast:
+        """Return the broadcast of produce()'s stream, joining an in-flight stream for the same key."""
+        broadcast = self._in_flight.get(key)
+        if broadcast is None:
+            broadcast = ChunkBroadcast()
+            self._in_flight[key] = broadcast
+            task = asyncio.ensure_future(broadcast.feed(produce()))
+            task.add_done_callback(lambda _: self._in_flight.pop(key, None))
+            self.started += 1
+        else:
+            self.coalesced += 1
+        return broadcast
+
+    @property
+    def in_flight(self) -> int:
+        return len(self._in_flight)
@@ -0,0 +1,225 @@
+"""Bounded process pool for CPU-bound rendering with backpressure."""
+
+import asyncio
+import math
+import multiprocessing
+import time
+from concurrent.futures import Future, ProcessPoolExecutor
+from multiprocessing.connection import Connection
+from multiprocessing.context import BaseContext
+from typing import Any, AsyncIterator, Callable, Iterable
+
+from gh_space_shooter import instrumentation
+
+from rendering import RenderDeadlineExceeded, warm_worker, worker_pid
+
+
+class PoolSaturatedError(Exception):
+    """Raised when the pool already holds its maximum number of jobs."""
+
+    def __init__(self, retry_after: int):
+        super().__init__(f"Render queue is full, retry in {retry_after}s")
+        self.retry_after = retry_after
+
+
+class RenderTimeoutError(Exception):
+    """Raised when a job does not finish within the pool's timeout."""
+
+    pass
+
+
+class RenderPool:
+    """
+    Runs render jobs in warm worker processes with a bounded queue.
+
+    Jobs beyond workers + queue_depth are rejected with PoolSaturatedError so
+    callers can answer 503 instead of piling up work. Jobs receive a deadline
+    they check between frames, which frees workers stuck on a slow render.
+    Instrumentation observations made inside a job are replayed in this
+    process once it finishes.
+    """
+
+    def __init__(self, workers: int, queue_depth: int, timeout: float):
+        """
+        Initialize the pool; call start() before submitting.
+
+        Args:
+            workers: Number of worker processes
+            queue_depth: Jobs allowed to wait for a free worker
+            timeout: Seconds a job may take, including time spent queued
+        """
+        self.workers = workers
+        self.max_pending = workers + queue_depth
+        self.timeout = timeout
+        self.pending = 0
+        self._executor: ProcessPoolExecutor | None = None
+        self._context: BaseContext | None = None
+        self._average_seconds = 2.0
+
+    def start(self) -> None:
+        """Start every worker process and warm it up."""
+        # Forked children of a threaded server can deadlock; start from a clean server process
+        context = multiprocessing.get_context("forkserver")
+        context.set_forkserver_preload(["rendering", "worker_pool"])
+        self._executor = ProcessPoolExecutor(self.workers, mp_context=context, initializer=warm_worker)
+        self._context = context
+        for future in [self._executor.submit(worker_pid) for _ in range(self.workers)]:
+            future.result()
+
+    def shutdown(self) -> None:
+        if self._executor is not None:
+            self._executor.shutdown(wait=False, cancel_futures=True)
+            self._executor = None
+            self._context = None
+
+    def retry_after(self) -> int:
+        """Estimated seconds until a queue slot frees up."""
+        return max(1, math.ceil(self._average_seconds * (self.pending - self.max_pending + 1) / self.workers))
+
+    async def submit(self, fn: Callable[..., Any], *args: Any) -> Any:
+        """
+        Run fn(*args, deadline) in a worker process.
+
+        Raises:
+            PoolSaturatedError: If the pool is full
+            RenderTimeoutError: If the job does not finish within the timeout
+        """
+        future, _ = self._submit(_timed, fn, *args, timeout=self.timeout)
+        try:
+            result, seconds, samples = await asyncio.wait_for(asyncio.wrap_future(future), self.timeout + 1)
+        except (asyncio.TimeoutError, RenderDeadlineExceeded) as e:
+            future.cancel()
+            raise RenderTimeoutError(f"Render did not finish within {self.timeout:.0f}s") from e
+        self._finished(seconds, samples)
+        return result
+
+    async def stream(
+        self, fn: Callable[..., Iterable[bytes]], *args: Any, timeout: float | None = None
+    ) -> AsyncIterator[bytes]:
+        """
+        Run fn(*args, deadline) in a worker process, yielding its chunks as the worker produces them.
+
+        The pool slot is taken when the first chunk is requested, so saturation
+        surfaces before any bytes have been handed out. A timeout overrides the
+        pool's for jobs known to be long. Chunks arrive over a pipe watched by
+        the event loop, so waiting for them holds no thread.
+
+        Raises:
+            PoolSaturatedError: If the pool is full
+            RenderTimeoutError: If the job does not finish within the timeout
+        """
+        if self._context is None:
+            raise RuntimeError("RenderPool is not started")
+        reader, writer = self._context.Pipe(duplex=False)
+        timeout = self.timeout if timeout is None else timeout
+        try:
+            future, deadline = self._submit(_streamed, writer, fn, *args, timeout=timeout)
+        except BaseException:
+            reader.close()
+            writer.close()
+            raise
+
+        loop = asyncio.get_running_loop()
+        chunks: asyncio.Queue[bytes | None] = asyncio.Queue()
+
+        def drain() -> None:
+            # An empty message marks the end of the stream
+            while reader.poll():
+                chunk = reader.recv_bytes()
+                chunks.put_nowait(chunk or None)
+
+        def job_ended() -> None:
+            if not reader.closed:
+                drain()
+                loop.remove_reader(reader.fileno())
+            # Our end of the writer stays open until the job has been sent to its worker,
+            # and closing it earlier would show the reader an end of file
+            writer.close()
+            # Wakes the reader even if the worker died before ending the stream
+            chunks.put_nowait(None)
+
+        loop.add_reader(reader.fileno(), drain)
+        future.add_done_callback(lambda _: loop.call_soon_threadsafe(job_ended))
+        try:
+            while True:
+                remaining = max(0.0, deadline + 1 - time.time())
+                chunk = await asyncio.wait_for(chunks.get(), remaining)
+                if chunk is None:
+                    break
+                yield chunk
+            seconds, samples = await asyncio.wrap_future(future)
+        except (asyncio.TimeoutError, RenderDeadlineExceeded) as e:
+            future.cancel()
+            raise RenderTimeoutError(f"Render did not finish within {timeout:.0f}s") from e
+        finally:
+            # A worker still writing to the closed pipe stops with BrokenPipeError
+            loop.remove_reader(reader.fileno())
+            reader.close()
+        self._finished(seconds, samples)
+
+    def _submit(self, wrapper: Callable[..., Any], *args: Any, timeout: float) -> tuple[Future, float]:
+        if self._executor is None:
+            raise RuntimeError("RenderPool is not started")
+        if self.pending >= self.max_pending:
+            raise PoolSaturatedError(self.retry_after())
+
+        loop = asyncio.get_running_loop()
+        deadline = time.time() + timeout
+        future = self._executor.submit(wrapper, *args, deadline)
+        # A timed-out job may still occupy its worker, so the slot frees only when it really ends
+        self.pending += 1
+        future.add_done_callback(lambda _: loop.call_soon_threadsafe(self._release))
+        return future, deadline
+
+    def _finished(self, seconds: float, samples: list[tuple[str, float]]) -> None:
+        self._average_seconds = 0.8 * self._average_seconds + 0.2 * seconds
+        for name, value in samples:
+            instrumentation.observe(name, value)
+
+    def _release(self) -> None:
+        self.pending -= 1
+
+    @property
+    def queued(self) -> int:
+        """Jobs waiting for a free worker."""
+        return max(0, self.pending - self.workers)
+
+    @property
+    def busy(self) -> int:
+        """Jobs currently running."""
+        return min(self.pending, self.workers)
+
+    def stats(self) -> dict[str, float]:
+        return {
+            "workers": self.workers,
+            "max_pending": self.max_pending,
+            "busy": self.busy,
+            "queued": self.queued,
+            "average_render_seconds": round(self._average_seconds, 3),
+        }
+
+    def __repr__(self) -> str:
+        return f"RenderPool(workers={self.workers}, pending={self.pending}/{self.max_pending})"
+
+
+def _timed(fn: Callable[..., Any], *args: Any) -> tuple[Any, float, list[tuple[str, float]]]:
+    started = time.perf_counter()
+    with instrumentation.recording() as samples:
+        result = fn(*args)
+    return result, time.perf_counter() - started, samples
+
+
+def _streamed(
+    channel: Connection, fn: Callable[..., Iterable[bytes]], *args: Any
+) -> tuple[float, list[tuple[str, float]]]:
+    started = time.perf_counter()
+    try:
+        with instrumentation.recording() as samples:
+            for chunk in fn(*args):
+                if chunk:
+                    channel.send_bytes(chunk)
+            # A failed job's exception travels through its future, which also wakes the reader
+            channel.send_bytes(b"")
+    finally:
+        channel.close()
+    return time.perf_counter() - started, samples
@@ -0,0 +1,23 @@
+"""Shared test fixtures for the web app tests."""
+
+from datetime import datetime, timezone
+
+import pytest
+
+NOON = datetime(2024, 1, 1, 12, tzinfo=timezone.utc).timestamp()
+
+
+class FakeClock:
+    """Unix time that only moves when a test sets or advances now."""
+
+    def __init__(self, now: float = NOON):
+        self.now = now
+
+    def __call__(self) -> float:
+        return self.now
+
+
+@pytest.fixture
+def clock() -> FakeClock:
+    """A clock stopped at noon UTC."""
+    return FakeClock()
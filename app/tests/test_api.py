@@ -0,0 +1,146 @@
+"""Tests for the web app's HTTP endpoints."""
+
+import asyncio
+import time
+from typing import Iterator
+
+import pytest
+
+pytest.importorskip("fastapi")
+
+from fastapi.testclient import TestClient
+from gh_space_shooter import instrumentation
+
+import main
+from jobs import Job, JobStore
+from render_cache import RenderCache
+
+
+@pytest.fixture(scope="module", autouse=True)
+def metrics_hook():
+    """Stop feeding the app's metrics once these tests are done."""
+    yield
+    instrumentation.remove_hook(main.record_observation)
+
+
+@pytest.fixture
+def client() -> TestClient:
+    """Client for requests that need neither the render pool nor the prewarmer."""
+    return TestClient(main.app)
+
+
+@pytest.fixture
+def jobs_client(monkeypatch, clock) -> Iterator[TestClient]:
+    """Client running the app's lifespan, so jobs run in the background, with renders faked."""
+    monkeypatch.setenv("GH_TOKEN", "token")
+    monkeypatch.setattr(main.render_pool, "start", lambda: None)
+    monkeypatch.setattr(main.render_pool, "shutdown", lambda: None)
+    monkeypatch.setattr(main, "job_store", JobStore(concurrency=1, ttl=60, max_bytes=1024, max_pending=1, clock=clock))
+
+    async def fetch_grid(http_client, token: str, username: str) -> str:
+        if username == "ghost":
+            raise ValueError("Could not resolve to a User with the login of 'ghost'.")
+        return username
+
+    async def render_job(job: Job, grid: str, strategy: str, seed: int, fps: int, max_frames: int) -> bytes:
+        if grid == "crash":
+            raise RuntimeError("worker crashed")
+        if grid == "slow":
+            await asyncio.sleep(60)
+        job.frames_done = job.frames_total
+        return f"GIF89a {grid} {max_frames}".encode()
+
+    monkeypatch.setattr(main, "fetch_grid", fetch_grid)
+    monkeypatch.setattr(main, "count_frames", lambda grid, strategy, seed, fps, max_frames: max_frames)
+    monkeypatch.setattr(main, "render_job", render_job)
+    with TestClient(main.app) as client:
+        yield client
+
+
+def wait_for_job(client: TestClient, status_url: str) -> dict:
+    give_up = time.monotonic() + 10
+    while (status := client.get(status_url).json())["state"] in ("queued", "running"):
+        assert time.monotonic() < give_up, "job never finished"
+        time.sleep(0.01)
+    return status
+
+
+def metric_lines(client: TestClient, name: str) -> list[str]:
+    return [line for line in client.get("/metrics").text.splitlines() if line.startswith(name)]
+
+
+def test_metrics_report_render_cache_lookups(client, monkeypatch):
+    """/metrics should expose the render cache's hit and miss counters."""
+    cache = RenderCache(max_bytes=1024)
+    monkeypatch.setattr(main, "render_cache", cache)
+    cache.put("key", b"GIF89a")
+    cache.get("key")
+    cache.get("key")
+    cache.get("other")
+
+    assert metric_lines(client, "ghss_render_cache_requests_total{") == [
+        'ghss_render_cache_requests_total{result="hit"} 2',
+        'ghss_render_cache_requests_total{result="miss"} 1',
+    ]
+    assert metric_lines(client, "ghss_render_cache_bytes ") == ["ghss_render_cache_bytes 6"]
+
+
+def test_job_result_is_served_once_done(jobs_client):
+    """A created job should be pollable through its status URL and then serve its GIF."""
+    response = jobs_client.post("/api/jobs", params={"username": "octocat", "max_frames": 40})
+
+    assert response.status_code == 202
+    created = response.json()
+    assert response.headers["Location"] == created["status_url"]
+    assert (created["frames_total"], created["error"]) == (40, None)
+
+    status = wait_for_job(jobs_client, created["status_url"])
+    assert (status["state"], status["progress"]) == ("done", 1.0)
+    result = jobs_client.get(created["result_url"])
+    assert result.status_code == 200
+    assert result.headers["content-type"] == "image/gif"
+    assert result.content == b"GIF89a octocat 40"
+
+
+def test_failed_job_result_reports_the_error(jobs_client):
+    """Fetching a failed job's result should answer 409 with the job's error."""
+    created = jobs_client.post("/api/jobs", params={"username": "crash"}).json()
+
+    assert wait_for_job(jobs_client, created["status_url"])["error"] == "worker crashed"
+    result = jobs_client.get(created["result_url"])
+    assert (result.status_code, result.json()["detail"]) == (409, "Job failed: worker crashed")
+
+
+def test_unfinished_job_result_conflicts_and_full_store_refuses(jobs_client):
+    """An unfinished job's result should answer 409, and new jobs 503 while the store is full."""
+    created = jobs_client.post("/api/jobs", params={"username": "slow"}).json()
+
+    result = jobs_client.get(created["result_url"])
+    assert result.status_code == 409
+    assert result.json()["detail"] in ("Job is queued", "Job is running")
+
+    refused = jobs_client.post("/api/jobs", params={"username": "octocat"})
+    assert refused.status_code == 503
+    assert refused.headers["Retry-After"] == "30"
+
+
+def test_job_creation_rejects_bad_input(jobs_client):
+    """Unknown users and strategies, or too many frames, should be refused before a job is queued."""
+    assert jobs_client.post("/api/jobs", params={"username": "ghost"}).status_code == 400
+    assert jobs_client.post("/api/jobs", params={"username": "octocat", "strategy": "zigzag"}).status_code == 400
+    too_long = {"username": "octocat", "max_frames": main.JOB_MAX_FRAMES + 1}
+    assert jobs_client.post("/api/jobs", params=too_long).status_code == 422
+    assert main.job_store.stats()["pending"] == 0
+
+
+def test_unknown_or_expired_job_is_not_found(jobs_client, clock):
+    """Status and result URLs should answer 404 for unknown jobs and once a job expires."""
+    assert jobs_client.get("/api/jobs/unknown").status_code == 404
+    assert jobs_client.get("/api/jobs/unknown/result").status_code == 404
+
+    created = jobs_client.post("/api/jobs", params={"username": "octocat"}).json()
+    wait_for_job(jobs_client, created["status_url"])
+    clock.now += 60
+
+    assert jobs_client.get(created["status_url"]).status_code == 404
+    assert jobs_client.get(created["result_url"]).status_code == 404
@@ -0,0 +1,143 @@
+"""Tests for background render jobs."""
+
+import asyncio
+
+import pytest
+
+from jobs import Job, JobStore, TooManyJobsError
+
+
+class Gated:
+    """Job work that reports progress and returns its result once released."""
+
+    def __init__(self, result: bytes = b"GIF89a"):
+        self.result = result
+        self.release = asyncio.Event()
+
+    async def __call__(self, job: Job) -> bytes:
+        job.frames_done = job.frames_total // 2
+        await self.release.wait()
+        return self.result
+
+
+async def settle() -> None:
+    """Let every job run as far as it can."""
+    for _ in range(3):
+        await asyncio.sleep(0)
+
+
+def make_store(clock, **overrides) -> JobStore:
+    options = {"concurrency": 1, "ttl": 60, "max_bytes": 1024, "max_pending": 4, **overrides}
+    return JobStore(clock=clock, **options)
+
+
+def test_jobs_beyond_concurrency_wait_in_order(clock):
+    """Only `concurrency` jobs should run at once, the rest starting in submission order."""
+
+    async def scenario() -> None:
+        store = make_store(clock, concurrency=1)
+        first, second = Gated(), Gated()
+        jobs = [store.submit(10, first), store.submit(10, second)]
+        await settle()
+        assert [job.state for job in jobs] == ["running", "queued"]
+        assert jobs[0].status()["progress"] == 0.5
+
+        first.release.set()
+        await settle()
+        assert [job.state for job in jobs] == ["done", "running"]
+        assert jobs[0].status() == {
+            "id": jobs[0].id,
+            "state": "done",
+            "frames_done": 10,
+            "frames_total": 10,
+            "progress": 1.0,
+            "error": None,
+            "size_bytes": 6,
+        }
+        await store.stop()
+
+    asyncio.run(scenario())
+
+
+def test_submit_refuses_past_max_pending(clock):
+    """Unfinished jobs beyond max_pending should be refused until one finishes."""
+
+    async def scenario() -> None:
+        store = make_store(clock, max_pending=2)
+        work = Gated()
+        store.submit(10, work)
+        store.submit(10, work)
+
+        with pytest.raises(TooManyJobsError):
+            store.submit(10, work)
+
+        work.release.set()
+        await settle()
+        assert store.stats()["pending"] == 0
+        store.submit(10, Gated())
+        await store.stop()
+
+    asyncio.run(scenario())
+
+
+def test_failed_job_reports_its_error(clock):
+    """A job whose work raises should be failed with the error's message, or its type without one."""
+
+    async def fail(job: Job) -> bytes:
+        raise ValueError("user not found")
+
+    async def fail_silently(job: Job) -> bytes:
+        raise TimeoutError
+
+    async def scenario() -> list[dict]:
+        store = make_store(clock, concurrency=2)
+        jobs = [store.submit(10, fail), store.submit(10, fail_silently)]
+        await settle()
+        return [job.status() for job in jobs]
+
+    statuses = asyncio.run(scenario())
+    assert [(status["state"], status["error"]) for status in statuses] == [
+        ("failed", "user not found"),
+        ("failed", "TimeoutError"),
+    ]
+    assert statuses[0]["size_bytes"] is None
+
+
+def test_finished_jobs_expire_after_ttl(clock):
+    """A finished job should be forgotten ttl seconds after it finished, not after it was submitted."""
+
+    async def scenario() -> None:
+        store = make_store(clock, ttl=60)
+        work = Gated()
+        job = store.submit(10, work)
+        clock.now += 120
+        work.release.set()
+        await settle()
+
+        clock.now += 59
+        assert store.get(job.id) is job
+        clock.now += 1
+        assert store.get(job.id) is None
+        assert store.stats() == {"pending": 0, "kept": 0, "size_bytes": 0}
+
+    asyncio.run(scenario())
+
+
+def test_oldest_results_are_evicted_past_max_bytes(clock):
+    """Results beyond max_bytes in total should be forgotten in the order they finished."""
+
+    async def scenario() -> None:
+        store = make_store(clock, concurrency=3, max_bytes=10)
+        works = [Gated(b"aaaa"), Gated(b"bbbb"), Gated(b"cccc")]
+        jobs = [store.submit(10, work) for work in works]
+        await settle()
+        # Finishing order, not submission order, decides which result goes first
+        for index in (1, 0, 2):
+            works[index].release.set()
+            await settle()
+
+        assert store.get(jobs[1].id) is None
+        assert store.get(jobs[0].id) is jobs[0] and store.get(jobs[2].id) is jobs[2]
+        assert store.stats() == {"pending": 0, "kept": 2, "size_bytes": 8}
+
+    asyncio.run(scenario())
@@ -0,0 +1,156 @@
+"""Tests for popularity tracking and background pre-warming."""
+
+import asyncio
+from datetime import datetime, timezone
+
+from prewarm import Popularity, Prewarmer, Profile
+
+HOUR = 3600
+
+
+def utc(day: int, hour: int, minute: int = 0) -> float:
+    return datetime(2024, 1, day, hour, minute, tzinfo=timezone.utc).timestamp()
+
+
+def profile(username: str) -> Profile:
+    return (username, "random", 0)
+
+
+class Warmer:
+    """Records warmed profiles and reports capacity for a fixed number of warm-ups."""
+
+    def __init__(self, capacity: int = 100):
+        self.capacity = capacity
+        self.warmed: list[Profile] = []
+
+    async def __call__(self, profile: Profile) -> None:
+        self.warmed.append(profile)
+
+    def has_capacity(self) -> bool:
+        return len(self.warmed) < self.capacity
+
+
+async def finish_hints() -> None:
+    # A hint's own done callback runs before gather's, so it is forgotten once this returns
+    await asyncio.gather(*asyncio.all_tasks() - {asyncio.current_task()})
+
+
+def make_prewarmer(clock, warmer: Warmer, usernames: list[str], refresh: float = 6 * HOUR) -> Prewarmer:
+    popularity = Popularity(half_life=HOUR, clock=clock)
+    # Earlier usernames are requested more often, so they rank first
+    for rank, username in enumerate(usernames):
+        for _ in range(len(usernames) - rank):
+            popularity.record(profile(username))
+    return Prewarmer(
+        warmer, warmer.has_capacity, popularity, top_n=10, interval=60, refresh=refresh, clock=clock
+    )
+
+
+def test_old_requests_decay_below_recent_ones(clock):
+    """Requests should count half as much after every half-life."""
+    popularity = Popularity(half_life=HOUR, clock=clock)
+    for _ in range(3):
+        popularity.record("busy yesterday")
+    popularity.record("quiet today")
+    assert popularity.top(2) == ["busy yesterday", "quiet today"]
+
+    # Three requests two half-lives ago weigh 0.75, below one request now
+    clock.now += 2 * HOUR
+    popularity.record("quiet today")
+    assert popularity.top(2) == ["quiet today", "busy yesterday"]
+
+
+def test_least_popular_profiles_are_forgotten_past_max_tracked(clock):
+    """Going over max_tracked should keep only the most popular half."""
+    popularity = Popularity(half_life=HOUR, max_tracked=4, clock=clock)
+    for name, requests in [("a", 3), ("b", 2), ("c", 1), ("d", 1)]:
+        for _ in range(requests):
+            popularity.record(name)
+    assert len(popularity) == 4
+
+    popularity.record("e")
+
+    assert len(popularity) == 2
+    assert popularity.top(10) == ["a", "b"]
+
+
+def test_warmed_profiles_are_due_again_after_utc_rollover(clock):
+    """A profile warmed before midnight should be re-warmed once the calendar rolls over."""
+    clock.now = utc(1, 23, 30)
+    warmer = Warmer()
+    prewarmer = make_prewarmer(clock, warmer, ["octocat"])
+
+    assert asyncio.run(prewarmer.warm_due()) == 1
+    clock.now = utc(1, 23, 59)
+    assert asyncio.run(prewarmer.warm_due()) == 0
+    clock.now = utc(2, 0, 0)
+    assert asyncio.run(prewarmer.warm_due()) == 1
+    assert warmer.warmed == [profile("octocat")] * 2
+
+
+def test_warmed_profiles_are_due_again_after_refresh(clock):
+    """A profile should be re-warmed once refresh seconds have passed, within the same day."""
+    clock.now = utc(1, 1)
+    warmer = Warmer()
+    prewarmer = make_prewarmer(clock, warmer, ["octocat"], refresh=6 * HOUR)
+
+    assert asyncio.run(prewarmer.warm_due()) == 1
+    clock.now = utc(1, 6, 59)
+    assert asyncio.run(prewarmer.warm_due()) == 0
+    clock.now = utc(1, 7, 1)
+    assert asyncio.run(prewarmer.warm_due()) == 1
+
+
+def test_warm_due_stops_when_workers_are_busy(clock):
+    """Pre-warming should stop as soon as no worker is free, starting with the most popular."""
+    warmer = Warmer(capacity=2)
+    prewarmer = make_prewarmer(clock, warmer, ["a", "b", "c", "d"])
+
+    assert asyncio.run(prewarmer.warm_due()) == 2
+    assert warmer.warmed == [profile("a"), profile("b")]
+
+    # Profiles left out stay due for the next round
+    warmer.capacity = 4
+    assert asyncio.run(prewarmer.warm_due()) == 2
+    assert warmer.warmed[2:] == [profile("c"), profile("d")]
+
+
+def test_only_one_hint_is_warmed_at_a_time(clock):
+    """Hints arriving while one is being warmed should be dropped."""
+
+    async def scenario() -> list[bool]:
+        release = asyncio.Event()
+        warmed: list[Profile] = []
+
+        async def warm(profile: Profile) -> None:
+            warmed.append(profile)
+            await release.wait()
+
+        prewarmer = Prewarmer(
+            warm, lambda: True, Popularity(half_life=HOUR, clock=clock),
+            top_n=10, interval=60, refresh=HOUR, clock=clock,
+        )
+        started = [prewarmer.hint(profile("octo")), prewarmer.hint(profile("octoc"))]
+        release.set()
+        await finish_hints()
+        started.append(prewarmer.hint(profile("octocat")))
+        await finish_hints()
+
+        assert warmed == [profile("octo"), profile("octocat")]
+        assert prewarmer.hinted == 2
+        return started
+
+    assert asyncio.run(scenario()) == [True, False, True]
+
+
+def test_hints_wait_for_an_idle_worker(clock):
+    """No hint should be warmed while every worker is busy."""
+
+    async def scenario() -> bool:
+        prewarmer = Prewarmer(
+            Warmer(), lambda: False, Popularity(half_life=HOUR, clock=clock),
+            top_n=10, interval=60, refresh=HOUR, clock=clock,
+        )
+        return prewarmer.hint(profile("octocat"))
+
+    assert asyncio.run(scenario()) is False
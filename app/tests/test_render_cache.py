@@ -0,0 +1,84 @@
+"""Tests for the in-process render cache."""
+
+from datetime import datetime, timezone
+
+from render_cache import RenderCache
+
+
+def test_least_recently_used_entry_is_evicted_by_size(clock):
+    """Going over max_bytes should evict the least recently used entries first."""
+    cache = RenderCache(max_bytes=10, clock=clock)
+    cache.put("a", b"aaaa")
+    cache.put("b", b"bbbb")
+    cache.get("a")
+
+    cache.put("c", b"cccc")
+
+    assert cache.get("b") is None
+    assert cache.get("a") == b"aaaa" and cache.get("c") == b"cccc"
+    stats = cache.stats()
+    assert (stats.evictions, stats.entries, stats.size_bytes) == (1, 2, 8)
+
+
+def test_replacing_a_value_updates_the_size(clock):
+    """Putting an existing key should replace its value and account for the new size."""
+    cache = RenderCache(max_bytes=10, clock=clock)
+    cache.put("a", b"aaaa")
+    cache.put("a", b"aa")
+
+    assert cache.get("a") == b"aa"
+    assert cache.stats().size_bytes == 2
+
+
+def test_oversize_value_is_not_stored(clock):
+    """A value larger than the whole cache should be skipped without evicting anything."""
+    cache = RenderCache(max_bytes=10, clock=clock)
+    cache.put("a", b"aaaa")
+
+    cache.put("big", b"x" * 11)
+
+    assert "big" not in cache
+    assert cache.get("a") == b"aaaa"
+    assert cache.stats().evictions == 0
+
+
+def test_entries_expire_after_ttl(clock):
+    """An entry older than the TTL should be a miss and count as an expiration."""
+    cache = RenderCache(max_bytes=10, ttl=60, clock=clock)
+    cache.put("a", b"aaaa")
+
+    clock.now += 59
+    assert cache.get("a") == b"aaaa"
+    clock.now += 2
+    assert cache.get("a") is None
+
+    stats = cache.stats()
+    assert (stats.hits, stats.misses, stats.expirations, stats.entries, stats.size_bytes) == (1, 1, 1, 0, 0)
+
+
+def test_entries_expire_at_utc_midnight(clock):
+    """Without a TTL, entries should expire when the contribution calendar rolls over."""
+    clock.now = datetime(2024, 1, 1, 23, 59, 50, tzinfo=timezone.utc).timestamp()
+    cache = RenderCache(max_bytes=10, clock=clock)
+    cache.put("a", b"aaaa")
+
+    clock.now += 9
+    assert cache.get("a") == b"aaaa"
+    clock.now += 1
+    assert cache.get("a") is None
+
+
+def test_contains_neither_counts_nor_refreshes(clock):
+    """Membership checks should not touch the hit/miss counters or the LRU order."""
+    cache = RenderCache(max_bytes=8, ttl=60, clock=clock)
+    cache.put("a", b"aaaa")
+    cache.put("b", b"bbbb")
+
+    assert "a" in cache
+    assert "missing" not in cache
+    cache.put("c", b"cccc")
+
+    assert "a" not in cache and "b" in cache
+    assert (cache.stats().hits, cache.stats().misses) == (0, 0)
+    clock.now += 61
+    assert "b" not in cache
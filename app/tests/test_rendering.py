@@ -0,0 +1,25 @@
+"""Tests for the worker-side render entry points."""
+
+from datetime import date
+
+from gh_space_shooter.contribution_grid import ContributionGrid
+from gh_space_shooter.manifest import package_version
+from gh_space_shooter.synthetic import synthetic_contribution_data
+
+import rendering
+
+
+def test_renderer_version_follows_the_installed_package():
+    """Cache keys and ETags should change whenever a new release is installed."""
+    assert rendering.RENDERER_VERSION.startswith(f"{package_version()}-")
+
+
+def test_etag_depends_on_the_renderer_version(monkeypatch):
+    """Renders from another renderer version should never share an ETag."""
+    data = synthetic_contribution_data("octocat", end=date(2024, 1, 13), num_weeks=2)
+    grid = ContributionGrid.from_contribution_data(data)
+    before = rendering.render_etag(grid, "random", 7)
+
+    monkeypatch.setattr(rendering, "RENDERER_VERSION", "0.1.0-25fps-250frames")
+
+    assert rendering.render_etag(grid, "random", 7) != before
@@ -0,0 +1,169 @@
+"""Tests for coalescing concurrent renders and streams."""
+
+import asyncio
+from typing import AsyncIterator
+
+import pytest
+
+from singleflight import SingleFlight, StreamFlight
+
+
+class RenderFailed(Exception):
+    pass
+
+
+def test_concurrent_callers_share_one_computation():
+    """Every caller joining while a key is in flight should get that computation's result."""
+    flight: SingleFlight[str] = SingleFlight()
+    calls = 0
+
+    async def scenario() -> list[str]:
+        release = asyncio.Event()
+
+        async def compute() -> str:
+            nonlocal calls
+            calls += 1
+            await release.wait()
+            return "gif"
+
+        callers = [asyncio.create_task(flight.do("octocat", compute)) for _ in range(5)]
+        await asyncio.sleep(0)
+        release.set()
+        return await asyncio.gather(*callers)
+
+    assert asyncio.run(scenario()) == ["gif"] * 5
+    assert calls == 1
+    assert (flight.started, flight.coalesced, flight.in_flight) == (1, 4, 0)
+
+
+def test_error_reaches_every_caller_and_frees_the_key():
+    """A failed computation should raise for every joined caller, and the next call should retry."""
+    flight: SingleFlight[str] = SingleFlight()
+
+    async def scenario() -> None:
+        release = asyncio.Event()
+
+        async def fail() -> str:
+            await release.wait()
+            raise RenderFailed("worker crashed")
+
+        async def succeed() -> str:
+            return "gif"
+
+        callers = [asyncio.create_task(flight.do("octocat", fail)) for _ in range(3)]
+        await asyncio.sleep(0)
+        release.set()
+        results = await asyncio.gather(*callers, return_exceptions=True)
+
+        assert all(isinstance(result, RenderFailed) for result in results)
+        assert flight.in_flight == 0
+        assert await flight.do("octocat", succeed) == "gif"
+        assert flight.in_flight == 0
+
+    asyncio.run(scenario())
+    assert flight.started == 2
+
+
+def test_cancelled_caller_does_not_cancel_the_others():
+    """A caller going away should leave the shared computation running for the rest."""
+    flight: SingleFlight[str] = SingleFlight()
+
+    async def scenario() -> str:
+        release = asyncio.Event()
+
+        async def compute() -> str:
+            await release.wait()
+            return "gif"
+
+        leaving = asyncio.create_task(flight.do("octocat", compute))
+        staying = asyncio.create_task(flight.do("octocat", compute))
+        await asyncio.sleep(0)
+        leaving.cancel()
+        await asyncio.sleep(0)
+        release.set()
+        return await staying
+
+    assert asyncio.run(scenario()) == "gif"
+
+
+def test_stream_is_produced_once_and_late_subscribers_replay_it():
+    """Subscribers joining mid-stream should receive every chunk from the first."""
+    flight = StreamFlight()
+    produced = 0
+
+    async def scenario() -> list[bytes]:
+        release = asyncio.Event()
+
+        async def produce() -> AsyncIterator[bytes]:
+            nonlocal produced
+            produced += 1
+            yield b"GIF89a"
+            await release.wait()
+            yield b"frame"
+            yield b";"
+
+        async def read(broadcast) -> bytes:
+            return b"".join([chunk async for chunk in broadcast.subscribe()])
+
+        early = flight.join("octocat", produce)
+        await early.first_chunk()
+        first_reader = asyncio.create_task(read(early))
+        await asyncio.sleep(0)
+
+        late = flight.join("octocat", produce)
+        late_reader = asyncio.create_task(read(late))
+        release.set()
+        await early.finished()
+        return [await first_reader, await late_reader, await read(late)]
+
+    assert asyncio.run(scenario()) == [b"GIF89a" b"frame" b";"] * 3
+    assert produced == 1
+    assert (flight.started, flight.coalesced, flight.in_flight) == (1, 1, 0)
+
+
+def test_stream_error_reaches_every_subscriber_and_frees_the_key():
+    """A stream failing midway should raise for every subscriber after the chunks it produced."""
+    flight = StreamFlight()
+
+    async def scenario() -> None:
+        release = asyncio.Event()
+
+        async def produce() -> AsyncIterator[bytes]:
+            yield b"GIF89a"
+            await release.wait()
+            raise RenderFailed("worker crashed")
+
+        async def read(broadcast) -> list[bytes]:
+            chunks = []
+            with pytest.raises(RenderFailed):
+                async for chunk in broadcast.subscribe():
+                    chunks.append(chunk)
+            return chunks
+
+        broadcast = flight.join("octocat", produce)
+        readers = [asyncio.create_task(read(flight.join("octocat", produce))) for _ in range(3)]
+        await broadcast.first_chunk()
+        release.set()
+
+        assert await asyncio.gather(*readers) == [[b"GIF89a"]] * 3
+        with pytest.raises(RenderFailed):
+            await broadcast.finished()
+        assert flight.in_flight == 0
+        assert flight.join("octocat", produce) is not broadcast
+
+    asyncio.run(scenario())
+
+
+def test_stream_failing_before_data_raises_from_first_chunk():
+    """first_chunk() should surface an error raised before any chunk was produced."""
+    flight = StreamFlight()
+
+    async def produce() -> AsyncIterator[bytes]:
+        raise RenderFailed("pool saturated")
+        yield b""
+
+    async def scenario() -> None:
+        with pytest.raises(RenderFailed):
+            await flight.join("octocat", produce).first_chunk()
+
+    asyncio.run(scenario())
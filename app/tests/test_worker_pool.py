@@ -0,0 +1,123 @@
+"""Tests for the bounded render process pool."""
+
+import asyncio
+import time
+from pathlib import Path
+from typing import Callable, Iterator
+
+import pytest
+
+from worker_pool import PoolSaturatedError, RenderPool, RenderTimeoutError
+
+
+# Jobs run in worker processes, so they live at module level where workers can import them.
+# Each one blocks until its gate file exists, which lets a test decide when the worker ends.
+
+def wait_for_gate(gate: str) -> None:
+    while not Path(gate).exists():
+        time.sleep(0.01)
+
+
+def gated_job(gate: str, deadline: float) -> str:
+    # Ignores its deadline, like a job stuck outside the frame loop
+    wait_for_gate(gate)
+    return "done"
+
+
+def gated_chunks(gate: str, deadline: float) -> Iterator[bytes]:
+    yield b"first"
+    wait_for_gate(gate)
+    yield b"second"
+    yield b"third"
+
+
+def endless_chunks(deadline: float) -> Iterator[bytes]:
+    # Ignores its deadline too, so only the reader going away can stop it
+    while True:
+        yield b"frame"
+        time.sleep(0.01)
+
+
+async def wait_until(condition: Callable[[], bool], timeout: float = 10) -> None:
+    give_up = time.monotonic() + timeout
+    while not condition():
+        assert time.monotonic() < give_up, "condition never held"
+        await asyncio.sleep(0.01)
+
+
+@pytest.fixture(scope="module")
+def pool() -> Iterator[RenderPool]:
+    """A single worker with no queue, so one job saturates it."""
+    pool = RenderPool(workers=1, queue_depth=0, timeout=1)
+    pool.start()
+    yield pool
+    pool.shutdown()
+
+
+def test_saturated_pool_rejects_with_retry_after(pool, tmp_path):
+    """A job beyond max_pending should be refused with the estimated wait."""
+    gate = tmp_path / "gate"
+
+    async def scenario() -> None:
+        running = asyncio.create_task(pool.submit(gated_job, str(gate)))
+        await wait_until(lambda: pool.pending == 1)
+
+        with pytest.raises(PoolSaturatedError) as raised:
+            await pool.submit(gated_job, str(gate))
+
+        # One job ahead on one worker, at the default two second estimate
+        assert raised.value.retry_after == 2
+        assert pool.pending == 1
+        gate.touch()
+        assert await running == "done"
+        await wait_until(lambda: pool.pending == 0)
+
+    asyncio.run(scenario())
+
+
+def test_timed_out_job_keeps_its_slot_until_the_worker_ends(pool, tmp_path):
+    """A timeout should reach the caller at once, but the slot frees only when the job really ends."""
+    gate = tmp_path / "gate"
+
+    async def scenario() -> None:
+        with pytest.raises(RenderTimeoutError):
+            await pool.submit(gated_job, str(gate))
+
+        assert pool.pending == 1
+        with pytest.raises(PoolSaturatedError):
+            await pool.submit(gated_job, str(gate))
+
+        gate.touch()
+        await wait_until(lambda: pool.pending == 0)
+
+    asyncio.run(scenario())
+
+
+def test_chunks_stream_in_order_as_produced(pool, tmp_path):
+    """Chunks should reach the caller in order, each as soon as the worker yields it."""
+    gate = tmp_path / "gate"
+
+    async def scenario() -> list[bytes]:
+        chunks = []
+        async for chunk in pool.stream(gated_chunks, str(gate)):
+            # The worker cannot finish before the gate opens, so this chunk arrived while it ran
+            if not chunks:
+                gate.touch()
+            chunks.append(chunk)
+        await wait_until(lambda: pool.pending == 0)
+        return chunks
+
+    assert asyncio.run(scenario()) == [b"first", b"second", b"third"]
+
+
+def test_abandoned_stream_frees_its_worker(pool):
+    """A reader giving up mid-stream should stop the worker instead of leaving it rendering."""
+
+    async def scenario() -> None:
+        chunks = pool.stream(endless_chunks)
+        assert await anext(chunks) == b"frame"
+        await chunks.aclose()
+
+        await wait_until(lambda: pool.pending == 0)
+
+    asyncio.run(scenario())
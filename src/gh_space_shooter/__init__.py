@@ -1,19 +1,81 @@
 """GitHub contribution graph gamification tool."""
 
-from .github_client import (
-    ContributionData,
-    ContributionDay,
-    ContributionWeek,
-    GitHubAPIError,
-    GitHubClient,
-)
-from .output import resolve_output_provider
+import importlib
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from .github_client import (
+        AsyncGitHubClient,
+        ContributionBatch,
+        ContributionData,
+        ContributionDay,
+        ContributionWeek,
+        GitHubAPIError,
+        GitHubClient,
+        GitHubRateLimitError,
+        GitHubUserNotFoundError,
+    )
+    from .rate_limit import RateLimitStatus, RetryPolicy
+    from .contribution_cache import ContributionCache
+    from .contribution_format import load_contribution_data, save_contribution_data
+    from .contribution_grid import ContributionGrid
+    from .contribution_history import merge_contribution_data, stitch_contribution_data
+    from .output import resolve_output_provider
 
 __version__ = "0.1.0"
 
+# Exports are imported on first access (PEP 562), so importing a light submodule
+# such as the CLI does not pull in httpx or Pillow
+_LAZY_EXPORTS = {
+    "GitHubClient": ".github_client",
+    "AsyncGitHubClient": ".github_client",
+    "GitHubAPIError": ".github_client",
+    "GitHubUserNotFoundError": ".github_client",
+    "GitHubRateLimitError": ".github_client",
+    "ContributionBatch": ".github_client",
+    "ContributionData": ".github_client",
+    "ContributionDay": ".github_client",
+    "ContributionWeek": ".github_client",
+    "RateLimitStatus": ".rate_limit",
+    "RetryPolicy": ".rate_limit",
+    "ContributionCache": ".contribution_cache",
+    "ContributionGrid": ".contribution_grid",
+    "merge_contribution_data": ".contribution_history",
+    "stitch_contribution_data": ".contribution_history",
+    "load_contribution_data": ".contribution_format",
+    "save_contribution_data": ".contribution_format",
+    "resolve_output_provider": ".output",
+}
+
+
+def __getattr__(name: str):
+    module = _LAZY_EXPORTS.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted([*globals(), *_LAZY_EXPORTS])
+
+
 __all__ = [
     "GitHubClient",
+    "AsyncGitHubClient",
     "GitHubAPIError",
+    "GitHubUserNotFoundError",
+    "GitHubRateLimitError",
+    "RateLimitStatus",
+    "RetryPolicy",
+    "ContributionCache",
+    "ContributionGrid",
+    "merge_contribution_data",
+    "stitch_contribution_data",
+    "load_contribution_data",
+    "save_contribution_data",
+    "ContributionBatch",
     "ContributionData",
     "ContributionDay",
     "ContributionWeek",
@@ -0,0 +1,243 @@
+"""Rendering many users in one run, once (batch) or whenever their contributions change (watch)."""
+
+import json
+import os
+import time
+from dataclasses import dataclass
+from pathlib import Path
+from typing import TYPE_CHECKING, Iterable
+
+from .cli_common import CLIError, console, err_console, load_data_from_file, load_env_and_validate, setup_animator
+from .contribution_cache import ContributionCache, default_cache_dir
+from .contribution_grid import ContributionGrid
+
+if TYPE_CHECKING:
+    from .github_client import GitHubClient
+
+
+@dataclass
+class BatchResult:
+    """Outcome of one entry of a batch run."""
+
+    name: str
+    output: str | None = None
+    error: str | None = None
+    seconds: float = 0.0
+    size: int = 0
+
+
+def read_batch_entries(lines: Iterable[str]) -> list[tuple[str | None, str | None]]:
+    """
+    Parse batch input into (username, raw_input) pairs.
+
+    Each non-blank line is a username, or a JSON object with a "username" or a
+    "raw_input" file. Lines starting with # are skipped.
+
+    Raises:
+        CLIError: If a line is not valid
+    """
+    entries: list[tuple[str | None, str | None]] = []
+    for number, line in enumerate(lines, 1):
+        line = line.strip()
+        if not line or line.startswith("#"):
+            continue
+        if not line.startswith("{"):
+            entries.append((line, None))
+            continue
+        try:
+            record = json.loads(line)
+        except json.JSONDecodeError as e:
+            raise CLIError(f"Invalid JSON on line {number}: {e}")
+        if not record.get("username") and not record.get("raw_input"):
+            raise CLIError(f"Line {number} needs a \"username\" or \"raw_input\"")
+        entries.append((record.get("username"), record.get("raw_input")))
+    return entries
+
+
+def load_batch_data(
+    entries: list[tuple[str | None, str | None]],
+    cache_dir: str | None,
+    cache_ttl: int,
+    no_cache: bool,
+) -> tuple[list[BatchResult], dict[str, ContributionGrid]]:
+    """
+    Load the entries' saved data and fetch the rest from GitHub in batches.
+
+    Returns:
+        Results of the entries that failed, and grids by username for the rest
+    """
+    failed: list[BatchResult] = []
+    grids: dict[str, ContributionGrid] = {}
+    usernames: list[str] = []
+    for username, raw_input in entries:
+        if raw_input is None:
+            usernames.append(username)  # type: ignore[arg-type]
+            continue
+        try:
+            data = load_data_from_file(raw_input)
+        except CLIError as e:
+            failed.append(BatchResult(username or raw_input, error=str(e)))
+            continue
+        grids[username or data["username"]] = ContributionGrid.from_contribution_data(data)
+
+    if not usernames:
+        return failed, grids
+
+    console.print(f"[bold blue]Fetching contribution data for {len(usernames)} users...[/bold blue]")
+    try:
+        token = load_env_and_validate()
+    except CLIError as e:
+        return failed + [BatchResult(username, error=str(e)) for username in usernames], grids
+
+    from .github_client import GitHubClient
+
+    cache = None if no_cache else ContributionCache(cache_dir or default_cache_dir(), ttl=cache_ttl)
+    with GitHubClient(token, cache=cache) as client:
+        fetched = client.get_contribution_graphs(usernames)
+    for username, error in fetched["errors"].items():
+        failed.append(BatchResult(username, error=f"GitHub API error: {error}"))
+    for username, data in fetched["results"].items():
+        grids[username] = ContributionGrid.from_contribution_data(data)
+    return failed, grids
+
+
+def render_batch(
+    grids: dict[str, ContributionGrid],
+    output_template: str,
+    strategy_name: str,
+    fps: int,
+    watermark: bool,
+    max_frames: int | None,
+    seed: int | None,
+    workers: int | None,
+) -> Iterable[BatchResult]:
+    """Render every grid in a process pool, yielding results as they finish."""
+    from concurrent.futures import ProcessPoolExecutor, as_completed
+
+    with ProcessPoolExecutor(max_workers=min(workers or os.cpu_count() or 1, max(len(grids), 1))) as pool:
+        futures = {
+            pool.submit(
+                render_batch_entry,
+                grid,
+                output_template.format(username=username, strategy=strategy_name),
+                strategy_name,
+                fps,
+                watermark,
+                max_frames,
+                seed,
+            ): username
+            for username, grid in grids.items()
+        }
+        for future in as_completed(futures):
+            result = BatchResult(futures[future])
+            try:
+                result.output, result.size, result.seconds = future.result()
+            except Exception as e:
+                result.error = f"Failed to generate output: {e}"
+            yield result
+
+
+def resolve_template(output_template: str, strategy_name: str) -> None:
+    """
+    Check that an output template has known placeholders and a supported format.
+
+    Raises:
+        CLIError: If it does not
+    """
+    from .output import resolve_output_provider
+
+    try:
+        resolve_output_provider(output_template.format(username="user", strategy=strategy_name))
+    except (KeyError, IndexError) as e:
+        raise CLIError(f"Unknown placeholder {e} in --output-template, use {{username}} or {{strategy}}")
+    except ValueError as e:
+        raise CLIError(str(e))
+
+
+def parse_duration(text: str) -> float:
+    """
+    Parse a duration such as 90, 90s, 15m, 1h or 1d into seconds.
+
+    Raises:
+        CLIError: If the duration is malformed or not positive
+    """
+    units = {"s": 1, "m": 60, "h": 3600, "d": 86400}
+    number, unit = (text[:-1], text[-1]) if text[-1:] in units else (text, "s")
+    try:
+        seconds = float(number) * units[unit]
+    except ValueError:
+        raise CLIError(f"Invalid duration '{text}', expected e.g. 90s, 15m or 1h")
+    if seconds <= 0:
+        raise CLIError(f"Duration must be positive, got '{text}'")
+    return seconds
+
+
+def watch_cycle(
+    client: "GitHubClient",
+    usernames: list[str],
+    rendered: dict[str, str],
+    output_template: str,
+    strategy_name: str,
+    fps: int,
+    watermark: bool,
+    max_frames: int | None,
+    seed: int | None,
+    workers: int | None,
+) -> list[BatchResult]:
+    """
+    Check every user once and re-render those whose data changed.
+
+    Args:
+        rendered: Render hash of each user's last successful render; updated in place
+
+    Returns:
+        Results of the renders done in this check
+    """
+    from .github_client import GitHubAPIError
+
+    changed: dict[str, ContributionGrid] = {}
+    for username in usernames:
+        try:
+            grid = ContributionGrid.from_contribution_data(client.get_contribution_graph(username))
+        except GitHubAPIError as e:
+            # Keep serving the previous output and try again next time
+            err_console.print(f"[red]✗[/red] {username}: GitHub API error: {e}")
+            continue
+        if rendered.get(username) != grid.render_hash:
+            changed[username] = grid
+
+    stamp = time.strftime("%H:%M:%S")
+    if not changed:
+        console.print(f"[dim]{stamp} No changes[/dim]")
+        return []
+
+    results = []
+    for result in render_batch(changed, output_template, strategy_name, fps, watermark, max_frames, seed, workers):
+        results.append(result)
+        if result.error is None:
+            rendered[result.name] = changed[result.name].render_hash
+            console.print(f"[green]✓[/green] {stamp} {result.name}: {result.output} ({result.size:,} bytes, {result.seconds:.1f}s)")
+        else:
+            err_console.print(f"[red]✗[/red] {stamp} {result.name}: {result.error}")
+    return results
+
+
+def render_batch_entry(
+    grid: ContributionGrid,
+    output_path: str,
+    strategy_name: str,
+    fps: int,
+    watermark: bool,
+    max_frames: int | None,
+    seed: int | None,
+) -> tuple[str, int, float]:
+    """Render and write one animation in a worker process; returns (path, size, seconds)."""
+    from .output import resolve_output_provider
+
+    started = time.perf_counter()
+    provider = resolve_output_provider(output_path)
+    animator = setup_animator(strategy_name, grid, fps, watermark, seed)
+    encoded = provider.encode(animator.generate_frames(max_frames), 1000 // fps)
+    Path(output_path).parent.mkdir(parents=True, exist_ok=True)
+    provider.write(encoded)
+    return output_path, len(encoded), time.perf_counter() - started
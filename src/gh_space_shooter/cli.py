@@ -1,31 +1,77 @@
 """CLI interface for gh-space-shooter."""
 
+import copy
 import json
-import os
+import math
 import sys
+import time
+from contextlib import contextmanager
+from dataclasses import asdict, dataclass
 from pathlib import Path
+from typing import TYPE_CHECKING, Iterator
 
+import click
 import typer
 from dotenv import load_dotenv
-from rich.console import Console
-
-from .constants import DEFAULT_FPS
-from .console_printer import ContributionConsolePrinter
-from .game import Animator, ColumnStrategy, RandomStrategy, RowStrategy, BaseStrategy
-from .github_client import ContributionData, GitHubAPIError, GitHubClient
-from .output import resolve_output_provider
-from .output import OutputProvider, WebpDataUrlOutputProvider
+from typer.core import TyperGroup
+
+from . import instrumentation
+from .batch import load_batch_data, parse_duration, read_batch_entries, render_batch, resolve_template, watch_cycle
+from .cli_common import (
+    CLIError,
+    console,
+    create_strategy,
+    err_console,
+    load_data_from_file,
+    load_env_and_validate,
+    setup_animator,
+)
+from .constants import DEFAULT_CACHE_TTL, DEFAULT_FPS
+from .contribution_cache import ContributionCache, default_cache_dir
+from .contribution_format import BINARY_SUFFIX, save_contribution_data
+from .contribution_grid import ContributionGrid
+from .manifest import is_up_to_date, write_manifest
+
+# The game, the output providers and the GitHub clients pull in Pillow and httpx,
+# so they are imported where they are used, keeping --help and early exits fast
+if TYPE_CHECKING:
+    from .game import Animator
+    from .github_client import ContributionData
+    from .output import OutputProvider
 
 # Load environment variables from .env file
 load_dotenv()
 
-console = Console()
-err_console = Console(stderr=True)
+
+# Command run when the first argument is not a command name, e.g. `gh-space-shooter czl9707`
+DEFAULT_COMMAND = "render"
+
+
+class DefaultCommandGroup(TyperGroup):
+    """Command group that falls back to DEFAULT_COMMAND instead of requiring a command name."""
+
+    def parse_args(self, ctx: click.Context, args: list[str]) -> list[str]:
+        group_options = {opt for param in self.get_params(ctx) for opt in param.opts}
+        if not args or args[0] not in {*self.commands, *group_options}:
+            args = [DEFAULT_COMMAND, *args]
+        return super().parse_args(ctx, args)
+
+    def format_help(self, ctx: click.Context, formatter: click.HelpFormatter) -> None:
+        # `gh-space-shooter --help` documents the default command, then lists every command
+        command = self.commands[DEFAULT_COMMAND]
+        merged = copy.copy(self)
+        merged.help = command.help
+        merged.params = [*command.params, *self.params]
+        merged.subcommand_metavar = "| COMMAND [ARGS]..."
+        super(DefaultCommandGroup, merged).format_help(ctx, formatter)
 
 
-class CLIError(Exception):
-    """Base exception for CLI errors with user-friendly messages."""
-    pass
+@dataclass
+class RunProfile:
+    """Observations collected during a run with --profile."""
+
+    samples: list[tuple[str, float]]
+    output_bytes: int | None = None
 
 
 def main(
@@ -35,14 +81,19 @@ def main(
         "--raw-input",
         "--raw-in",
         "-ri",
-        help="Load contribution data from JSON file (skips GitHub API call)",
+        help="Load contribution data from JSON or .ghss file (skips GitHub API call)",
+    ),
+    incremental: bool = typer.Option(
+        False,
+        "--incremental",
+        help="Fetch only the days since --raw-input was saved and merge them in",
     ),
     raw_output: str = typer.Option(
         None,
         "--raw-output",
         "--raw-out",
         "-ro",
-        help="Save contribution data to JSON file",
+        help="Save contribution data to JSON or .ghss file (compact binary)",
     ),
     out: str = typer.Option(
         None,
@@ -56,6 +107,11 @@ def main(
         "--write-dataurl-to",
         help="Generate WebP as data URL and write to text file",
     ),
+    sprite_sheet: bool = typer.Option(
+        False,
+        "--sprite-sheet",
+        help="Write --output as a PNG/WebP sprite sheet plus an HTML/CSS snippet",
+    ),
     strategy: str = typer.Option(
         "random",
         "--strategy",
@@ -77,6 +133,56 @@ def main(
         "--watermark",
         help="Add watermark to the GIF",
     ),
+    seed: int | None = typer.Option(
+        None,
+        "--seed",
+        help="Seed for stars, explosions and the random strategy, for reproducible output",
+    ),
+    max_bytes: int | None = typer.Option(
+        None,
+        "--max-bytes",
+        help="Reduce quality, fps, scale or length until the output fits in this many bytes",
+    ),
+    cache_dir: str | None = typer.Option(
+        None,
+        "--cache-dir",
+        help="Directory for cached GitHub data (default: ~/.cache/gh-space-shooter)",
+    ),
+    cache_ttl: int = typer.Option(
+        DEFAULT_CACHE_TTL,
+        "--cache-ttl",
+        help="Seconds to reuse cached GitHub data before revalidating",
+    ),
+    no_cache: bool = typer.Option(
+        False,
+        "--no-cache",
+        help="Always fetch fresh data from GitHub",
+    ),
+    force: bool = typer.Option(
+        False,
+        "--force",
+        help="Render even if the manifest says the output is up to date",
+    ),
+    no_manifest: bool = typer.Option(
+        False,
+        "--no-manifest",
+        help="Neither check nor write the manifest next to the output",
+    ),
+    profile: bool = typer.Option(
+        False,
+        "--profile",
+        help="Print the time spent fetching, loading, simulating, rendering, encoding and writing",
+    ),
+    profile_out: str | None = typer.Option(
+        None,
+        "--profile-out",
+        help="Profile output generation to a .pstats, collapsed-stack (.collapsed) or speedscope (.json) file",
+    ),
+    synthetic: bool = typer.Option(
+        False,
+        "--synthetic",
+        help="Render made-up contribution data for the username instead of fetching it (no token needed)",
+    ),
 ) -> None:
     """
     Fetch or load GitHub contribution graph data and display it.
@@ -90,39 +196,91 @@ def main(
 
       # Load from saved file
       gh-space-shooter --raw-input data.json
-    """
-    try:
-        if not username:
-            raise CLIError("Username is required")
 
-        # Validate mutual exclusivity of output options
-        if out and write_dataurl_to:
-            raise CLIError(
-                "Cannot specify both --output and --write-dataurl-to. Choose one."
-            )
-        if not out and not write_dataurl_to:
-            out = f"{username}-gh-space-shooter.gif"
-
-        # Load data from file or GitHub
-        if raw_input:
-            data = _load_data_from_file(raw_input)
-        else:
-            data = _load_data_from_github(username)
+      # Fetch only new days and update the saved file
+      gh-space-shooter czl9707 --raw-input data.json --incremental --raw-output data.json
 
-        # Display the data
-        printer = ContributionConsolePrinter()
-        printer.display_stats(data)
-        printer.display_contribution_graph(data)
+      # Profile rendering of reproducible data, for speedscope.app
+      gh-space-shooter octocat --synthetic --seed 1 --profile-out run.json
 
-        # Save to file if requested
-        if raw_output:
-            _save_data_to_file(data, raw_output)
+      # Render a user named like a command (batch, watch)
+      gh-space-shooter render batch
 
-        # Generate output if requested
-        if write_dataurl_to or out:
+    A manifest of the inputs (hash of the drawn levels, strategy, fps, seed, encoder settings
+    and package version) is written next to the output. When a later run has the same
+    inputs, it stops with "up to date" without rendering.
+    """
+    try:
+        with _profiling(profile) as run_profile:
+            if not username:
+                raise CLIError("Username is required")
+
+            # Validate mutual exclusivity of output options
+            if out and write_dataurl_to:
+                raise CLIError(
+                    "Cannot specify both --output and --write-dataurl-to. Choose one."
+                )
+            if not out and not write_dataurl_to:
+                out = f"{username}-gh-space-shooter.gif"
+            if synthetic and raw_input:
+                raise CLIError("Cannot specify both --synthetic and --raw-input. Choose one.")
+            if profile_out:
+                from .profiling import profile_format
+
+                try:
+                    profile_format(profile_out)
+                except ValueError as e:
+                    raise CLIError(str(e))
+
+            # Load data from file or GitHub
+            if incremental and not raw_input:
+                raise CLIError("--incremental requires --raw-input")
+            if synthetic:
+                from .synthetic import REFERENCE_END, synthetic_contribution_data
+
+                data = synthetic_contribution_data(username, seed=seed or 0, end=REFERENCE_END)
+            elif incremental and Path(raw_input).exists():
+                data = _update_data_from_github(username, load_data_from_file(raw_input))
+            elif raw_input and not incremental:
+                data = load_data_from_file(raw_input)
+            else:
+                cache = None if no_cache else ContributionCache(cache_dir or default_cache_dir(), ttl=cache_ttl)
+                data = _load_data_from_github(username, cache)
+
+            grid = ContributionGrid.from_contribution_data(data)
             output_path = write_dataurl_to or out
-            provider = _resolve_provider(output_path, bool(write_dataurl_to))
-            _generate_output(data, provider, strategy, fps, watermark, max_frames)
+            inputs = _render_inputs(
+                grid, output_path, bool(write_dataurl_to), sprite_sheet, strategy, fps, watermark, max_frames, max_bytes, seed
+            )
+            # A data URL shares its file with other content, so only its inputs are compared
+            verify_output = not write_dataurl_to
+            # A profile is only useful if the output is actually rendered
+            skip_check = no_manifest or force or profile or profile_out
+            if not skip_check and is_up_to_date(output_path, inputs, verify_output):
+                if raw_output:
+                    _save_data_to_file(data, raw_output)
+                console.print(f"[green]✓[/green] {output_path} is up to date")
+                return
+
+            # Display the data
+            from .console_printer import ContributionConsolePrinter
+
+            printer = ContributionConsolePrinter()
+            printer.display_stats(grid)
+            printer.display_contribution_graph(grid)
+
+            # Save to file if requested
+            if raw_output:
+                _save_data_to_file(data, raw_output)
+
+            # Generate output
+            provider = _resolve_provider(output_path, bool(write_dataurl_to), sprite_sheet)
+            with _profiler(profile_out):
+                written = _generate_output(grid, provider, strategy, fps, watermark, max_frames, max_bytes, seed)
+            if run_profile is not None:
+                run_profile.output_bytes = written
+            if not no_manifest:
+                write_manifest(output_path, inputs, verify_output)
 
     except CLIError as e:
         err_console.print(f"[bold red]Error:[/bold red] {e}")
@@ -133,90 +291,333 @@ def main(
         sys.exit(1)
 
 
-def _load_env_and_validate() -> str:
-    """Load environment variables and validate required settings. Returns token."""
-    token = os.getenv("GH_TOKEN")
-    if not token:
-        raise CLIError(
-            "GitHub token not found. "
-            "Set your GitHub token in the GH_TOKEN environment variable."
-        )
-    return token
+def batch(
+    users_file: str = typer.Argument(
+        ...,
+        help="File listing usernames one per line, or JSON lines with \"username\" or \"raw_input\" (- for stdin)",
+    ),
+    output_template: str = typer.Option(
+        "{username}-gh-space-shooter.gif",
+        "--output-template",
+        "-o",
+        help="Output path for each user (GIF or WebP); {username} and {strategy} are filled in",
+    ),
+    strategy: str = typer.Option(
+        "random",
+        "--strategy",
+        "-s",
+        help="Strategy for clearing enemies (column, row, random)",
+    ),
+    fps: int = typer.Option(
+        DEFAULT_FPS,
+        "--fps",
+        help="Frames per second for the animation",
+    ),
+    max_frames: int | None = typer.Option(
+        None,
+        "--max-frame",
+        help="Maximum number of frames to generate",
+    ),
+    watermark: bool = typer.Option(
+        False,
+        "--watermark",
+        help="Add watermark to the GIF",
+    ),
+    seed: int | None = typer.Option(
+        None,
+        "--seed",
+        help="Seed for stars, explosions and the random strategy, for reproducible output",
+    ),
+    workers: int | None = typer.Option(
+        None,
+        "--workers",
+        "-j",
+        min=1,
+        help="Processes rendering in parallel (default: CPU count)",
+    ),
+    report: str | None = typer.Option(
+        None,
+        "--report",
+        help="Write a JSON summary of timings and failures to this file",
+    ),
+    cache_dir: str | None = typer.Option(
+        None,
+        "--cache-dir",
+        help="Directory for cached GitHub data (default: ~/.cache/gh-space-shooter)",
+    ),
+    cache_ttl: int = typer.Option(
+        DEFAULT_CACHE_TTL,
+        "--cache-ttl",
+        help="Seconds to reuse cached GitHub data before revalidating",
+    ),
+    no_cache: bool = typer.Option(
+        False,
+        "--no-cache",
+        help="Always fetch fresh data from GitHub",
+    ),
+) -> None:
+    """
+    Render animations for many users in one process.
 
+    Usernames are fetched together with batched GitHub queries over one
+    connection, then rendered in parallel. A user that fails is reported and
+    skipped; the command exits with status 1 if any did.
+
+    Examples:
+      # Render everyone listed in users.txt into out/
+      gh-space-shooter batch users.txt -o "out/{username}.gif" --report report.json
 
-def _load_data_from_file(file_path: str) -> ContributionData:
-    """Load contribution data from a JSON file."""
-    console.print(f"[bold blue]Loading data from {file_path}...[/bold blue]")
+      # Mix saved data with fetched users
+      printf '{"raw_input": "me.ghss"}\nczl9707\n' | gh-space-shooter batch -
+    """
     try:
-        with open(file_path, "r") as f:
-            return json.load(f)
-    except FileNotFoundError:
-        raise CLIError(f"File '{file_path}' not found")
-    except json.JSONDecodeError as e:
-        raise CLIError(f"Invalid JSON in '{file_path}': {e}")
+        create_strategy(strategy)
+        resolve_template(output_template, strategy)
 
+        if users_file == "-":
+            entries = read_batch_entries(sys.stdin)
+        else:
+            try:
+                with open(users_file) as f:
+                    entries = read_batch_entries(f)
+            except FileNotFoundError:
+                raise CLIError(f"File '{users_file}' not found")
+    except CLIError as e:
+        err_console.print(f"[bold red]Error:[/bold red] {e}")
+        sys.exit(1)
 
-def _load_data_from_github(username: str) -> ContributionData:
-    """Fetch contribution data from GitHub API."""
-    token = _load_env_and_validate()
+    started = time.perf_counter()
+    results, grids = load_batch_data(entries, cache_dir, cache_ttl, no_cache)
+    fetch_seconds = time.perf_counter() - started
+
+    console.print(f"\n[bold blue]Rendering {len(grids)} animations...[/bold blue]")
+    for result in render_batch(grids, output_template, strategy, fps, watermark, max_frames, seed, workers):
+        results.append(result)
+        if result.error is None:
+            console.print(f"[green]✓[/green] {result.name}: {result.output} ({result.size:,} bytes, {result.seconds:.1f}s)")
+        else:
+            err_console.print(f"[red]✗[/red] {result.name}: {result.error}")
+    elapsed = time.perf_counter() - started
+
+    failed = [result for result in results if result.error is not None]
+    console.print(
+        f"\nRendered {len(results) - len(failed)}/{len(results)} in {elapsed:.1f}s "
+        f"(fetching {fetch_seconds:.1f}s, rendering {elapsed - fetch_seconds:.1f}s)"
+    )
+    for result in failed:
+        err_console.print(f"[bold red]Failed:[/bold red] {result.name}: {result.error}")
+
+    if report:
+        summary = {
+            "total": len(results),
+            "succeeded": len(results) - len(failed),
+            "failed": len(failed),
+            "fetch_seconds": fetch_seconds,
+            "elapsed_seconds": elapsed,
+            "results": [asdict(result) for result in results],
+        }
+        Path(report).write_text(json.dumps(summary, indent=2) + "\n")
+    if failed:
+        sys.exit(1)
+
+
+def watch(
+    usernames: list[str] = typer.Argument(..., help="GitHub usernames to keep rendered"),
+    interval: str = typer.Option(
+        "15m",
+        "--interval",
+        "-i",
+        help="Time between checks for new contributions, e.g. 90s, 15m or 1h",
+    ),
+    output_template: str = typer.Option(
+        "{username}-gh-space-shooter.gif",
+        "--output-template",
+        "-o",
+        help="Output path for each user (GIF or WebP); {username} and {strategy} are filled in",
+    ),
+    strategy: str = typer.Option(
+        "random",
+        "--strategy",
+        "-s",
+        help="Strategy for clearing enemies (column, row, random)",
+    ),
+    fps: int = typer.Option(
+        DEFAULT_FPS,
+        "--fps",
+        help="Frames per second for the animation",
+    ),
+    max_frames: int | None = typer.Option(
+        None,
+        "--max-frame",
+        help="Maximum number of frames to generate",
+    ),
+    watermark: bool = typer.Option(
+        False,
+        "--watermark",
+        help="Add watermark to the GIF",
+    ),
+    seed: int | None = typer.Option(
+        None,
+        "--seed",
+        help="Seed for stars, explosions and the random strategy, for reproducible output",
+    ),
+    workers: int | None = typer.Option(
+        None,
+        "--workers",
+        "-j",
+        min=1,
+        help="Processes rendering in parallel (default: CPU count)",
+    ),
+    cache_dir: str | None = typer.Option(
+        None,
+        "--cache-dir",
+        help="Directory for cached GitHub data (default: ~/.cache/gh-space-shooter)",
+    ),
+) -> None:
+    """
+    Keep animations up to date, re-rendering only users whose contributions changed.
+
+    Every interval each user's data is revalidated against GitHub with a small
+    query (the full graph is only refetched when the total changed). Users
+    whose drawn levels match their last render are skipped. Outputs are replaced
+    atomically, so a web server never serves a partial file. Stop with Ctrl+C.
+
+    Examples:
+      # Refresh two dashboards' GIFs every 15 minutes
+      gh-space-shooter watch czl9707 torvalds -o "/srv/www/{username}.gif"
+    """
+    try:
+        seconds = parse_duration(interval)
+        create_strategy(strategy)
+        resolve_template(output_template, strategy)
+        token = load_env_and_validate()
+    except CLIError as e:
+        err_console.print(f"[bold red]Error:[/bold red] {e}")
+        sys.exit(1)
+
+    from .github_client import GitHubClient
+
+    # Entries are never fresh, so every check revalidates with the small query instead of trusting the cache
+    cache = ContributionCache(cache_dir or default_cache_dir(), ttl=0)
+    rendered: dict[str, str] = {}
+    console.print(f"[bold blue]Watching {len(usernames)} users every {interval}...[/bold blue]")
+    try:
+        with GitHubClient(token, cache=cache) as client:
+            while True:
+                started = time.monotonic()
+                watch_cycle(client, usernames, rendered, output_template, strategy, fps, watermark, max_frames, seed, workers)
+                time.sleep(max(0.0, seconds - (time.monotonic() - started)))
+    except KeyboardInterrupt:
+        console.print("\nStopped watching.")
+
+
+def _load_data_from_github(username: str, cache: ContributionCache | None = None) -> "ContributionData":
+    """Fetch contribution data from GitHub API (or the cache)."""
+    from .github_client import GitHubAPIError, GitHubClient
+
+    token = load_env_and_validate()
 
     console.print(f"[bold blue]Fetching contribution data for {username}...[/bold blue]")
     try:
-        with GitHubClient(token) as client:
+        with GitHubClient(token, cache=cache) as client:
             return client.get_contribution_graph(username)
     except GitHubAPIError as e:
         raise CLIError(f"GitHub API error: {e}")
 
 
-def _save_data_to_file(data: ContributionData, file_path: str) -> None:
-    """Save contribution data to a JSON file."""
+def _update_data_from_github(username: str, previous: "ContributionData") -> "ContributionData":
+    """Fetch the days missing from previously saved data and merge them in."""
+    from .github_client import GitHubAPIError, GitHubClient
+
+    if previous["username"].lower() != username.lower():
+        raise CLIError(f"Saved data is for '{previous['username']}', not '{username}'")
+    token = load_env_and_validate()
+
+    console.print(f"[bold blue]Fetching new contributions for {username}...[/bold blue]")
+    try:
+        with GitHubClient(token) as client:
+            return client.update_contribution_graph(previous)
+    except GitHubAPIError as e:
+        raise CLIError(f"GitHub API error: {e}")
+
+
+def _save_data_to_file(data: "ContributionData", file_path: str) -> None:
+    """Save contribution data to a JSON or binary (.ghss) file."""
     try:
-        with open(file_path, "w") as f:
-            json.dump(data, f, indent=2)
+        if Path(file_path).suffix.lower() == BINARY_SUFFIX:
+            save_contribution_data(data, file_path)
+        else:
+            with open(file_path, "w") as f:
+                json.dump(data, f, indent=2)
         console.print(f"\n[green]✓[/green] Data saved to {file_path}")
     except IOError as e:
         raise CLIError(f"Failed to save file '{file_path}': {e}")
+    except ValueError as e:
+        raise CLIError(f"Cannot save '{file_path}': {e}")
 
 
-def _resolve_provider(file_path: str, is_dataurl: bool) -> OutputProvider:
+def _resolve_provider(file_path: str, is_dataurl: bool, is_sprite_sheet: bool = False) -> "OutputProvider":
     """
     Resolve the appropriate output provider based on file path and mode.
     """
+    from .output import SpriteSheetOutputProvider, WebpDataUrlOutputProvider, resolve_output_provider
+
     try:
         if is_dataurl:
             return WebpDataUrlOutputProvider(file_path)
+        elif is_sprite_sheet:
+            if Path(file_path).suffix.lower() not in (".png", ".webp"):
+                raise ValueError("Sprite sheets must be written as .png or .webp")
+            return SpriteSheetOutputProvider(file_path)
+        elif Path(file_path).suffix.lower() == ".png":
+            raise ValueError("PNG output is only written as a sprite sheet; add --sprite-sheet")
         else:
             return resolve_output_provider(file_path)
     except ValueError as e:
         raise CLIError(str(e))
 
 
-def _setup_animator(strategy_name: str, data: ContributionData, fps: int, watermark: bool) -> Animator:
-    """
-    Set up strategy and animator.
-    """
-    if strategy_name == "column":
-        strategy: BaseStrategy = ColumnStrategy()
-    elif strategy_name == "row":
-        strategy = RowStrategy()
-    elif strategy_name == "random":
-        strategy = RandomStrategy()
+def _render_inputs(
+    grid: ContributionGrid,
+    output_path: str,
+    is_dataurl: bool,
+    is_sprite_sheet: bool,
+    strategy_name: str,
+    fps: int,
+    watermark: bool,
+    max_frames: int | None,
+    max_bytes: int | None,
+    seed: int | None,
+) -> dict:
+    """Everything an output depends on besides the package version, for its manifest."""
+    if is_dataurl:
+        output_format = "dataurl"
+    elif is_sprite_sheet:
+        output_format = "sprite-sheet"
     else:
-        raise CLIError(
-            f"Unknown strategy '{strategy_name}'. Available: column, row, random"
-        )
-
-    return Animator(data, strategy, fps=fps, watermark=watermark)
+        output_format = Path(output_path).suffix.lower().lstrip(".")
+    return {
+        "data": grid.render_hash,
+        "format": output_format,
+        "strategy": strategy_name,
+        "fps": fps,
+        "seed": seed,
+        "watermark": watermark,
+        "max_frames": max_frames,
+        "max_bytes": max_bytes,
+    }
 
 
 def _generate_output(
-    data: ContributionData,
-    provider: OutputProvider,
+    data: "ContributionData | ContributionGrid",
+    provider: "OutputProvider",
     strategy_name: str,
     fps: int,
     watermark: bool,
     max_frames: int | None,
-) -> None:
+    max_bytes: int | None = None,
+    seed: int | None = None,
+) -> int:
     """
     Generate output using the provided provider.
 
@@ -227,10 +628,17 @@ def _generate_output(
         fps: Frames per second
         watermark: Whether to add watermark
         max_frames: Maximum number of frames to generate
+        max_bytes: Byte budget the output has to fit in
+        seed: Seed for the game's randomness
+
+    Returns:
+        Size of the written output in bytes
 
     Raises:
         CLIError: If output generation fails
     """
+    from .output import SpriteSheetOutputProvider, WebpDataUrlOutputProvider
+
     # Warn about GIF FPS limitation
     if provider.path.endswith(".gif") and fps > 50:
         console.print(
@@ -241,30 +649,154 @@ def _generate_output(
     # Print generation message
     if isinstance(provider, WebpDataUrlOutputProvider):
         console.print("\n[bold blue]Generating WebP data URL...[/bold blue]")
+    elif isinstance(provider, SpriteSheetOutputProvider):
+        console.print("\n[bold blue]Generating sprite sheet...[/bold blue]")
     else:
         ext = Path(provider.path).suffix[1:].upper()
         console.print(f"\n[bold blue]Generating {ext} animation...[/bold blue]")
 
     # Setup strategy and animator
-    animator = _setup_animator(strategy_name, data, fps, watermark)
+    animator = setup_animator(strategy_name, data, fps, watermark, seed)
 
     # Encode and write
     try:
-        encoded = provider.encode(animator.generate_frames(max_frames), 1000 // fps)
+        if max_bytes is not None:
+            encoded = _encode_within_budget(animator, provider, fps, max_frames, max_bytes)
+        else:
+            encoded = provider.encode(animator.generate_frames(max_frames), 1000 // fps)
         provider.write(encoded)
 
         # Console output based on provider type
         if isinstance(provider, WebpDataUrlOutputProvider):
             console.print(f"[green]✓[/green] Data URL written to {provider.path}")
+        elif isinstance(provider, SpriteSheetOutputProvider):
+            console.print(
+                f"[green]✓[/green] Sprite sheet saved to {provider.path}, "
+                f"snippet written to {provider.snippet_path}"
+            )
         else:
             ext = Path(provider.path).suffix[1:].upper()
             console.print(f"[green]✓[/green] {ext} saved to {provider.path}")
     except Exception as e:
         raise CLIError(f"Failed to generate output: {e}")
+    return len(encoded)
 
 
-app = typer.Typer()
-app.command()(main)
+def _encode_within_budget(
+    animator: "Animator",
+    provider: "OutputProvider",
+    fps: int,
+    max_frames: int | None,
+    max_bytes: int,
+) -> bytes:
+    """
+    Render frames once and encode them with settings that fit the byte budget.
+    """
+    from .output import fit_to_budget
+
+    frames = list(animator.generate_frames(max_frames))
+    result = fit_to_budget(provider, frames, 1000 // fps, max_bytes)
+
+    settings = ", ".join(f"{key}={value}" for key, value in result.encoder_settings.items())
+    console.print(
+        f"[green]✓[/green] Fit {len(result.data):,} bytes (budget {max_bytes:,}): "
+        f"{result.frame_count}/{len(frames)} frames at {1000 / result.frame_duration:.1f} fps, "
+        f"scale {result.scale:.0%}, {settings}"
+    )
+    return result.data
+
+
+@contextmanager
+def _profiling(enabled: bool) -> Iterator[RunProfile | None]:
+    """Record the observations made in the block and print a profile once it completes."""
+    if not enabled:
+        yield None
+        return
+    started = time.perf_counter()
+    with instrumentation.recording() as samples:
+        run_profile = RunProfile(samples)
+        yield run_profile
+    _print_profile(run_profile, time.perf_counter() - started)
+
+
+@contextmanager
+def _profiler(path: str | None) -> Iterator[None]:
+    """Profile the block to path, if given."""
+    if path is None:
+        yield
+        return
+    from .profiling import profile_to
+
+    with profile_to(path):
+        yield
+    console.print(f"[green]✓[/green] Profile written to {path}")
+
+
+def _print_profile(run_profile: RunProfile, total: float) -> None:
+    """Print the time spent per phase, per-frame render times, throughput and memory."""
+    from rich.table import Table
+
+    values: dict[str, list[float]] = {}
+    for name, value in run_profile.samples:
+        values.setdefault(name, []).append(value)
+    renders = sorted(values.get(instrumentation.FRAME_RENDER, []))
+    frames = int(sum(values.get(instrumentation.FRAMES, [])))
+
+    table = Table(title="Profile", title_justify="left")
+    table.add_column("Phase")
+    table.add_column("Seconds", justify="right")
+    table.add_column("Share", justify="right")
+    table.add_column("Details")
+
+    def add_phase(label: str, name: str, details: str = "") -> None:
+        if name in values:
+            seconds = sum(values[name])
+            share = f"{seconds / total:.0%}" if total else ""
+            table.add_row(label, f"{seconds:.3f}", share, details)
+
+    fetches = len(values.get(instrumentation.GITHUB_FETCH, []))
+    add_phase("Fetch", instrumentation.GITHUB_FETCH, f"{fetches} request{'s' if fetches != 1 else ''}")
+    add_phase("Data load", instrumentation.DATA_LOAD)
+    add_phase("Simulation", instrumentation.SIMULATE, f"{frames} frames")
+    if renders:
+        p95 = renders[math.ceil(0.95 * len(renders)) - 1]
+        add_phase(
+            "Rendering",
+            instrumentation.FRAME_RENDER,
+            f"per frame: mean {sum(renders) / len(renders) * 1000:.2f} ms, "
+            f"p95 {p95 * 1000:.2f} ms, max {renders[-1] * 1000:.2f} ms",
+        )
+    passes = len(values.get(instrumentation.ENCODE, []))
+    add_phase("Encoding", instrumentation.ENCODE, f"{passes} passes to fit the budget" if passes > 1 else "")
+    add_phase("Writing", instrumentation.WRITE)
+    table.add_row("Total", f"{total:.3f}", "100%", "")
+    console.print()
+    console.print(table)
+
+    generating = sum(values.get(instrumentation.SIMULATE, [])) + sum(renders)
+    if frames and generating:
+        console.print(f"Frames/s:     {frames / generating:,.1f} (simulation and rendering)")
+    if run_profile.output_bytes is not None:
+        console.print(f"Output bytes: {run_profile.output_bytes:,}")
+    peak = _peak_rss_bytes()
+    console.print(f"Peak RSS:     {peak / 2**20:,.1f} MiB" if peak is not None else "Peak RSS:     n/a")
+
+
+def _peak_rss_bytes() -> int | None:
+    """Peak resident memory of this process, or None where the platform does not report it."""
+    try:
+        import resource
+    except ImportError:  # Windows
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Reported in bytes on macOS and in kilobytes elsewhere
+    return peak if sys.platform == "darwin" else peak * 1024
+
+
+app = typer.Typer(cls=DefaultCommandGroup)
+app.command(DEFAULT_COMMAND)(main)
+app.command()(batch)
+app.command()(watch)
 
 if __name__ == "__main__":
     app()
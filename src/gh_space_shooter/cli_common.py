@@ -0,0 +1,88 @@
+"""Consoles, errors and loading helpers shared by the CLI commands and the batch/watch runners."""
+
+import json
+import os
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+from rich.console import Console
+
+from . import instrumentation
+from .contribution_format import BINARY_SUFFIX, load_contribution_data
+from .contribution_grid import ContributionGrid
+
+# The game pulls in Pillow, so it is imported where it is used, keeping --help and early exits fast
+if TYPE_CHECKING:
+    from .game import Animator, BaseStrategy
+    from .github_client import ContributionData
+
+console = Console()
+err_console = Console(stderr=True)
+
+
+class CLIError(Exception):
+    """Base exception for CLI errors with user-friendly messages."""
+    pass
+
+
+def load_env_and_validate() -> str:
+    """Load environment variables and validate required settings. Returns token."""
+    token = os.getenv("GH_TOKEN")
+    if not token:
+        raise CLIError(
+            "GitHub token not found. "
+            "Set your GitHub token in the GH_TOKEN environment variable."
+        )
+    return token
+
+
+def load_data_from_file(file_path: str) -> "ContributionData":
+    """Load contribution data from a JSON or binary (.ghss) file."""
+    console.print(f"[bold blue]Loading data from {file_path}...[/bold blue]")
+    try:
+        with instrumentation.timed(instrumentation.DATA_LOAD):
+            if Path(file_path).suffix.lower() == BINARY_SUFFIX:
+                return load_contribution_data(file_path)
+            with open(file_path, "r") as f:
+                return json.load(f)
+    except FileNotFoundError:
+        raise CLIError(f"File '{file_path}' not found")
+    except json.JSONDecodeError as e:
+        raise CLIError(f"Invalid JSON in '{file_path}': {e}")
+    except ValueError as e:
+        raise CLIError(f"Invalid contribution file '{file_path}': {e}")
+
+
+def setup_animator(
+    strategy_name: str,
+    data: "ContributionData | ContributionGrid",
+    fps: int,
+    watermark: bool,
+    seed: int | None = None,
+) -> "Animator":
+    """
+    Set up strategy and animator.
+    """
+    from .game import Animator
+
+    return Animator(data, create_strategy(strategy_name), fps=fps, watermark=watermark, seed=seed)
+
+
+def create_strategy(strategy_name: str) -> "BaseStrategy":
+    """
+    Create a strategy by name.
+
+    Raises:
+        CLIError: If the strategy is unknown
+    """
+    from .game import ColumnStrategy, RandomStrategy, RowStrategy
+
+    if strategy_name == "column":
+        return ColumnStrategy()
+    elif strategy_name == "row":
+        return RowStrategy()
+    elif strategy_name == "random":
+        return RandomStrategy()
+    raise CLIError(
+        f"Unknown strategy '{strategy_name}'. Available: column, row, random"
+    )
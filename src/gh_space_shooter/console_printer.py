@@ -1,9 +1,14 @@
 """Console output formatting and display functions."""
 
+from typing import TYPE_CHECKING
+
 from rich.console import Console
 from rich.text import Text
 
-from .github_client import ContributionData
+from .contribution_grid import ContributionGrid
+
+if TYPE_CHECKING:
+    from .github_client import ContributionData
 
 console = Console()
 
@@ -15,23 +20,26 @@ class ContributionConsolePrinter:
     graph using colored blocks via the Rich library.
     """
 
-    def display_stats(self, data: ContributionData) -> None:
+    def display_stats(self, data: "ContributionData | ContributionGrid") -> None:
         """Display contribution statistics in a one-liner."""
-        # Get date range
-        all_days = [day for week in data["weeks"] for day in week["days"]]
-        if all_days:
-            start_date = all_days[0]["date"]
-            end_date = all_days[-1]["date"]
+        grid = self._as_grid(data)
+        lengths = grid.week_lengths
+        # Get date range from the first and last real days
+        first_week = next((idx for idx, length in enumerate(lengths) if length), None)
+        if first_week is not None:
+            last_week = max(idx for idx, length in enumerate(lengths) if length)
+            start_date = grid.date(first_week, 0)
+            end_date = grid.date(last_week, lengths[last_week] - 1)
 
             console.print(
-                f"\n[bold green]✓[/bold green] @{data['username']}: "
-                f"{data['total_contributions']} contributions from {start_date} to {end_date}, "
-                f"{len(data['weeks'])} weeks in total.\n"
+                f"\n[bold green]✓[/bold green] @{grid.username}: "
+                f"{grid.total_contributions} contributions from {start_date} to {end_date}, "
+                f"{grid.num_weeks} weeks in total.\n"
             )
 
-    def display_contribution_graph(self, data: ContributionData) -> None:
+    def display_contribution_graph(self, data: "ContributionData | ContributionGrid") -> None:
         """Display a GitHub-style contribution graph."""
-        weeks = data["weeks"]
+        grid = self._as_grid(data)
         day_labels = ["Sun", "Mon", "Tue", "Wed", "Thu", "Fri", "Sat"]
 
         console.print("[bold]Contribution Graph:[/bold]\n")
@@ -40,13 +48,7 @@ class ContributionConsolePrinter:
             console.print(f"  {day_labels[day_idx]} ", end="")
 
             # Print colored blocks for this day across all weeks
-            for week in weeks:
-                
-                if day_idx < len(week["days"]):
-                    day = week["days"][day_idx]
-                    level = day["level"]
-                else:
-                    level = 0
+            for level in grid.row(day_idx):
                 self._print_block(level)
 
             console.print()  # New line after each day row
@@ -66,6 +68,12 @@ class ContributionConsolePrinter:
         4: "on rgb(87,242,135)",         # Very bright green
     }
 
+    @staticmethod
+    def _as_grid(data: "ContributionData | ContributionGrid") -> ContributionGrid:
+        if isinstance(data, ContributionGrid):
+            return data
+        return ContributionGrid.from_contribution_data(data)
+
     def _print_block(self, level: int) -> None:
         """Print a colored block based on contribution level."""
         text = Text("  ", style=self.COLOR_MAP.get(level, ""))
@@ -32,3 +32,7 @@ EXPLOSION_DURATION_SMALL = 0.12  # Seconds for small explosion animation
 # Starfield settings (speeds in cells per second)
 STAR_SPEED_MIN = 1.0  # Minimum star speed (dimmer/farther stars)
 STAR_SPEED_MAX = 2.5  # Maximum star speed (brighter/closer stars)
+
+# Contribution cache settings (seconds)
+DEFAULT_CACHE_TTL = 24 * 60 * 60  # Serve cached data for a day without revalidating
+DEFAULT_NEGATIVE_CACHE_TTL = 60 * 60  # Remember "user not found" for an hour
@@ -0,0 +1,114 @@
+"""On-disk cache for contribution data fetched from GitHub."""
+
+import json
+import os
+import tempfile
+import time
+from dataclasses import dataclass
+from pathlib import Path
+from typing import TYPE_CHECKING
+from urllib.parse import quote
+
+from .constants import DEFAULT_CACHE_TTL, DEFAULT_NEGATIVE_CACHE_TTL
+
+if TYPE_CHECKING:
+    from .github_client import ContributionData
+
+
+def default_cache_dir() -> Path:
+    """Cache directory from GH_SPACE_SHOOTER_CACHE_DIR, falling back to the user cache dir."""
+    configured = os.getenv("GH_SPACE_SHOOTER_CACHE_DIR")
+    if configured:
+        return Path(configured)
+    base = os.getenv("XDG_CACHE_HOME") or Path.home() / ".cache"
+    return Path(base) / "gh-space-shooter"
+
+
+@dataclass
+class CacheEntry:
+    """A cached contribution fetch, or a cached "user not found" result."""
+
+    fetched_at: float
+    fresh: bool
+    data: "ContributionData | None" = None
+    error: str | None = None
+
+
+class ContributionCache:
+    """
+    Stores contribution data as JSON files keyed by username and date window.
+
+    Entries older than the TTL are still returned (marked stale) so callers can
+    revalidate them cheaply instead of refetching. "User not found" results are
+    cached with their own, shorter TTL.
+    """
+
+    def __init__(
+        self,
+        cache_dir: str | Path,
+        ttl: float = DEFAULT_CACHE_TTL,
+        negative_ttl: float = DEFAULT_NEGATIVE_CACHE_TTL,
+    ):
+        """
+        Initialize the cache.
+
+        Args:
+            cache_dir: Directory to store cache entries in (created on first write)
+            ttl: Seconds a fetched entry is served without revalidation
+            negative_ttl: Seconds a "user not found" result is served
+        """
+        self.cache_dir = Path(cache_dir)
+        self.ttl = ttl
+        self.negative_ttl = negative_ttl
+
+    def _path(self, username: str, window: str) -> Path:
+        # GitHub logins are case-insensitive
+        return self.cache_dir / f"{quote(username.lower(), safe='')}_{quote(window, safe='')}.json"
+
+    def get(self, username: str, window: str) -> CacheEntry | None:
+        """
+        Look up an entry.
+
+        Returns:
+            The entry (stale entries included), or None if missing, unreadable,
+            or an expired "user not found" result
+        """
+        try:
+            with open(self._path(username, window), "r") as f:
+                raw = json.load(f)
+        except (OSError, ValueError):
+            return None
+
+        age = time.time() - raw["fetched_at"]
+        if raw.get("error") is not None:
+            if age > self.negative_ttl:
+                return None
+            return CacheEntry(fetched_at=raw["fetched_at"], fresh=True, error=raw["error"])
+
+        return CacheEntry(fetched_at=raw["fetched_at"], fresh=age <= self.ttl, data=raw["data"])
+
+    def put(self, username: str, window: str, data: "ContributionData") -> None:
+        """Store fetched contribution data."""
+        self._write(username, window, {"fetched_at": time.time(), "data": data})
+
+    def put_missing(self, username: str, window: str, error: str) -> None:
+        """Store a "user not found" result."""
+        self._write(username, window, {"fetched_at": time.time(), "error": error})
+
+    def touch(self, username: str, window: str) -> None:
+        """Mark an existing entry as freshly validated."""
+        entry = self.get(username, window)
+        if entry is not None and entry.data is not None:
+            self.put(username, window, entry.data)
+
+    def _write(self, username: str, window: str, raw: dict) -> None:
+        # Write to a temporary file and rename so concurrent readers never see partial JSON
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(dir=self.cache_dir, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "w") as f:
+                json.dump(raw, f)
+            os.replace(tmp_path, self._path(username, window))
+        except BaseException:
+            os.unlink(tmp_path)
+            raise
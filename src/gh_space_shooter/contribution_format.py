@@ -0,0 +1,210 @@
+"""Compact binary format for saved contribution data.
+
+A record stores a run of consecutive days:
+
+    magic "GHSS" | version u8 | username length u8 | username (UTF-8)
+    | first day (u32 proleptic ordinal) | day count u32 | total contributions u32
+    | levels, two 4-bit values per byte (low nibble first)
+    | counts as unsigned LEB128 varints
+
+Integers are little-endian. Records are self-delimiting, so an archive of many
+users is simply their records concatenated.
+"""
+
+import mmap
+import struct
+from datetime import date, timedelta
+from functools import lru_cache
+from pathlib import Path
+from typing import TYPE_CHECKING, Iterator
+
+if TYPE_CHECKING:
+    from .github_client import ContributionData, ContributionDay, ContributionWeek
+
+BINARY_SUFFIX = ".ghss"
+MAGIC = b"GHSS"
+VERSION = 1
+
+_HEADER = struct.Struct("<4sBB")
+_RANGE = struct.Struct("<III")
+
+
+def encode_contribution_data(data: "ContributionData") -> bytes:
+    """
+    Encode contribution data as one binary record.
+
+    Raises:
+        ValueError: If the days are not consecutive or a value is out of range
+    """
+    days = [day for week in data["weeks"] for day in week["days"]]
+    username = data["username"].encode()
+    if len(username) > 255:
+        raise ValueError(f"Username too long: {data['username']}")
+
+    start = date.fromisoformat(days[0]["date"]) if days else date(1970, 1, 1)
+    for offset, day in enumerate(days):
+        if day["date"] != (start + timedelta(days=offset)).isoformat():
+            raise ValueError(f"Contribution days are not consecutive at {day['date']}")
+        if not 0 <= day["level"] <= 15:
+            raise ValueError(f"Level out of range on {day['date']}: {day['level']}")
+
+    levels = bytearray((len(days) + 1) // 2)
+    for idx, day in enumerate(days):
+        levels[idx // 2] |= day["level"] << (4 * (idx % 2))
+
+    counts = bytearray()
+    for day in days:
+        _write_varint(counts, day["count"])
+
+    return b"".join(
+        [
+            _HEADER.pack(MAGIC, VERSION, len(username)),
+            username,
+            _RANGE.pack(start.toordinal(), len(days), data["total_contributions"]),
+            bytes(levels),
+            bytes(counts),
+        ]
+    )
+
+
+def decode_contribution_data(buffer: bytes | memoryview | mmap.mmap) -> "ContributionData":
+    """
+    Decode a buffer holding exactly one record.
+
+    Raises:
+        ValueError: If the buffer is not a valid record
+    """
+    data, end = _decode_record(memoryview(buffer), 0)
+    if end != len(buffer):
+        raise ValueError(f"Unexpected {len(buffer) - end} trailing bytes")
+    return data
+
+
+def iter_contribution_data(buffer: bytes | memoryview | mmap.mmap) -> Iterator["ContributionData"]:
+    """
+    Decode every record of an archive of concatenated records.
+
+    Raises:
+        ValueError: If a record is malformed
+    """
+    view = memoryview(buffer)
+    offset = 0
+    while offset < len(view):
+        data, offset = _decode_record(view, offset)
+        yield data
+
+
+def save_contribution_data(data: "ContributionData", path: str | Path) -> None:
+    """Write contribution data to a binary file."""
+    with open(path, "wb") as f:
+        f.write(encode_contribution_data(data))
+
+
+def load_contribution_data(path: str | Path) -> "ContributionData":
+    """
+    Read a single-record binary file through a memory map.
+
+    Raises:
+        ValueError: If the file is not a valid record
+    """
+    return _with_mmap(path, decode_contribution_data)
+
+
+def load_contribution_archive(path: str | Path) -> list["ContributionData"]:
+    """
+    Read every record of a binary archive through a memory map.
+
+    Raises:
+        ValueError: If a record is malformed
+    """
+    return _with_mmap(path, lambda buffer: list(iter_contribution_data(buffer)))
+
+
+def _with_mmap(path: str | Path, decode):
+    with open(path, "rb") as f:
+        if f.seek(0, 2) == 0:
+            raise ValueError(f"'{path}' is empty")
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+            view = memoryview(mapped)
+            try:
+                return decode(view)
+            finally:
+                view.release()
+
+
+def _decode_record(view: memoryview, offset: int) -> tuple["ContributionData", int]:
+    """Decode the record at offset; returns it with the offset just past it."""
+    try:
+        magic, version, name_length = _HEADER.unpack_from(view, offset)
+        if magic != MAGIC:
+            raise ValueError("Not a gh-space-shooter contribution file")
+        if version != VERSION:
+            raise ValueError(f"Unsupported contribution format version {version}")
+        offset += _HEADER.size
+        username = bytes(view[offset:offset + name_length]).decode()
+        offset += name_length
+        start_ordinal, num_days, total = _RANGE.unpack_from(view, offset)
+        offset += _RANGE.size
+        start = date.fromordinal(start_ordinal)
+    except struct.error as e:
+        raise ValueError(f"Truncated contribution record: {e}") from e
+
+    packed = bytes(view[offset:offset + (num_days + 1) // 2])
+    if len(packed) != (num_days + 1) // 2:
+        raise ValueError("Truncated contribution record: levels")
+    offset += len(packed)
+    levels = [0] * (len(packed) * 2)
+    levels[0::2] = [byte & 0x0F for byte in packed]
+    levels[1::2] = [byte >> 4 for byte in packed]
+
+    # Counts below 128 are single bytes, which covers nearly every day
+    head = bytes(view[offset:offset + num_days])
+    if len(head) == num_days and (not head or max(head) < 0x80):
+        counts = list(head)
+        offset += num_days
+    else:
+        counts = []
+        for _ in range(num_days):
+            count, offset = _read_varint(view, offset)
+            counts.append(count)
+
+    days: list["ContributionDay"] = [
+        {"date": day, "count": count, "level": level}
+        for day, count, level in zip(_iso_dates(start.toordinal(), num_days), counts, levels)
+    ]
+
+    # Days are consecutive, so weeks split at every Sunday
+    first_week = 7 - (start.weekday() + 1) % 7
+    bounds = [0, *range(first_week, num_days, 7), num_days] if num_days else []
+    weeks: list["ContributionWeek"] = [{"days": days[lo:hi]} for lo, hi in zip(bounds, bounds[1:]) if hi > lo]
+
+    return {"username": username, "total_contributions": total, "weeks": weeks}, offset
+
+
+@lru_cache(maxsize=32)
+def _iso_dates(start_ordinal: int, num_days: int) -> tuple[str, ...]:
+    # Records in an archive usually share their date range
+    return tuple(date.fromordinal(start_ordinal + idx).isoformat() for idx in range(num_days))
+
+
+def _write_varint(out: bytearray, value: int) -> None:
+    if value < 0:
+        raise ValueError(f"Counts must not be negative: {value}")
+    while value >= 0x80:
+        out.append((value & 0x7F) | 0x80)
+        value >>= 7
+    out.append(value)
+
+
+def _read_varint(view: memoryview, offset: int) -> tuple[int, int]:
+    value = 0
+    shift = 0
+    while True:
+        if offset >= len(view):
+            raise ValueError("Truncated contribution record: counts")
+        byte = view[offset]
+        offset += 1
+        value |= (byte & 0x7F) << shift
+        if byte < 0x80:
+            return value, offset
+        shift += 7
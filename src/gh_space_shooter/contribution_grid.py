@@ -0,0 +1,222 @@
+"""Array-backed, immutable view of a contribution graph."""
+
+import hashlib
+import sys
+from array import array
+from typing import TYPE_CHECKING, Iterator, Mapping
+
+from .constants import NUM_DAYS
+
+if TYPE_CHECKING:
+    from .github_client import ContributionData, ContributionDay
+
+
+class ContributionGrid:
+    """
+    Contribution levels and counts stored in contiguous week-major arrays.
+
+    Cell (week, day) is the day-th entry of the week-th week, exactly as
+    ContributionData lays it out; partial weeks are padded with empty cells.
+    Conversion to and from ContributionData is lossless.
+    """
+
+    __slots__ = ("username", "total_contributions", "_levels", "_counts", "_dates", "_week_lengths", "_hash")
+
+    def __init__(
+        self,
+        username: str,
+        total_contributions: int,
+        levels: bytes,
+        counts: array,
+        dates: tuple[str, ...],
+        week_lengths: tuple[int, ...],
+    ):
+        """
+        Initialize a grid from week-major arrays; prefer the from_* constructors.
+
+        Args:
+            username: GitHub username
+            total_contributions: Total as reported by GitHub
+            levels: One level per cell, NUM_DAYS cells per week
+            counts: One count per cell
+            dates: One ISO date per cell ("" for padding)
+            week_lengths: Number of real days in each week
+        """
+        size = len(week_lengths) * NUM_DAYS
+        if not len(levels) == len(counts) == len(dates) == size:
+            raise ValueError(f"Expected {size} cells for {len(week_lengths)} weeks")
+        set_attr = object.__setattr__
+        set_attr(self, "username", username)
+        set_attr(self, "total_contributions", total_contributions)
+        set_attr(self, "_levels", bytes(levels))
+        set_attr(self, "_counts", array("Q", counts))
+        set_attr(self, "_dates", tuple(dates))
+        set_attr(self, "_week_lengths", tuple(week_lengths))
+        set_attr(self, "_hash", None)
+
+    def __setattr__(self, name: str, value) -> None:
+        raise AttributeError(f"{type(self).__name__} is immutable")
+
+    def __reduce__(self):
+        return type(self), (
+            self.username, self.total_contributions, self._levels, self._counts, self._dates, self._week_lengths
+        )
+
+    @classmethod
+    def from_contribution_data(cls, data: "ContributionData") -> "ContributionGrid":
+        """Build a grid from ContributionData."""
+        return cls._from_weeks(
+            data["username"],
+            data["total_contributions"],
+            ([(day["date"], day["count"], day["level"]) for day in week["days"]] for week in data["weeks"]),
+        )
+
+    @classmethod
+    def from_calendar(
+        cls,
+        username: str,
+        calendar: dict,
+        level_map: Mapping[str, int],
+        num_weeks: int | None = None,
+    ) -> "ContributionGrid":
+        """
+        Build a grid straight from a GraphQL contributionCalendar node.
+
+        Args:
+            username: GitHub username
+            calendar: The contributionCalendar object of the response
+            level_map: Maps contributionLevel names to integer levels
+            num_weeks: Most recent weeks to keep, or None to keep all
+        """
+        weeks = calendar["weeks"]
+        if num_weeks is not None:
+            weeks = weeks[-num_weeks:]
+        return cls._from_weeks(
+            username,
+            calendar["totalContributions"],
+            (
+                [
+                    (day["date"], day["contributionCount"], level_map.get(day["contributionLevel"], 0))
+                    for day in week["contributionDays"]
+                ]
+                for week in weeks
+            ),
+        )
+
+    @classmethod
+    def _from_weeks(cls, username: str, total: int, weeks) -> "ContributionGrid":
+        levels = bytearray()
+        counts = array("Q")
+        dates: list[str] = []
+        week_lengths: list[int] = []
+        for days in weeks:
+            if len(days) > NUM_DAYS:
+                raise ValueError(f"A week has {len(days)} days")
+            padding = NUM_DAYS - len(days)
+            dates.extend([day[0] for day in days] + [""] * padding)
+            counts.extend([day[1] for day in days] + [0] * padding)
+            levels.extend([day[2] for day in days] + [0] * padding)
+            week_lengths.append(len(days))
+        return cls(username, total, bytes(levels), counts, tuple(dates), tuple(week_lengths))
+
+    def to_contribution_data(self) -> "ContributionData":
+        """Convert back to ContributionData."""
+        return {
+            "username": self.username,
+            "total_contributions": self.total_contributions,
+            "weeks": [
+                {"days": [self._day(week * NUM_DAYS + day) for day in range(length)]}
+                for week, length in enumerate(self._week_lengths)
+            ],
+        }
+
+    @property
+    def num_weeks(self) -> int:
+        return len(self._week_lengths)
+
+    @property
+    def week_lengths(self) -> tuple[int, ...]:
+        return self._week_lengths
+
+    def level(self, week: int, day: int) -> int:
+        """Level at (week, day); 0 for padding cells."""
+        return self._levels[self._index(week, day)]
+
+    def count(self, week: int, day: int) -> int:
+        """Contribution count at (week, day); 0 for padding cells."""
+        return self._counts[self._index(week, day)]
+
+    def date(self, week: int, day: int) -> str:
+        """ISO date at (week, day); "" for padding cells."""
+        return self._dates[self._index(week, day)]
+
+    def column(self, week: int) -> bytes:
+        """Levels of one week, NUM_DAYS long."""
+        start = self._index(week, 0)
+        return self._levels[start:start + NUM_DAYS]
+
+    def row(self, day: int) -> bytes:
+        """Levels of one weekday position across all weeks."""
+        if not 0 <= day < NUM_DAYS:
+            raise IndexError(f"Day {day} out of range")
+        return self._levels[day::NUM_DAYS]
+
+    def active_cells(self) -> Iterator[tuple[int, int, int]]:
+        """Yield (week, day, level) for every cell with a non-zero level."""
+        levels = self._levels
+        for index in range(len(levels)):
+            if levels[index]:
+                yield index // NUM_DAYS, index % NUM_DAYS, levels[index]
+
+    def days(self) -> Iterator["ContributionDay"]:
+        """Yield the real days in order, skipping padding."""
+        for week, length in enumerate(self._week_lengths):
+            for day in range(length):
+                yield self._day(week * NUM_DAYS + day)
+
+    @property
+    def content_hash(self) -> str:
+        """Stable hex digest of the grid's content, identical across processes."""
+        if self._hash is None:
+            digest = hashlib.blake2b(digest_size=16)
+            digest.update(self.username.encode() + b"\0" + str(self.total_contributions).encode() + b"\0")
+            digest.update(bytes(self._week_lengths))
+            digest.update(self._levels)
+            counts = array("Q", self._counts)
+            if sys.byteorder == "big":
+                counts.byteswap()
+            digest.update(counts.tobytes())
+            digest.update("\0".join(self._dates).encode())
+            object.__setattr__(self, "_hash", digest.hexdigest())
+        return self._hash
+
+    @property
+    def render_hash(self) -> str:
+        """
+        Hex digest of what a render of the grid shows: the level of every cell, by position.
+
+        Unlike content_hash it ignores the username, dates and counts, which no
+        frame draws, so an inactive user's graph keeps its hash from day to day.
+        Trailing empty cells are ignored too, as the canvas does not depend on
+        the number of weeks.
+        """
+        return hashlib.blake2b(self._levels.rstrip(b"\0"), digest_size=16).hexdigest()
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, ContributionGrid):
+            return NotImplemented
+        return self.content_hash == other.content_hash
+
+    def __hash__(self) -> int:
+        return hash(self.content_hash)
+
+    def __repr__(self) -> str:
+        return f"ContributionGrid({self.username!r}, weeks={self.num_weeks}, hash={self.content_hash[:8]})"
+
+    def _index(self, week: int, day: int) -> int:
+        if not 0 <= day < NUM_DAYS or not 0 <= week < len(self._week_lengths):
+            raise IndexError(f"Cell ({week}, {day}) out of range")
+        return week * NUM_DAYS + day
+
+    def _day(self, index: int) -> "ContributionDay":
+        return {"date": self._dates[index], "count": self._counts[index], "level": self._levels[index]}
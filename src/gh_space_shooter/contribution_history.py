@@ -0,0 +1,121 @@
+"""Merging contribution data fetched over different date windows."""
+
+from datetime import date, timedelta
+from typing import TYPE_CHECKING
+
+from .constants import NUM_WEEKS
+
+if TYPE_CHECKING:
+    from .github_client import ContributionData, ContributionDay, ContributionWeek
+
+
+def merge_contribution_data(
+    base: "ContributionData",
+    update: "ContributionData",
+    num_weeks: int | None = NUM_WEEKS,
+) -> "ContributionData":
+    """
+    Merge newer contribution days into previously fetched data.
+
+    Days in the update replace days with the same date. The result is regrouped
+    into Sunday-to-Saturday weeks, trimmed to the most recent weeks, and its
+    total recomputed from the days that remain.
+
+    GitHub assigns levels relative to the queried window, so levels of a narrow
+    update window are rescaled against the count ranges seen in the base data.
+
+    Args:
+        base: Previously fetched contribution data
+        update: Contribution data for a more recent (possibly overlapping) window
+        num_weeks: Number of most recent weeks to keep, or None to keep all
+
+    Returns:
+        Merged ContributionData for the base data's user
+    """
+    base_days = [day for week in base["weeks"] for day in week["days"]]
+    floors = _level_floors(base_days)
+
+    days_by_date: dict[str, "ContributionDay"] = {day["date"]: day for day in base_days}
+    for week in update["weeks"]:
+        for day in week["days"]:
+            level = _rescale_level(day["count"], floors, day["level"])
+            days_by_date[day["date"]] = {"date": day["date"], "count": day["count"], "level": level}
+
+    weeks = group_weeks([days_by_date[key] for key in sorted(days_by_date)])
+    if num_weeks is not None:
+        weeks = weeks[-num_weeks:]
+
+    return {
+        "username": base["username"],
+        "total_contributions": sum(day["count"] for week in weeks for day in week["days"]),
+        "weeks": weeks,
+    }
+
+
+def stitch_contribution_data(parts: list["ContributionData"]) -> "ContributionData":
+    """
+    Join contribution data fetched for consecutive date windows.
+
+    Levels are kept as fetched, i.e. relative to each window like GitHub's
+    per-year calendars.
+
+    Args:
+        parts: Data for the same user, ordered by window (must not be empty)
+
+    Returns:
+        ContributionData with one continuous week sequence and the total over all days
+    """
+    days_by_date: dict[str, "ContributionDay"] = {}
+    for part in parts:
+        for week in part["weeks"]:
+            for day in week["days"]:
+                days_by_date[day["date"]] = day
+
+    weeks = group_weeks([days_by_date[key] for key in sorted(days_by_date)])
+    return {
+        "username": parts[0]["username"],
+        "total_contributions": sum(day["count"] for day in days_by_date.values()),
+        "weeks": weeks,
+    }
+
+
+def last_contribution_date(data: "ContributionData") -> date | None:
+    """Date of the most recent day in the data, or None if it has no days."""
+    dates = [day["date"] for week in data["weeks"] for day in week["days"]]
+    return date.fromisoformat(max(dates)) if dates else None
+
+
+def group_weeks(days: list["ContributionDay"]) -> list["ContributionWeek"]:
+    """Group date-sorted days into Sunday-to-Saturday weeks like GitHub's calendar."""
+    weeks: list["ContributionWeek"] = []
+    current_start: date | None = None
+    for day in days:
+        day_date = date.fromisoformat(day["date"])
+        week_start = day_date - timedelta(days=(day_date.weekday() + 1) % 7)
+        if week_start != current_start:
+            weeks.append({"days": []})
+            current_start = week_start
+        weeks[-1]["days"].append(day)
+    return weeks
+
+
+def _level_floors(days: list["ContributionDay"]) -> dict[int, int]:
+    """Smallest count observed at each non-zero level."""
+    floors: dict[int, int] = {}
+    for day in days:
+        if day["level"] > 0 and day["count"] > 0:
+            floors[day["level"]] = min(day["count"], floors.get(day["level"], day["count"]))
+    return floors
+
+
+def _rescale_level(count: int, floors: dict[int, int], fallback: int) -> int:
+    """Level of a count under the base data's ranges; falls back without any."""
+    if count == 0:
+        return 0
+    if not floors:
+        return fallback
+    level = 1
+    for candidate, floor in sorted(floors.items()):
+        if count >= floor:
+            level = candidate
+    return level
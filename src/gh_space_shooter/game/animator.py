@@ -1,10 +1,13 @@
 """Animator for generating GIF animations from game strategies."""
 
 from io import BytesIO
+from itertools import islice
 from typing import Iterator
 
 from PIL import Image
 
+from .. import instrumentation
+from ..contribution_grid import ContributionGrid
 from ..github_client import ContributionData
 from .game_state import GameState
 from .renderer import Renderer
@@ -17,24 +20,27 @@ class Animator:
 
     def __init__(
         self,
-        contribution_data: ContributionData,
+        contribution_data: ContributionData | ContributionGrid,
         strategy: BaseStrategy,
         fps: int,
         watermark: bool = False,
+        seed: int | None = None,
     ):
         """
         Initialize animator.
 
         Args:
-            contribution_data: The GitHub contribution data
+            contribution_data: The GitHub contribution data or its grid
             strategy: The strategy to use for clearing enemies
             fps: Frames per second for the animation
             watermark: Whether to add watermark to the GIF
+            seed: Seed for the game's randomness; the same seed gives identical frames
         """
         self.contribution_data = contribution_data
         self.strategy = strategy
         self.fps = fps
         self.watermark = watermark
+        self.seed = seed
         self.frame_duration = 1000 // fps
         # Delta time in seconds per frame
         # Used to scale all speeds (cells/second) to per-frame movement
@@ -47,20 +53,38 @@ class Animator:
         Returns:
             Iterator of PIL Images representing animation frames
         """
-        game_state = GameState(self.contribution_data)
+        game_state = GameState(self.contribution_data, seed=self.seed)
         renderer = Renderer(game_state, RenderContext.darkmode(), watermark=self.watermark)
         
-        if max_frames is not None:
-            gen = self._generate_frames(game_state, renderer)
-            while max_frames > 0:
-                max_frames -= 1
-                yield next(gen)
-        else:
-            yield from self._generate_frames(game_state, renderer)
+        # Game logic is timed apart from rendering, and reported even if the caller stops early
+        simulate = instrumentation.Stopwatch(instrumentation.SIMULATE)
+        frames = 0
+        try:
+            # islice also stops cleanly when the animation is shorter than max_frames
+            for frame in islice(self._generate_frames(game_state, renderer, simulate), max_frames):
+                frames += 1
+                yield frame
+        finally:
+            simulate.report()
+            instrumentation.observe(instrumentation.FRAMES, frames)
+
+    def count_frames(self, max_frames: int | None = None) -> int:
+        """
+        Count the frames generate_frames would produce, without drawing them.
+
+        The game is simulated exactly as for rendering, so with a seed the count
+        is exact; it takes a small fraction of the rendering time.
+
+        Args:
+            max_frames: Maximum number of frames, as for generate_frames
+        """
+        game_state = GameState(self.contribution_data, seed=self.seed)
+        frames = self._generate_frames(game_state, _Undrawn(), instrumentation.Stopwatch(instrumentation.SIMULATE))
+        return sum(1 for _ in islice(frames, max_frames))
         
 
     def _generate_frames(
-        self, game_state: GameState, renderer: Renderer
+        self, game_state: GameState, renderer: "Renderer | _Undrawn", simulate: instrumentation.Stopwatch
     ) -> Iterator[Image.Image]:
         """
         Generate all animation frames.
@@ -68,6 +92,7 @@ class Animator:
         Args:
             game_state: The game state
             renderer: The renderer
+            simulate: Accumulates the time spent on game logic
 
         Returns:
             List of PIL Images representing animation frames
@@ -77,21 +102,24 @@ class Animator:
         yield renderer.render_frame()
 
         # Process each action from the strategy
-        for action in self.strategy.generate_actions(game_state):
+        for action in simulate.iterate(self.strategy.generate_actions(game_state)):
             game_state.ship.move_to(action.x)
             while game_state.can_take_action() is False:
-                game_state.animate(self.delta_time)
+                with simulate:
+                    game_state.animate(self.delta_time)
                 yield renderer.render_frame()
 
             if action.shoot:
-                game_state.shoot()
-                game_state.animate(self.delta_time)
+                with simulate:
+                    game_state.shoot()
+                    game_state.animate(self.delta_time)
                 yield renderer.render_frame()
 
         force_kill_countdown = 100
         # Add final frames showing completion
         while not game_state.is_complete():
-            game_state.animate(self.delta_time)
+            with simulate:
+                game_state.animate(self.delta_time)
             yield renderer.render_frame()
             
             force_kill_countdown -= 1
@@ -100,3 +128,10 @@ class Animator:
             
         for _ in range(5):
             yield renderer.render_frame()
+
+
+class _Undrawn:
+    """Stands in for a Renderer when only the number of frames matters."""
+
+    def render_frame(self) -> None:
+        return None
@@ -1,7 +1,6 @@
 """Explosion effects for bullet hits and enemy destruction."""
 
 import math
-import random
 from typing import TYPE_CHECKING, Literal
 
 from PIL import ImageDraw
@@ -41,7 +40,7 @@ class Explosion(Drawable):
         self.duration = EXPLOSION_DURATION_SMALL if size == "small" else EXPLOSION_DURATION_LARGE
         self.max_radius = EXPLOSION_MAX_RADIUS_SMALL if size == "small" else EXPLOSION_MAX_RADIUS_LARGE
         self.particle_count = EXPLOSION_PARTICLE_COUNT_SMALL if size == "small" else EXPLOSION_PARTICLE_COUNT_LARGE
-        self.particle_angles = [random.uniform(0, 2 * math.pi) for _ in range(self.particle_count)]
+        self.particle_angles = [game_state.rng.uniform(0, 2 * math.pi) for _ in range(self.particle_count)]
 
     def animate(self, delta_time: float) -> None:
         """Progress the explosion animation and remove when complete.
@@ -22,18 +22,24 @@ class Star(TypedDict):
 class Starfield(Drawable):
     """Animated starfield background with slowly moving stars."""
 
-    def __init__(self) -> None:
-        """Initialize the starfield with random stars."""
+    def __init__(self, rng: random.Random | None = None) -> None:
+        """
+        Initialize the starfield with random stars.
+
+        Args:
+            rng: Source of randomness (default: a fresh unseeded generator)
+        """
+        self.rng = rng or random.Random()
         self.stars: list[Star] = []
         # Generate about 100 stars across the play area
         for _ in range(100):
             # Random position across the entire grid area
-            x = random.uniform(-2, NUM_WEEKS + 2)
-            y = random.uniform(-2, SHIP_POSITION_Y + 4)
+            x = self.rng.uniform(-2, NUM_WEEKS + 2)
+            y = self.rng.uniform(-2, SHIP_POSITION_Y + 4)
             # Brightness: 0.2 to 1.0 (dimmer stars for depth)
-            brightness = random.uniform(0.2, 1.0)
+            brightness = self.rng.uniform(0.2, 1.0)
             # Size: 1-2 pixels
-            size = random.choice([1, 1, 1, 2])  # More 1-pixel stars
+            size = self.rng.choice([1, 1, 1, 2])  # More 1-pixel stars
             # Speed: slower for dimmer (farther) stars (in cells per second)
             speed = STAR_SPEED_MIN + (brightness * (STAR_SPEED_MAX - STAR_SPEED_MIN))
             self.stars.append(
@@ -53,7 +59,7 @@ class Starfield(Drawable):
             if star["y"] > SHIP_POSITION_Y + 4:
                 star["y"] = -2
                 # Randomize x position when wrapping for variety
-                star["x"] = random.uniform(-2, NUM_WEEKS + 2)
+                star["x"] = self.rng.uniform(-2, NUM_WEEKS + 2)
 
     def draw(self, draw: ImageDraw.ImageDraw, context: "RenderContext") -> None:
         """Draw all stars at their current positions."""
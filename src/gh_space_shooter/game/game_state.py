@@ -1,10 +1,12 @@
 """Game state management for tracking enemies, ship, and bullets."""
 
+import random
 from typing import TYPE_CHECKING, List
 
 from PIL import ImageDraw
 
 from ..constants import SHIP_SHOOT_COOLDOWN
+from ..contribution_grid import ContributionGrid
 from ..github_client import ContributionData
 from .drawables import Bullet, Drawable, Enemy, Explosion, Ship, Starfield
 
@@ -15,31 +17,31 @@ if TYPE_CHECKING:
 class GameState(Drawable):
     """Manages the current state of the game."""
 
-    def __init__(self, contribution_data: ContributionData):
+    def __init__(self, contribution_data: ContributionData | ContributionGrid, seed: int | None = None):
         """
         Initialize game state from contribution data.
 
         Args:
-            contribution_data: The GitHub contribution data
+            contribution_data: The GitHub contribution data or its grid
+            seed: Seed for all randomness in the game; the same seed replays the same game
         """
-        self.starfield = Starfield()
+        self.rng = random.Random(seed)
+        self.starfield = Starfield(self.rng)
         self.ship = Ship(self)
         self.enemies: List[Enemy] = []
         self.bullets: List[Bullet] = []
         self.explosions: List[Explosion] = []
 
+        if not isinstance(contribution_data, ContributionGrid):
+            contribution_data = ContributionGrid.from_contribution_data(contribution_data)
         self._initialize_enemies(contribution_data)
 
-    def _initialize_enemies(self, contribution_data: ContributionData):
+    def _initialize_enemies(self, grid: ContributionGrid):
         """Create enemies based on contribution levels."""
-        weeks = contribution_data["weeks"]
-        for week_idx, week in enumerate(weeks):
-            for day_idx, day in enumerate(week["days"]):
-                level = day["level"]
-                if level <= 0:
-                    continue
-                enemy = Enemy(x=week_idx, y=day_idx, health=level, game_state=self)
-                self.enemies.append(enemy)
+        self.enemies.extend(
+            Enemy(x=week_idx, y=day_idx, health=level, game_state=self)
+            for week_idx, day_idx, level in grid.active_cells()
+        )
 
     def shoot(self) -> None:
         """
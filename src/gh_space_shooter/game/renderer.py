@@ -2,6 +2,7 @@
 
 from PIL import Image, ImageDraw, ImageFont
 
+from .. import instrumentation
 from ..constants import NUM_WEEKS, SHIP_POSITION_Y
 from .game_state import GameState
 from .render_context import RenderContext
@@ -36,21 +37,22 @@ class Renderer:
         Returns:
             PIL Image of the current frame
         """
-        # Create image with background color
-        img = Image.new("RGB", (self.width, self.height), self.context.background_color)
+        with instrumentation.timed(instrumentation.FRAME_RENDER):
+            # Create image with background color
+            img = Image.new("RGB", (self.width, self.height), self.context.background_color)
 
-        # Draw game state
-        overlay = Image.new("RGBA", (self.width, self.height), (0, 0, 0, 0))
-        draw = ImageDraw.Draw(overlay, "RGBA")
-        self.game_state.draw(draw, self.context)
+            # Draw game state
+            overlay = Image.new("RGBA", (self.width, self.height), (0, 0, 0, 0))
+            draw = ImageDraw.Draw(overlay, "RGBA")
+            self.game_state.draw(draw, self.context)
 
-        # Draw watermark if enabled
-        if self.watermark:
-            self._draw_watermark(draw)
+            # Draw watermark if enabled
+            if self.watermark:
+                self._draw_watermark(draw)
 
-        combined = Image.alpha_composite(img.convert("RGBA"), overlay)
+            combined = Image.alpha_composite(img.convert("RGBA"), overlay)
 
-        return combined.convert("RGB")
+            return combined.convert("RGB")
 
     def _draw_watermark(self, draw: ImageDraw.ImageDraw) -> None:
         """Draw watermark text in the bottom-right corner."""
@@ -1,6 +1,5 @@
 """Random strategy: Pick random columns and shoot from bottom up."""
 
-import random
 from typing import TYPE_CHECKING, Iterator
 
 from .base_strategy import Action, BaseStrategy
@@ -52,7 +51,7 @@ class RandomStrategy(BaseStrategy):
                     weights.append(1)
 
             # Choose randomly with weights
-            target_column = random.choices(candidate_columns, weights=weights)[0]
+            target_column = game_state.rng.choices(candidate_columns, weights=weights)[0]
 
             enemies_in_column = [e for e in game_state.enemies if e.x == target_column]
             lowest_enemy = max(enemies_in_column, key=lambda e: e.y)
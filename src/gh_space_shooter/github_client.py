@@ -1,15 +1,23 @@
 """GitHub API client for fetching contribution graph data."""
 
-from datetime import datetime
-from typing import TypedDict
+import asyncio
+import json
+import os
+import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import date, datetime, timedelta, timezone
+from typing import TYPE_CHECKING, TypedDict
 
 import httpx
-from dotenv import load_dotenv
 
+from . import instrumentation
 from .constants import NUM_WEEKS
+from .contribution_grid import ContributionGrid
+from .contribution_history import last_contribution_date, merge_contribution_data, stitch_contribution_data
+from .rate_limit import TRANSIENT_STATUSES, RateLimitStatus, RetryPolicy
 
-# Load environment variables from .env file
-load_dotenv()
+if TYPE_CHECKING:
+    from .contribution_cache import CacheEntry, ContributionCache
 
 
 class ContributionDay(TypedDict):
@@ -34,14 +42,35 @@ class ContributionData(TypedDict):
     weeks: list[ContributionWeek]
 
 
+class ContributionBatch(TypedDict):
+    """Per-user results and errors of a batched contribution fetch."""
+
+    results: dict[str, ContributionData]
+    errors: dict[str, str]
+
+
 class GitHubAPIError(Exception):
     """Raised when GitHub API request fails."""
 
     pass
 
 
-class GitHubClient:
-    """Client for interacting with GitHub's GraphQL API."""
+class GitHubUserNotFoundError(GitHubAPIError):
+    """Raised when the requested GitHub user does not exist."""
+
+    pass
+
+
+class GitHubRateLimitError(GitHubAPIError):
+    """Raised when the rate limit is exhausted and the retry policy gives up."""
+
+    def __init__(self, message: str, reset_at: float | None = None):
+        super().__init__(message)
+        self.reset_at = reset_at
+
+
+class BaseGitHubClient:
+    """Request building and response parsing shared by the sync and async clients."""
 
     GITHUB_API_URL = "https://api.github.com/graphql"
     GET_CONTRIBUTION_GRAPH_QUERY = """
@@ -62,60 +91,284 @@ class GitHubClient:
             }
         }
     """
-
-    def __init__(self, token: str):
+    CONTRIBUTION_CALENDAR_FRAGMENT = """
+        fragment calendar on User {
+            contributionsCollection {
+                contributionCalendar {
+                totalContributions
+                weeks {
+                    contributionDays {
+                    date
+                    contributionCount
+                    contributionLevel
+                    }
+                }
+                }
+            }
+        }
+    """
+    # Calendar for an explicit date range, used for incremental updates
+    GET_CONTRIBUTION_WINDOW_QUERY = """
+        query($username: String!, $from: DateTime!, $to: DateTime!) {
+            user(login: $username) {
+            contributionsCollection(from: $from, to: $to) {
+                contributionCalendar {
+                totalContributions
+                weeks {
+                    contributionDays {
+                    date
+                    contributionCount
+                    contributionLevel
+                    }
+                }
+                }
+            }
+            }
+        }
+    """
+    # Only the total, used to cheaply revalidate stale cache entries
+    GET_CONTRIBUTION_TOTAL_QUERY = """
+        query($username: String!) {
+            user(login: $username) {
+            contributionsCollection {
+                contributionCalendar {
+                totalContributions
+                }
+            }
+            }
+        }
+    """
+    # Users per batched query, keeps each query well under GraphQL cost limits
+    BATCH_SIZE = 25
+    # Days before the last saved day to refetch, since the last day may have been partial
+    UPDATE_OVERLAP_DAYS = 1
+    # Concurrent requests when fetching a multi-year range
+    MAX_CONCURRENT_WINDOWS = 4
+
+    def __init__(
+        self,
+        token: str,
+        cache: "ContributionCache | None" = None,
+        retry_policy: RetryPolicy | None = None,
+    ):
         """
         Initialize GitHub client.
 
         Args:
             token: GitHub personal access token (required).
+            cache: Optional on-disk cache for contribution graphs.
+            retry_policy: How to retry transient failures and exhausted rate limits.
         """
         self.token = token
-        self.client = httpx.Client(
-            headers={
-                "Authorization": f"Bearer {self.token}",
-                "Content-Type": "application/json",
-            },
-            timeout=30.0,
-        )
-
-    def __enter__(self):
-        """Context manager entry."""
-        return self
+        self.cache = cache
+        self.retry_policy = retry_policy or RetryPolicy()
+        # Read on construction rather than import, so .env files loaded by the entry points apply;
+        # overridable to point the clients at a stub server, e.g. for load tests. Not GITHUB_API_URL:
+        # GitHub Actions sets that to the REST API root, which has no /graphql path
+        self.GITHUB_API_URL = os.getenv("GH_SPACE_SHOOTER_GRAPHQL_URL") or self.GITHUB_API_URL
+        # Budget reported by the most recent response, for callers to schedule around
+        self.rate_limit: RateLimitStatus | None = None
+
+    def _headers(self) -> dict[str, str]:
+        return {
+            "Authorization": f"Bearer {self.token}",
+            "Content-Type": "application/json",
+        }
 
-    def __exit__(self, exc_type, exc_val, exc_tb):
-        """Context manager exit - close HTTP client."""
-        self.close()
+    def _contribution_graph_payload(self, username: str) -> dict:
+        return {
+            "query": self.GET_CONTRIBUTION_GRAPH_QUERY,
+            "variables": {"username": username},
+        }
 
-    def close(self):
-        self.client.close()
+    def _contribution_window_payload(self, username: str, start: date, end: date) -> dict:
+        return {
+            "query": self.GET_CONTRIBUTION_WINDOW_QUERY,
+            "variables": {
+                "username": username,
+                "from": f"{start.isoformat()}T00:00:00Z",
+                "to": f"{end.isoformat()}T23:59:59Z",
+            },
+        }
 
-    def get_contribution_graph(self, username: str) -> ContributionData:
+    def _year_windows(self, start: date, end: date) -> list[tuple[date, date]]:
         """
-        Fetch contribution graph for a GitHub user (last 52 weeks).
-
-        Args:
-            username: GitHub username to fetch data for
-
-        Returns:
-            ContributionData with user's contribution information
+        Split a date range into windows GitHub accepts (at most a year each).
 
         Raises:
-            GitHubAPIError: If the API request fails
+            ValueError: If start is after end
+        """
+        if start > end:
+            raise ValueError(f"Start date {start} is after end date {end}")
+        windows = []
+        while start <= end:
+            # Same day next year (Feb 29 rolls to Mar 1)
+            next_start = date(start.year + 1, 3, 1) if (start.month, start.day) == (2, 29) else start.replace(year=start.year + 1)
+            window_end = min(next_start - timedelta(days=1), end)
+            windows.append((start, window_end))
+            start = window_end + timedelta(days=1)
+        return windows
+
+    def _update_window(self, previous: ContributionData) -> tuple[date, date] | None:
+        """Date range to fetch to bring previous data up to date, or None for a full fetch."""
+        last = last_contribution_date(previous)
+        today = datetime.now(timezone.utc).date()
+        if last is None or (today - last).days >= NUM_WEEKS * 7:
+            return None
+        return min(last, today) - timedelta(days=self.UPDATE_OVERLAP_DAYS), today
+
+    def _record_rate_limit(self, response: httpx.Response) -> None:
+        status = RateLimitStatus.from_headers(response.headers)
+        if status is not None:
+            self.rate_limit = status
+
+    def _is_rate_limited(self, response: httpx.Response) -> bool:
+        if response.status_code == 429:
+            return True
+        if response.status_code == 403:
+            return (
+                "retry-after" in response.headers
+                or response.headers.get("x-ratelimit-remaining") == "0"
+                or "rate limit" in response.text.lower()
+            )
+        if response.status_code == 200 and b"RATE_LIMITED" in response.content:
+            try:
+                errors = response.json().get("errors") or []
+            except json.JSONDecodeError:
+                return False
+            return any(error.get("type") == "RATE_LIMITED" for error in errors)
+        return False
+
+    def _should_retry(self, response: httpx.Response) -> bool:
+        return response.status_code in TRANSIENT_STATUSES or self._is_rate_limited(response)
+
+    def _retry_delay(self, attempt: int, response: httpx.Response | None) -> float | None:
+        rate_limited = response is not None and self._is_rate_limited(response)
+        return self.retry_policy.retry_delay(attempt, response, self.rate_limit, rate_limited)
+
+    def _preflight_delay(self) -> float:
         """
+        Seconds to wait before the next request given the known budget.
 
+        Raises:
+            GitHubRateLimitError: If the quota is exhausted and the policy fails fast
+        """
+        delay = self.retry_policy.wait_before_request(self.rate_limit)
+        if delay is None:
+            raise self._rate_limit_error()
+        return delay
+
+    def _rate_limit_error(self) -> GitHubRateLimitError:
+        reset_at = self.rate_limit.reset_at if self.rate_limit else None
+        when = f", resets at {datetime.fromtimestamp(reset_at, timezone.utc):%H:%M:%S} UTC" if reset_at else ""
+        return GitHubRateLimitError(f"GitHub API rate limit exceeded{when}", reset_at)
+
+    def _raise_for_response(self, response: httpx.Response) -> httpx.Response:
+        """Turn a failed response into GitHubAPIError; returns successful ones."""
+        if self._is_rate_limited(response):
+            raise self._rate_limit_error()
         try:
-            response = self.client.post(
-                self.GITHUB_API_URL,
-                json={
-                    "query": self.GET_CONTRIBUTION_GRAPH_QUERY, 
-                    "variables": {"username": username}
-                },
-            )
             response.raise_for_status()
         except httpx.HTTPError as e:
             raise GitHubAPIError(f"Failed to fetch data from GitHub API: {e}") from e
+        return response
+
+    def _revalidation_payload(self, username: str) -> dict:
+        return {
+            "query": self.GET_CONTRIBUTION_TOTAL_QUERY,
+            "variables": {"username": username},
+        }
+
+    def _cache_window(self) -> str:
+        """Cache key for the default trailing-year window, which moves daily."""
+        return f"year-to-{datetime.now(timezone.utc).date().isoformat()}"
+
+    def _from_cache(self, entry: "CacheEntry") -> ContributionData:
+        if entry.error is not None:
+            raise GitHubUserNotFoundError(entry.error)
+        assert entry.data is not None
+        return entry.data
+
+    def _is_unchanged(self, entry: "CacheEntry", response: httpx.Response) -> bool:
+        """Check a revalidation response against a stale cache entry."""
+        user = (response.json().get("data") or {}).get("user")
+        if not user or entry.data is None:
+            return False
+        total = user["contributionsCollection"]["contributionCalendar"]["totalContributions"]
+        return total == entry.data["total_contributions"]
+
+    def _take_cached(self, usernames: list[str], batch: ContributionBatch) -> list[str]:
+        """Fill the batch from fresh cache entries; returns usernames still to fetch."""
+        if self.cache is None:
+            return usernames
+
+        window = self._cache_window()
+        remaining = []
+        for username in usernames:
+            entry = self.cache.get(username, window)
+            if entry is not None and entry.fresh:
+                if entry.error is not None:
+                    batch["errors"][username] = entry.error
+                else:
+                    batch["results"][username] = self._from_cache(entry)
+            else:
+                remaining.append(username)
+        return remaining
+
+    def _store_batch(self, batch: ContributionBatch, missing: set[str]) -> None:
+        """Cache fetched results, and the errors of users GitHub reported as not found."""
+        if self.cache is None:
+            return
+
+        window = self._cache_window()
+        for username, data in batch["results"].items():
+            self.cache.put(username, window, data)
+        for username in missing:
+            self.cache.put_missing(username, window, batch["errors"][username])
+
+    def _batch_payload(self, usernames: list[str]) -> dict:
+        """Build one query fetching every user under an alias (u0, u1, ...)."""
+        declarations = ", ".join(f"$u{idx}: String!" for idx in range(len(usernames)))
+        fields = " ".join(f"u{idx}: user(login: $u{idx}) {{ ...calendar }}" for idx in range(len(usernames)))
+        return {
+            "query": f"query({declarations}) {{ {fields} }} {self.CONTRIBUTION_CALENDAR_FRAGMENT}",
+            "variables": {f"u{idx}": username for idx, username in enumerate(usernames)},
+        }
+
+    def _batches(self, usernames: list[str], batch_size: int | None) -> list[list[str]]:
+        """Split unique usernames into chunks for batched queries."""
+        unique = list(dict.fromkeys(usernames))
+        size = batch_size or self.BATCH_SIZE
+        return [unique[idx:idx + size] for idx in range(0, len(unique), size)]
+
+    def _parse_contribution_graph(
+        self, username: str, response: httpx.Response, num_weeks: int | None = NUM_WEEKS
+    ) -> ContributionData:
+        """
+        Parse a contribution graph GraphQL response.
+
+        Args:
+            username: User the response is for
+            response: GraphQL response
+            num_weeks: Most recent weeks to keep, or None to keep all
+
+        Raises:
+            GitHubAPIError: If the response carries errors or the user does not exist
+        """
+        return self._parse_calendar(username, self._user_node(username, response), num_weeks)
 
+    def _parse_contribution_grid(self, username: str, response: httpx.Response) -> ContributionGrid:
+        """
+        Parse a contribution graph GraphQL response straight into a grid.
+
+        Raises:
+            GitHubAPIError: If the response carries errors or the user does not exist
+        """
+        calendar = self._user_node(username, response)["contributionsCollection"]["contributionCalendar"]
+        return ContributionGrid.from_calendar(username, calendar, self.LEVEL_MAP, NUM_WEEKS)
+
+    def _user_node(self, username: str, response: httpx.Response) -> dict:
+        """Extract the user node, raising on GraphQL errors or a missing user."""
         data = response.json()
 
         # Check for GraphQL errors
@@ -126,12 +379,54 @@ class GitHubClient:
 
         # Check if user exists
         if not data.get("data", {}).get("user"):
-            raise GitHubAPIError(f"User '{username}' not found")
+            raise GitHubUserNotFoundError(f"User '{username}' not found")
+
+        return data["data"]["user"]
+
+    def _parse_batch(self, usernames: list[str], response: httpx.Response, batch: ContributionBatch) -> set[str]:
+        """
+        Parse an aliased batch response into per-user results and errors.
 
+        Returns:
+            Usernames GitHub reported as not found
+        """
+        data = response.json()
+
+        # Errors carrying a path belong to one alias; others affect the whole batch
+        alias_errors: dict[str, list[str]] = {}
+        global_errors: list[str] = []
+        other_error_aliases: set[str] = set()
+        for error in data.get("errors", []):
+            message = error.get("message", str(error))
+            path = error.get("path") or []
+            if path:
+                alias_errors.setdefault(str(path[0]), []).append(message)
+                if error.get("type") != "NOT_FOUND":
+                    other_error_aliases.add(str(path[0]))
+            else:
+                global_errors.append(message)
+
+        users = data.get("data") or {}
+        missing: set[str] = set()
+        for idx, username in enumerate(usernames):
+            alias = f"u{idx}"
+            if users.get(alias):
+                batch["results"][username] = self._parse_calendar(username, users[alias])
+            elif alias in alias_errors:
+                batch["errors"][username] = ", ".join(alias_errors[alias])
+                if alias not in other_error_aliases:
+                    missing.add(username)
+            elif global_errors:
+                batch["errors"][username] = ", ".join(global_errors)
+            else:
+                batch["errors"][username] = f"User '{username}' not found"
+                missing.add(username)
+        return missing
+
+    def _parse_calendar(self, username: str, user: dict, num_weeks: int | None = NUM_WEEKS) -> ContributionData:
+        """Convert a GraphQL user node into ContributionData."""
         # Extract contribution data
-        calendar = data["data"]["user"]["contributionsCollection"][
-            "contributionCalendar"
-        ]
+        calendar = user["contributionsCollection"]["contributionCalendar"]
 
         # Parse weeks and days
         weeks: list[ContributionWeek] = []
@@ -149,8 +444,9 @@ class GitHubClient:
                 )
             weeks.append({"days": days})
 
-        # Always return exactly NUM_WEEKS (truncate if more)
-        weeks = weeks[-NUM_WEEKS:] if len(weeks) > NUM_WEEKS else weeks
+        # Keep the most recent num_weeks (truncate if more)
+        if num_weeks is not None and len(weeks) > num_weeks:
+            weeks = weeks[-num_weeks:]
 
         return {
             "username": username,
@@ -168,3 +464,435 @@ class GitHubClient:
 
     def _contribution_level_to_int(self, level: str) -> int:
         return self.LEVEL_MAP.get(level, 0)
+
+
+class GitHubClient(BaseGitHubClient):
+    """Client for interacting with GitHub's GraphQL API."""
+
+    def __init__(
+        self,
+        token: str,
+        client: httpx.Client | None = None,
+        cache: "ContributionCache | None" = None,
+        retry_policy: RetryPolicy | None = None,
+    ):
+        """
+        Initialize GitHub client.
+
+        Args:
+            token: GitHub personal access token (required).
+            client: Optional shared HTTP client; one is created (and closed) otherwise.
+            cache: Optional on-disk cache for contribution graphs.
+            retry_policy: How to retry transient failures and exhausted rate limits.
+        """
+        super().__init__(token, cache, retry_policy)
+        self._owns_client = client is None
+        self.client = client or httpx.Client(timeout=30.0)
+
+    def __enter__(self):
+        """Context manager entry."""
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        """Context manager exit - close HTTP client."""
+        self.close()
+
+    def close(self):
+        if self._owns_client:
+            self.client.close()
+
+    def get_contribution_graph(self, username: str) -> ContributionData:
+        """
+        Fetch contribution graph for a GitHub user (last 52 weeks).
+
+        Args:
+            username: GitHub username to fetch data for
+
+        Returns:
+            ContributionData with user's contribution information
+
+        Raises:
+            GitHubAPIError: If the API request fails
+        """
+        if self.cache is None:
+            return self._fetch_contribution_graph(username)
+
+        window = self._cache_window()
+        entry = self.cache.get(username, window)
+        if entry is not None and entry.fresh:
+            return self._from_cache(entry)
+
+        if entry is not None:
+            try:
+                response = self._post(self._revalidation_payload(username))
+                if self._is_unchanged(entry, response):
+                    self.cache.touch(username, window)
+                    return self._from_cache(entry)
+            except GitHubAPIError:
+                pass  # Fall back to a full fetch
+
+        try:
+            data = self._fetch_contribution_graph(username)
+        except GitHubUserNotFoundError as e:
+            self.cache.put_missing(username, window, str(e))
+            raise
+        self.cache.put(username, window, data)
+        return data
+
+    def _fetch_contribution_graph(self, username: str) -> ContributionData:
+        response = self._post(self._contribution_graph_payload(username))
+        return self._parse_contribution_graph(username, response)
+
+    def get_contribution_grid(self, username: str) -> ContributionGrid:
+        """
+        Fetch contribution graph for a GitHub user as a ContributionGrid.
+
+        Without a cache the grid is built straight from the response, skipping
+        the per-day dicts of ContributionData.
+
+        Raises:
+            GitHubAPIError: If the API request fails
+        """
+        if self.cache is not None:
+            return ContributionGrid.from_contribution_data(self.get_contribution_graph(username))
+        response = self._post(self._contribution_graph_payload(username))
+        return self._parse_contribution_grid(username, response)
+
+    def get_contribution_window(self, username: str, start: date, end: date) -> ContributionData:
+        """
+        Fetch contribution days between two dates (inclusive, at most a year apart).
+
+        Levels are assigned by GitHub relative to this window only.
+
+        Raises:
+            GitHubAPIError: If the API request fails
+        """
+        response = self._post(self._contribution_window_payload(username, start, end))
+        return self._parse_contribution_graph(username, response, num_weeks=None)
+
+    def get_contribution_range(
+        self, username: str, start: date, end: date, max_concurrency: int | None = None
+    ) -> ContributionData:
+        """
+        Fetch contribution days for a range that may span several years.
+
+        The range is split into per-year windows which are fetched concurrently
+        and stitched into one continuous week sequence.
+
+        Args:
+            username: GitHub username to fetch data for
+            start: First day of the range
+            end: Last day of the range (inclusive)
+            max_concurrency: Concurrent requests (defaults to MAX_CONCURRENT_WINDOWS)
+
+        Returns:
+            ContributionData covering the whole range, with levels relative to each year
+
+        Raises:
+            GitHubAPIError: If any window fails to fetch
+            ValueError: If start is after end
+        """
+        windows = self._year_windows(start, end)
+        workers = min(len(windows), max_concurrency or self.MAX_CONCURRENT_WINDOWS)
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            parts = list(executor.map(lambda window: self.get_contribution_window(username, *window), windows))
+        return stitch_contribution_data(parts)
+
+    def update_contribution_graph(self, previous: ContributionData) -> ContributionData:
+        """
+        Bring previously fetched contribution data up to date.
+
+        Only the days since the last saved day are fetched and merged in, rolling
+        the weeks forward; data older than the graph falls back to a full fetch.
+
+        Args:
+            previous: Contribution data saved by an earlier run
+
+        Returns:
+            Up-to-date ContributionData with the total recomputed
+
+        Raises:
+            GitHubAPIError: If the API request fails
+        """
+        window = self._update_window(previous)
+        if window is None:
+            return self.get_contribution_graph(previous["username"])
+        update = self.get_contribution_window(previous["username"], *window)
+        return merge_contribution_data(previous, update)
+
+    def get_contribution_graphs(
+        self, usernames: list[str], batch_size: int | None = None
+    ) -> ContributionBatch:
+        """
+        Fetch contribution graphs for many users with one query per batch.
+
+        Args:
+            usernames: GitHub usernames to fetch data for
+            batch_size: Users per query (defaults to BATCH_SIZE)
+
+        Returns:
+            ContributionBatch with results and errors keyed by username.
+            A failed request is reported as an error for every user in its batch.
+        """
+        batch: ContributionBatch = {"results": {}, "errors": {}}
+        fetched: ContributionBatch = {"results": {}, "errors": {}}
+        missing: set[str] = set()
+        remaining = self._take_cached(usernames, batch)
+        for chunk in self._batches(remaining, batch_size):
+            try:
+                response = self._post(self._batch_payload(chunk))
+            except GitHubAPIError as e:
+                fetched["errors"].update({username: str(e) for username in chunk})
+                continue
+            missing |= self._parse_batch(chunk, response, fetched)
+
+        self._store_batch(fetched, missing)
+        batch["results"].update(fetched["results"])
+        batch["errors"].update(fetched["errors"])
+        return batch
+
+    def _post(self, payload: dict) -> httpx.Response:
+        """Send a GraphQL request, retrying according to the retry policy."""
+        with instrumentation.timed(instrumentation.GITHUB_FETCH):
+            time.sleep(self._preflight_delay())
+
+            attempt = 0
+            while True:
+                try:
+                    response = self.client.post(
+                        self.GITHUB_API_URL,
+                        json=payload,
+                        headers=self._headers(),
+                    )
+                except httpx.TransportError as e:
+                    delay = self._retry_delay(attempt, None)
+                    if delay is None:
+                        raise GitHubAPIError(f"Failed to fetch data from GitHub API: {e}") from e
+                else:
+                    self._record_rate_limit(response)
+                    if not self._should_retry(response):
+                        return self._raise_for_response(response)
+                    delay = self._retry_delay(attempt, response)
+                    if delay is None:
+                        return self._raise_for_response(response)
+
+                time.sleep(delay)
+                attempt += 1
+
+
+class AsyncGitHubClient(BaseGitHubClient):
+    """Asyncio client for GitHub's GraphQL API, suited to sharing one pooled connection."""
+
+    def __init__(
+        self,
+        token: str,
+        client: httpx.AsyncClient | None = None,
+        cache: "ContributionCache | None" = None,
+        retry_policy: RetryPolicy | None = None,
+    ):
+        """
+        Initialize async GitHub client.
+
+        Args:
+            token: GitHub personal access token (required).
+            client: Optional shared HTTP client; one is created (and closed) otherwise.
+                Pass a long-lived client to reuse keep-alive connections across requests.
+            cache: Optional on-disk cache for contribution graphs.
+            retry_policy: How to retry transient failures and exhausted rate limits.
+        """
+        super().__init__(token, cache, retry_policy)
+        self._owns_client = client is None
+        self.client = client or httpx.AsyncClient(timeout=30.0)
+
+    async def __aenter__(self):
+        """Async context manager entry."""
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        """Async context manager exit - close HTTP client if owned."""
+        await self.aclose()
+
+    async def aclose(self):
+        if self._owns_client:
+            await self.client.aclose()
+
+    async def get_contribution_graph(self, username: str) -> ContributionData:
+        """
+        Fetch contribution graph for a GitHub user (last 52 weeks).
+
+        Args:
+            username: GitHub username to fetch data for
+
+        Returns:
+            ContributionData with user's contribution information
+
+        Raises:
+            GitHubAPIError: If the API request fails
+        """
+        if self.cache is None:
+            return await self._fetch_contribution_graph(username)
+
+        window = self._cache_window()
+        entry = self.cache.get(username, window)
+        if entry is not None and entry.fresh:
+            return self._from_cache(entry)
+
+        if entry is not None:
+            try:
+                response = await self._post(self._revalidation_payload(username))
+                if self._is_unchanged(entry, response):
+                    self.cache.touch(username, window)
+                    return self._from_cache(entry)
+            except GitHubAPIError:
+                pass  # Fall back to a full fetch
+
+        try:
+            data = await self._fetch_contribution_graph(username)
+        except GitHubUserNotFoundError as e:
+            self.cache.put_missing(username, window, str(e))
+            raise
+        self.cache.put(username, window, data)
+        return data
+
+    async def _fetch_contribution_graph(self, username: str) -> ContributionData:
+        response = await self._post(self._contribution_graph_payload(username))
+        return self._parse_contribution_graph(username, response)
+
+    async def get_contribution_grid(self, username: str) -> ContributionGrid:
+        """
+        Fetch contribution graph for a GitHub user as a ContributionGrid.
+
+        Without a cache the grid is built straight from the response, skipping
+        the per-day dicts of ContributionData.
+
+        Raises:
+            GitHubAPIError: If the API request fails
+        """
+        if self.cache is not None:
+            return ContributionGrid.from_contribution_data(await self.get_contribution_graph(username))
+        response = await self._post(self._contribution_graph_payload(username))
+        return self._parse_contribution_grid(username, response)
+
+    async def get_contribution_window(self, username: str, start: date, end: date) -> ContributionData:
+        """
+        Fetch contribution days between two dates (inclusive, at most a year apart).
+
+        Levels are assigned by GitHub relative to this window only.
+
+        Raises:
+            GitHubAPIError: If the API request fails
+        """
+        response = await self._post(self._contribution_window_payload(username, start, end))
+        return self._parse_contribution_graph(username, response, num_weeks=None)
+
+    async def get_contribution_range(
+        self, username: str, start: date, end: date, max_concurrency: int | None = None
+    ) -> ContributionData:
+        """
+        Fetch contribution days for a range that may span several years.
+
+        The range is split into per-year windows which are fetched concurrently
+        and stitched into one continuous week sequence.
+
+        Args:
+            username: GitHub username to fetch data for
+            start: First day of the range
+            end: Last day of the range (inclusive)
+            max_concurrency: Concurrent requests (defaults to MAX_CONCURRENT_WINDOWS)
+
+        Returns:
+            ContributionData covering the whole range, with levels relative to each year
+
+        Raises:
+            GitHubAPIError: If any window fails to fetch
+            ValueError: If start is after end
+        """
+        semaphore = asyncio.Semaphore(max_concurrency or self.MAX_CONCURRENT_WINDOWS)
+
+        async def fetch(window: tuple[date, date]) -> ContributionData:
+            async with semaphore:
+                return await self.get_contribution_window(username, *window)
+
+        parts = await asyncio.gather(*(fetch(window) for window in self._year_windows(start, end)))
+        return stitch_contribution_data(list(parts))
+
+    async def update_contribution_graph(self, previous: ContributionData) -> ContributionData:
+        """
+        Bring previously fetched contribution data up to date.
+
+        Only the days since the last saved day are fetched and merged in, rolling
+        the weeks forward; data older than the graph falls back to a full fetch.
+
+        Args:
+            previous: Contribution data saved by an earlier run
+
+        Returns:
+            Up-to-date ContributionData with the total recomputed
+
+        Raises:
+            GitHubAPIError: If the API request fails
+        """
+        window = self._update_window(previous)
+        if window is None:
+            return await self.get_contribution_graph(previous["username"])
+        update = await self.get_contribution_window(previous["username"], *window)
+        return merge_contribution_data(previous, update)
+
+    async def get_contribution_graphs(
+        self, usernames: list[str], batch_size: int | None = None
+    ) -> ContributionBatch:
+        """
+        Fetch contribution graphs for many users with one query per batch.
+
+        Args:
+            usernames: GitHub usernames to fetch data for
+            batch_size: Users per query (defaults to BATCH_SIZE)
+
+        Returns:
+            ContributionBatch with results and errors keyed by username.
+            A failed request is reported as an error for every user in its batch.
+        """
+        batch: ContributionBatch = {"results": {}, "errors": {}}
+        fetched: ContributionBatch = {"results": {}, "errors": {}}
+        missing: set[str] = set()
+        remaining = self._take_cached(usernames, batch)
+        for chunk in self._batches(remaining, batch_size):
+            try:
+                response = await self._post(self._batch_payload(chunk))
+            except GitHubAPIError as e:
+                fetched["errors"].update({username: str(e) for username in chunk})
+                continue
+            missing |= self._parse_batch(chunk, response, fetched)
+
+        self._store_batch(fetched, missing)
+        batch["results"].update(fetched["results"])
+        batch["errors"].update(fetched["errors"])
+        return batch
+
+    async def _post(self, payload: dict) -> httpx.Response:
+        """Send a GraphQL request, retrying according to the retry policy."""
+        with instrumentation.timed(instrumentation.GITHUB_FETCH):
+            await asyncio.sleep(self._preflight_delay())
+
+            attempt = 0
+            while True:
+                try:
+                    response = await self.client.post(
+                        self.GITHUB_API_URL,
+                        json=payload,
+                        headers=self._headers(),
+                    )
+                except httpx.TransportError as e:
+                    delay = self._retry_delay(attempt, None)
+                    if delay is None:
+                        raise GitHubAPIError(f"Failed to fetch data from GitHub API: {e}") from e
+                else:
+                    self._record_rate_limit(response)
+                    if not self._should_retry(response):
+                        return self._raise_for_response(response)
+                    delay = self._retry_delay(attempt, response)
+                    if delay is None:
+                        return self._raise_for_response(response)
+
+                await asyncio.sleep(delay)
+                attempt += 1
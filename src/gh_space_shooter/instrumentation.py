@@ -0,0 +1,94 @@
+"""Timing hooks for observing where fetching and rendering spend their time."""
+
+import time
+from contextlib import contextmanager
+from typing import Callable, Iterable, Iterator, TypeVar
+
+T = TypeVar("T")
+
+# Observation names reported by the library
+GITHUB_FETCH = "github.fetch"  # seconds per GraphQL request, retries included
+DATA_LOAD = "data.load"  # seconds per contribution data file read
+SIMULATE = "animator.simulate"  # seconds of game simulation per animation
+FRAMES = "animator.frames"  # frames produced per animation
+FRAME_RENDER = "renderer.frame"  # seconds per rendered frame
+ENCODE = "output.encode"  # seconds of encoding per animation
+OUTPUT_BYTES = "output.bytes"  # size of each encoded animation
+WRITE = "output.write"  # seconds writing each output to disk
+
+_DONE = object()
+
+Hook = Callable[[str, float], None]
+
+_hooks: list[Hook] = []
+
+
+def add_hook(hook: Hook) -> None:
+    """Call hook(name, value) for every observation made from now on."""
+    _hooks.append(hook)
+
+
+def remove_hook(hook: Hook) -> None:
+    """Stop calling a hook registered with add_hook."""
+    _hooks.remove(hook)
+
+
+def observe(name: str, value: float) -> None:
+    """Report a single observation to every registered hook."""
+    for hook in _hooks:
+        hook(name, value)
+
+
+@contextmanager
+def timed(name: str) -> Iterator[None]:
+    """Report the wall time spent in the block as an observation."""
+    if not _hooks:
+        yield
+        return
+    started = time.perf_counter()
+    try:
+        yield
+    finally:
+        observe(name, time.perf_counter() - started)
+
+
+@contextmanager
+def recording() -> Iterator[list[tuple[str, float]]]:
+    """Collect the observations made in the block, e.g. to ship them out of a worker process."""
+    samples: list[tuple[str, float]] = []
+    hook: Hook = lambda name, value: samples.append((name, value))
+    add_hook(hook)
+    try:
+        yield samples
+    finally:
+        remove_hook(hook)
+
+
+class Stopwatch:
+    """Accumulates time over many short blocks and reports it once."""
+
+    __slots__ = ("name", "seconds", "_started")
+
+    def __init__(self, name: str):
+        self.name = name
+        self.seconds = 0.0
+
+    def __enter__(self) -> "Stopwatch":
+        self._started = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.seconds += time.perf_counter() - self._started
+
+    def iterate(self, items: Iterable[T]) -> Iterator[T]:
+        """Yield from items, timing the work done to produce each one."""
+        iterator = iter(items)
+        while True:
+            with self:
+                item = next(iterator, _DONE)
+            if item is _DONE:
+                return
+            yield item  # type: ignore[misc]
+
+    def report(self) -> None:
+        observe(self.name, self.seconds)
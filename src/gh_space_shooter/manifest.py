@@ -0,0 +1,67 @@
+"""Manifests recording what an output was rendered from, so unchanged outputs are not rendered again."""
+
+import hashlib
+import json
+from pathlib import Path
+
+# Written next to the output, e.g. game.gif -> game.gif.manifest.json
+MANIFEST_SUFFIX = ".manifest.json"
+
+# Bumped when the manifest layout changes, so old manifests never match
+MANIFEST_VERSION = 1
+
+
+def manifest_path(output_path: str) -> Path:
+    return Path(output_path + MANIFEST_SUFFIX)
+
+
+def package_version() -> str:
+    """Installed version of gh-space-shooter; renders from other versions may differ."""
+    from importlib.metadata import PackageNotFoundError, version
+
+    try:
+        return version("gh-space-shooter")
+    except PackageNotFoundError:
+        return "unknown"
+
+
+def is_up_to_date(output_path: str, inputs: dict, verify_output: bool = True) -> bool:
+    """
+    Check whether an output was rendered from these inputs by this package version.
+
+    Args:
+        output_path: Output file the manifest sits next to
+        inputs: JSON-serializable render inputs, e.g. the data hash and settings
+        verify_output: Also require the output to be byte-for-byte what was written;
+            disable for files that hold other content too (e.g. a README with a data URL)
+    """
+    try:
+        manifest = json.loads(manifest_path(output_path).read_text())
+    except (OSError, ValueError):
+        return False
+    if manifest != _manifest(inputs, manifest.get("output_sha256")):
+        return False
+    try:
+        return not verify_output or _file_digest(output_path) == manifest["output_sha256"]
+    except OSError:
+        return False
+
+
+def write_manifest(output_path: str, inputs: dict, verify_output: bool = True) -> None:
+    """Record the inputs of a freshly written output next to it."""
+    digest = _file_digest(output_path) if verify_output else None
+    manifest_path(output_path).write_text(json.dumps(_manifest(inputs, digest), indent=2) + "\n")
+
+
+def _manifest(inputs: dict, output_sha256: str | None) -> dict:
+    return {
+        "manifest_version": MANIFEST_VERSION,
+        "package_version": package_version(),
+        "inputs": inputs,
+        "output_sha256": output_sha256,
+    }
+
+
+def _file_digest(path: str) -> str:
+    with open(path, "rb") as f:
+        return hashlib.file_digest(f, "sha256").hexdigest()
@@ -3,6 +3,8 @@
 from pathlib import Path
 from .base import OutputProvider
 from .gif_provider import GifOutputProvider
+from .size_budget import BudgetResult, fit_to_budget
+from .sprite_sheet_provider import SpriteSheetOutputProvider
 from .webp_provider import WebPOutputProvider
 from .webp_dataurl_provider import WebpDataUrlOutputProvider
 
@@ -46,5 +48,8 @@ __all__ = [
     "GifOutputProvider",
     "WebPOutputProvider",
     "WebpDataUrlOutputProvider",
+    "SpriteSheetOutputProvider",
     "resolve_output_provider",
+    "BudgetResult",
+    "fit_to_budget",
 ]
@@ -1,10 +1,34 @@
 """Base class for output format providers."""
 
+import os
+import secrets
 from abc import ABC, abstractmethod
+from pathlib import Path
 from typing import Iterator
 from PIL import Image
 
 
+def write_atomic(path: str, data: bytes) -> None:
+    """
+    Replace a file's content in one step.
+
+    The data goes to a temporary file in the same directory which is then
+    renamed over the target, so readers (e.g. a web server) see either the
+    old or the new file, never a partial one.
+    """
+    target = Path(path)
+    tmp_path = target.with_name(f".{target.name}.{secrets.token_hex(4)}.tmp")
+    # Unlike mkstemp, honour the umask so the output stays readable by others
+    fd = os.open(tmp_path, os.O_WRONLY | os.O_CREAT | os.O_EXCL, 0o666)
+    try:
+        with os.fdopen(fd, "wb") as f:
+            f.write(data)
+        os.replace(tmp_path, target)
+    except BaseException:
+        os.unlink(tmp_path)
+        raise
+
+
 class OutputProvider(ABC):
     """Abstract base class for output format providers."""
 
@@ -2,21 +2,26 @@
 
 from io import BytesIO
 from typing import Iterator
-from PIL import Image
-from .base import OutputProvider
+from PIL import GifImagePlugin, Image, ImageChops
+from .. import instrumentation
+from .base import OutputProvider, write_atomic
 
 
 class GifOutputProvider(OutputProvider):
     """Output provider for GIF format."""
 
-    def __init__(self, path: str):
+    def __init__(self, path: str, optimize: bool = False, colors: int = 256):
         """
         Initialize the provider with an output file path.
 
         Args:
             path: Path to the output GIF file
+            optimize: Whether to let Pillow optimize the palette
+            colors: Number of palette colors per frame (2-256)
         """
         super().__init__(path)
+        self.optimize = optimize
+        self.colors = colors
 
     def encode(self, frames: Iterator[Image.Image], frame_duration: int) -> bytes:
         """
@@ -28,22 +33,76 @@ class GifOutputProvider(OutputProvider):
         Returns:
             GIF-encoded bytes
         """
+        if self.colors < 256:
+            frames = (frame.quantize(colors=self.colors) for frame in frames)
         frame_list = list(frames)
         buffer = BytesIO()
 
-        if frame_list:
-            frame_list[0].save(
-                buffer,
-                format="gif",
-                save_all=True,
-                append_images=frame_list[1:],
-                duration=frame_duration,
-                loop=0,
-                optimize=False,
-            )
+        with instrumentation.timed(instrumentation.ENCODE):
+            if frame_list:
+                frame_list[0].save(
+                    buffer,
+                    format="gif",
+                    save_all=True,
+                    append_images=frame_list[1:],
+                    duration=frame_duration,
+                    loop=0,
+                    optimize=self.optimize,
+                )
 
+        instrumentation.observe(instrumentation.OUTPUT_BYTES, buffer.tell())
         return buffer.getvalue()
 
+    def iter_encode(self, frames: Iterator[Image.Image], frame_duration: int) -> Iterator[bytes]:
+        """
+        Encode frames as animated GIF one frame at a time.
+
+        Each frame is written as soon as it is produced, cropped to the region
+        that changed since the previous frame and with its own color table, so
+        callers can send bytes on before the animation is complete. Joining the
+        chunks gives a complete GIF.
+
+        Args:
+            frames: Iterator of PIL Images
+            frame_duration: Duration of each frame in milliseconds
+
+        Yields:
+            GIF-encoded chunks: header and first frame, one chunk per later frame, trailer
+        """
+        # Frames are produced lazily, so only the encoding between them is timed
+        encode = instrumentation.Stopwatch(instrumentation.ENCODE)
+        size = 0
+        previous = None
+        for frame in frames:
+            with encode:
+                chunk = self._encode_frame(frame, previous, frame_duration)
+            previous = frame
+            size += len(chunk)
+            yield chunk
+        if previous is not None:
+            size += 1
+            yield b";"
+        encode.report()
+        instrumentation.observe(instrumentation.OUTPUT_BYTES, size)
+
+    def _encode_frame(self, frame: Image.Image, previous: Image.Image | None, frame_duration: int) -> bytes:
+        """Encode one frame, with the GIF header when it is the first."""
+        if previous is None:
+            box = (0, 0) + frame.size
+        else:
+            # Unchanged frames still need a (1x1) image to keep their duration
+            box = ImageChops.difference(previous, frame).getbbox() or (0, 0, 1, 1)
+        patch = frame.crop(box).quantize(colors=self.colors)
+        chunk = b"".join(
+            GifImagePlugin.getdata(
+                patch, offset=box[:2], duration=frame_duration, disposal=1, include_color_table=True
+            )
+        )
+        if previous is None:
+            header, _ = GifImagePlugin.getheader(patch, info={"loop": 0})
+            chunk = b"".join(header) + chunk
+        return chunk
+
     def write(self, data: bytes) -> None:
         """
         Write GIF-encoded data to a file.
@@ -51,5 +110,5 @@ class GifOutputProvider(OutputProvider):
         Args:
             data: GIF-encoded bytes to write
         """
-        with open(self.path, "wb") as f:
-            f.write(data)
+        with instrumentation.timed(instrumentation.WRITE):
+            write_atomic(self.path, data)
@@ -0,0 +1,81 @@
+"""Section-marker injection for writing generated snippets into text files."""
+
+# Section markers for injection mode
+_SECTION_START_MARKER = "<!--START_SECTION:space-shooter-->"
+_SECTION_END_MARKER = "<!--END_SECTION:space-shooter-->"
+
+
+def write_section(path: str, snippet: str) -> None:
+    """
+    Write a snippet to a text file with section-based injection.
+
+    For new files, wraps content in section markers.
+    For existing files, validates and replaces content between markers.
+
+    Args:
+        path: Path to the text file
+        snippet: Content to place between the section markers
+
+    Raises:
+        ValueError: If section markers are missing or in wrong order
+    """
+    # Try to create new file exclusively (avoids TOCTOU race condition)
+    try:
+        with open(path, "x") as f:
+            # Wrap content in section markers
+            f.write(_SECTION_START_MARKER + "\n")
+            f.write(snippet + "\n")
+            f.write(_SECTION_END_MARKER + "\n")
+        return
+    except FileExistsError:
+        # File exists - read contents
+        with open(path, "r") as f:
+            content = f.read()
+
+    # Find start and end markers
+    start_idx = content.find(_SECTION_START_MARKER)
+    end_idx = content.find(_SECTION_END_MARKER)
+
+    # Validate markers exist
+    if start_idx == -1:
+        raise ValueError(
+            f"Start marker '{_SECTION_START_MARKER}' not found in file. "
+            f"Please add both '{_SECTION_START_MARKER}' and '{_SECTION_END_MARKER}' markers to your file."
+        )
+    if end_idx == -1:
+        raise ValueError(
+            f"End marker '{_SECTION_END_MARKER}' not found in file. "
+            f"Please add both '{_SECTION_START_MARKER}' and '{_SECTION_END_MARKER}' markers to your file."
+        )
+
+    # Validate marker order
+    if start_idx > end_idx:
+        raise ValueError(
+            f"Start marker '{_SECTION_START_MARKER}' must appear before end marker '{_SECTION_END_MARKER}'."
+        )
+
+    # Calculate positions for content replacement
+    # Content after start marker (skip newlines to insert after them)
+    after_start = start_idx + len(_SECTION_START_MARKER)
+    while after_start < len(content) and content[after_start] in "\r\n":
+        after_start += 1
+
+    # Content before end marker (include the newline before the end marker)
+    before_end = end_idx
+    # Include any newlines immediately before the end marker for proper formatting
+    while before_end > after_start and content[before_end - 1] in "\r\n":
+        before_end -= 1
+
+    # Build new content: keep everything up to after_start (incl. newlines),
+    # add snippet with newline if needed, then keep everything from before_end
+    # If before_end == after_start, the section was empty - add a newline
+    snippet_with_newline = snippet if before_end > after_start else snippet + "\n"
+    new_content = (
+        content[:after_start] +
+        snippet_with_newline +
+        content[before_end:]
+    )
+
+    # Write back
+    with open(path, "w") as f:
+        f.write(new_content)
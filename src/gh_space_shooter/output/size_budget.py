@@ -0,0 +1,156 @@
+"""Fit encoded output under a byte budget by searching over encoder and frame settings."""
+
+from dataclasses import dataclass, field
+from typing import Callable, Sequence
+from PIL import Image
+from .base import OutputProvider
+from .gif_provider import GifOutputProvider
+from .webp_dataurl_provider import WebpDataUrlOutputProvider
+from .webp_provider import WebPOutputProvider
+
+
+# Largest frame step tried (step 2 at 40 fps plays back at 20 fps)
+MAX_FRAME_STEP = 4
+# Scales tried once frame dropping alone is not enough
+SCALES = (0.9, 0.8, 0.7, 0.6, 0.5)
+
+EncoderSettings = dict[str, int | bool]
+
+
+@dataclass
+class BudgetResult:
+    """Encoded output that fits the byte budget, with the parameters that produced it."""
+
+    data: bytes
+    encoder_settings: EncoderSettings = field(default_factory=dict)
+    frame_step: int = 1
+    frame_count: int = 0
+    frame_duration: int = 0
+    scale: float = 1.0
+
+
+def _encoder_levels(provider: OutputProvider) -> list[EncoderSettings]:
+    """Encoder settings for a provider, ordered from best quality to smallest output."""
+    if isinstance(provider, GifOutputProvider):
+        return [
+            {"optimize": False, "colors": 256},
+            {"optimize": True, "colors": 256},
+            *({"optimize": True, "colors": colors} for colors in (192, 128, 96, 64, 48, 32, 16)),
+        ]
+    if isinstance(provider, (WebPOutputProvider, WebpDataUrlOutputProvider)):
+        return [
+            {"lossless": True, "quality": 100, "method": 4},
+            {"lossless": True, "quality": 100, "method": 6},
+            *({"lossless": False, "quality": quality, "method": 6} for quality in range(95, 0, -10)),
+        ]
+    raise ValueError(f"Size budget is not supported for {type(provider).__name__}")
+
+
+def _first_fitting(
+    count: int,
+    attempt: Callable[[int], bytes | None],
+    last: bytes | None = None,
+) -> tuple[int, bytes] | None:
+    """
+    Binary search for the first candidate index whose output fits.
+
+    Candidates are assumed to produce monotonically smaller output as the index grows.
+    The first candidate is tried up front since budgets are usually met early.
+    If the output of the last candidate is already known, pass it as last.
+    """
+    data = attempt(0)
+    if data is not None:
+        return (0, data)
+    if count == 1:
+        return None
+
+    data = last if last is not None else attempt(count - 1)
+    if data is None:
+        return None
+
+    best = (count - 1, data)
+    lo, hi = 1, count - 2
+    while lo <= hi:
+        mid = (lo + hi) // 2
+        data = attempt(mid)
+        if data is not None:
+            best = (mid, data)
+            hi = mid - 1
+        else:
+            lo = mid + 1
+    return best
+
+
+def fit_to_budget(
+    provider: OutputProvider,
+    frames: Sequence[Image.Image],
+    frame_duration: int,
+    max_bytes: int,
+) -> BudgetResult:
+    """
+    Encode already-rendered frames so the output fits within max_bytes.
+
+    Tries progressively cheaper settings without re-simulating the game:
+    encoder settings first, then dropping frames (lower fps), then downscaling,
+    and finally truncating the animation. Each axis is binary searched, and once
+    a frame layout fits the encoder quality is searched back up for that layout.
+
+    Args:
+        provider: GIF, WebP or WebP data URL provider; its settings are updated in place
+        frames: Rendered frames
+        frame_duration: Duration of each frame in milliseconds
+        max_bytes: Maximum size of the encoded output
+
+    Returns:
+        BudgetResult with the encoded bytes and the chosen parameters
+
+    Raises:
+        ValueError: If the provider is unsupported or no settings fit the budget
+    """
+    levels = _encoder_levels(provider)
+    total = len(frames)
+
+    layouts: list[tuple[int, float, int]] = [(1, 1.0, total)]
+    layouts += [(step, 1.0, total) for step in range(2, MAX_FRAME_STEP + 1)]
+    layouts += [(MAX_FRAME_STEP, scale, total) for scale in SCALES]
+    layouts += [(MAX_FRAME_STEP, SCALES[-1], count) for count in range(total - 1, 0, -1)]
+
+    def encode(level: int, layout: tuple[int, float, int]) -> bytes | None:
+        step, scale, count = layout
+        for key, value in levels[level].items():
+            setattr(provider, key, value)
+
+        selected = list(frames[:count:step])
+        if scale < 1.0:
+            selected = [
+                frame.resize(
+                    (max(1, round(frame.width * scale)), max(1, round(frame.height * scale))),
+                    Image.Resampling.BOX,
+                )
+                for frame in selected
+            ]
+        data = provider.encode(iter(selected), frame_duration * step)
+        return data if len(data) <= max_bytes else None
+
+    # Smallest change to the frames that fits with the most compact encoder...
+    layout_match = _first_fitting(len(layouts), lambda idx: encode(len(levels) - 1, layouts[idx]))
+    if layout_match is None:
+        raise ValueError(f"Output cannot be reduced below {max_bytes} bytes")
+    layout = layouts[layout_match[0]]
+
+    # ...then the best encoder quality that still fits with those frames
+    encoder_match = _first_fitting(len(levels), lambda idx: encode(idx, layout), last=layout_match[1])
+    assert encoder_match is not None
+    level, data = encoder_match
+    for key, value in levels[level].items():
+        setattr(provider, key, value)
+
+    step, scale, count = layout
+    return BudgetResult(
+        data=data,
+        encoder_settings=dict(levels[level]),
+        frame_step=step,
+        frame_count=len(range(0, count, step)),
+        frame_duration=frame_duration * step,
+        scale=scale,
+    )
@@ -0,0 +1,151 @@
+"""Sprite sheet output provider animated with CSS steps()."""
+
+import hashlib
+import math
+import os
+from io import BytesIO
+from pathlib import Path
+from typing import Iterator
+from PIL import Image
+from .. import instrumentation
+from .base import OutputProvider, write_atomic
+from .section_injection import write_section
+
+
+# WebP cannot encode images wider or taller than this
+_WEBP_MAX_DIMENSION = 16383
+
+_ANIMATION_NAME = "gh-space-shooter"
+
+
+class SpriteSheetOutputProvider(OutputProvider):
+    """
+    Output provider that tiles frames into a single PNG or WebP sprite sheet.
+
+    Identical frames are stored once in the sheet. Alongside the sheet, an
+    HTML/CSS snippet is written that plays the frames back with a keyframe
+    animation using steps(), injected between section markers like the
+    data URL output.
+    """
+
+    def __init__(self, path: str, snippet_path: str | None = None):
+        """
+        Initialize the provider with an output file path.
+
+        Args:
+            path: Path to the sprite sheet (.png or .webp)
+            snippet_path: Path to the text file receiving the HTML/CSS snippet
+                (defaults to the sheet path with an .html suffix)
+        """
+        super().__init__(path)
+        self.format = "webp" if Path(path).suffix.lower() == ".webp" else "png"
+        self.snippet_path = snippet_path or str(Path(path).with_suffix(".html"))
+        self.snippet: str | None = None
+
+    def encode(self, frames: Iterator[Image.Image], frame_duration: int) -> bytes:
+        """
+        Encode frames as a sprite sheet and build the matching HTML/CSS snippet.
+
+        Args:
+            frames: Iterator of PIL Images
+            frame_duration: Duration of each frame in milliseconds
+
+        Returns:
+            Sprite sheet bytes (the snippet is kept on the provider for write())
+        """
+        tiles: list[Image.Image] = []
+        tile_indices: dict[bytes, int] = {}
+        timeline: list[int] = []
+
+        for frame in frames:
+            digest = hashlib.blake2b(frame.tobytes(), digest_size=16).digest()
+            if digest not in tile_indices:
+                tile_indices[digest] = len(tiles)
+                tiles.append(frame)
+            timeline.append(tile_indices[digest])
+
+        if not tiles:
+            self.snippet = ""
+            return b""
+
+        width, height = tiles[0].size
+        # Aim for a roughly square sheet in pixels
+        columns = max(1, min(len(tiles), math.ceil(math.sqrt(len(tiles) * height / width))))
+        if self.format == "webp":
+            columns = min(columns, _WEBP_MAX_DIMENSION // width)
+        rows = math.ceil(len(tiles) / columns)
+
+        if self.format == "webp" and rows * height > _WEBP_MAX_DIMENSION:
+            raise ValueError(
+                f"{len(tiles)} unique frames do not fit in a WebP sprite sheet. "
+                "Use a .png sheet or limit the number of frames."
+            )
+
+        # Tiles are collected while frames are produced, so only building the sheet is timed
+        with instrumentation.timed(instrumentation.ENCODE):
+            sheet = Image.new("RGB", (columns * width, rows * height))
+            for idx, tile in enumerate(tiles):
+                sheet.paste(tile, ((idx % columns) * width, (idx // columns) * height))
+
+            buffer = BytesIO()
+            if self.format == "webp":
+                sheet.save(buffer, format="webp", lossless=True, quality=100, method=4)
+            else:
+                sheet.save(buffer, format="png")
+
+        instrumentation.observe(instrumentation.OUTPUT_BYTES, buffer.tell())
+        self.snippet = self._build_snippet(timeline, columns, width, height, frame_duration)
+        return buffer.getvalue()
+
+    def _build_snippet(
+        self,
+        timeline: list[int],
+        columns: int,
+        width: int,
+        height: int,
+        frame_duration: int,
+    ) -> str:
+        """Build the HTML/CSS snippet that animates the sprite sheet."""
+        sheet_url = os.path.relpath(self.path, os.path.dirname(self.snippet_path) or ".")
+        sheet_url = Path(sheet_url).as_posix()
+        total_frames = len(timeline)
+
+        # One keyframe per run of identical tiles; steps(1, end) holds each
+        # position until the next keyframe, so runs cost a single entry.
+        keyframes: list[str] = []
+        previous = None
+        for frame_idx, tile_idx in enumerate(timeline):
+            if tile_idx == previous:
+                continue
+            previous = tile_idx
+            x = -(tile_idx % columns) * width
+            y = -(tile_idx // columns) * height
+            percent = frame_idx / total_frames * 100
+            keyframes.append(f"{percent:.4f}%{{background-position:{x}px {y}px}}")
+        keyframes.append(f"100%{{background-position:{x}px {y}px}}")
+
+        duration = total_frames * frame_duration / 1000
+        return (
+            f'<div class="{_ANIMATION_NAME}" style="width:{width}px;height:{height}px;'
+            f"background:url('{sheet_url}') 0 0 no-repeat;"
+            f'animation:{_ANIMATION_NAME} {duration:.3f}s steps(1,end) infinite"></div>\n'
+            f"<style>@keyframes {_ANIMATION_NAME}{{{''.join(keyframes)}}}</style>"
+        )
+
+    def write(self, data: bytes) -> None:
+        """
+        Write the sprite sheet and inject the HTML/CSS snippet.
+
+        Args:
+            data: Sprite sheet bytes returned by encode()
+
+        Raises:
+            ValueError: If encode() has not been called, or if section markers
+                in an existing snippet file are missing or in wrong order
+        """
+        if self.snippet is None:
+            raise ValueError("No snippet available. Call encode() before write().")
+
+        with instrumentation.timed(instrumentation.WRITE):
+            write_atomic(self.path, data)
+            write_section(self.snippet_path, self.snippet)
@@ -3,20 +3,33 @@
 from io import BytesIO
 from typing import Iterator
 from PIL import Image
-from .base import OutputProvider
+from .. import instrumentation
+from .base import OutputProvider, write_atomic
 
 
 class WebPOutputProvider(OutputProvider):
     """Output provider for WebP format."""
 
-    def __init__(self, path: str):
+    def __init__(
+        self,
+        path: str,
+        lossless: bool = True,
+        quality: int = 100,
+        method: int = 4,
+    ):
         """
         Initialize the provider with an output file path.
 
         Args:
             path: Path to the output WebP file
+            lossless: Whether to encode losslessly
+            quality: Encoder quality (0-100); compression effort when lossless
+            method: Encoder effort (0=fast, 6=slowest/smallest)
         """
         super().__init__(path)
+        self.lossless = lossless
+        self.quality = quality
+        self.method = method
 
     def encode(self, frames: Iterator[Image.Image], frame_duration: int) -> bytes:
         """
@@ -31,19 +44,21 @@ class WebPOutputProvider(OutputProvider):
         frame_list = list(frames)
         buffer = BytesIO()
 
-        if frame_list:
-            frame_list[0].save(
-                buffer,
-                format="webp",
-                save_all=True,
-                append_images=frame_list[1:],
-                duration=frame_duration,
-                loop=0,
-                lossless=True,
-                quality=100,
-                method=4,
-            )
+        with instrumentation.timed(instrumentation.ENCODE):
+            if frame_list:
+                frame_list[0].save(
+                    buffer,
+                    format="webp",
+                    save_all=True,
+                    append_images=frame_list[1:],
+                    duration=frame_duration,
+                    loop=0,
+                    lossless=self.lossless,
+                    quality=self.quality,
+                    method=self.method,
+                )
 
+        instrumentation.observe(instrumentation.OUTPUT_BYTES, buffer.tell())
         return buffer.getvalue()
 
     def write(self, data: bytes) -> None:
@@ -53,5 +68,5 @@ class WebPOutputProvider(OutputProvider):
         Args:
             data: WebP-encoded bytes to write
         """
-        with open(self.path, "wb") as f:
-            f.write(data)
+        with instrumentation.timed(instrumentation.WRITE):
+            write_atomic(self.path, data)
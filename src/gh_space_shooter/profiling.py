@@ -0,0 +1,220 @@
+"""Profiles of a render for investigating hot paths, as pstats, collapsed stacks or speedscope JSON."""
+
+import cProfile
+import json
+import os
+import sys
+import threading
+import time
+from collections import Counter
+from contextlib import contextmanager
+from functools import lru_cache
+from pathlib import Path
+from types import FrameType
+from typing import Iterator
+
+# Profile format by output file suffix
+FORMATS = {
+    ".pstats": "pstats",
+    ".prof": "pstats",
+    ".collapsed": "collapsed",
+    ".folded": "collapsed",
+    ".txt": "collapsed",
+    ".json": "speedscope",
+}
+
+# Seconds between stack samples for the collapsed and speedscope formats
+SAMPLE_INTERVAL = 0.001
+
+# Phase of a sample, decided by the innermost frame whose qualified name ends with
+# one of these, so frames rendered lazily inside the encoder count as rendering
+PHASES = (
+    ("Renderer.render_frame", "rendering"),
+    ("Animator._generate_frames", "simulation"),
+    ("OutputProvider.encode", "encoding"),
+    ("OutputProvider.iter_encode", "encoding"),
+    ("fit_to_budget", "encoding"),
+    ("OutputProvider.write", "writing"),
+)
+
+SPEEDSCOPE_SCHEMA = "https://www.speedscope.app/file-format-schema.json"
+
+Frame = tuple[str, str, int]  # qualified name, file, first line
+
+
+def profile_format(path: str) -> str:
+    """
+    Pick the profile format from an output path's suffix.
+
+    Raises:
+        ValueError: If the suffix is not one of FORMATS
+    """
+    suffix = Path(path).suffix.lower()
+    if suffix not in FORMATS:
+        raise ValueError(
+            f"Unknown profile format '{suffix}'. Use one of: {', '.join(FORMATS)}"
+        )
+    return FORMATS[suffix]
+
+
+@contextmanager
+def profile_to(path: str, interval: float = SAMPLE_INTERVAL) -> Iterator[None]:
+    """
+    Profile the block and write the profile to path once it completes.
+
+    .pstats and .prof files hold cProfile statistics for pstats or snakeviz.
+    The other formats sample the calling thread's stack every interval
+    seconds of wall time. Each stack's root frame is its phase, such as
+    "[rendering]" or "[encoding]". The collapsed format (.collapsed, .folded,
+    .txt) has one "frame;frame;frame microseconds" line per stack, for
+    flamegraph.pl. The .json format is a speedscope profile in time order.
+
+    Raises:
+        ValueError: If the suffix is not one of FORMATS
+    """
+    output_format = profile_format(path)
+    if output_format == "pstats":
+        profiler = cProfile.Profile()
+        profiler.enable()
+        try:
+            yield
+        finally:
+            profiler.disable()
+        profiler.dump_stats(path)
+        return
+
+    sampler = StackSampler(interval)
+    with sampler:
+        yield
+    if output_format == "collapsed":
+        Path(path).write_text(sampler.collapsed())
+    else:
+        Path(path).write_text(json.dumps(sampler.speedscope(Path(path).stem)))
+
+
+class StackSampler:
+    """
+    Records the stack of a thread from a background thread at a fixed interval.
+
+    Samples are kept in time order with the wall time each one stands for.
+    Frames that every sample shares, such as the CLI's, are left out of the
+    profile except for the innermost one, e.g. the function being profiled.
+    """
+
+    def __init__(self, interval: float = SAMPLE_INTERVAL):
+        """
+        Initialize the sampler for the calling thread.
+
+        Args:
+            interval: Seconds between samples
+        """
+        self.interval = interval
+        self.frames: list[Frame] = []
+        self.samples: list[tuple[int, tuple[int, ...], float]] = []
+        self.duration = 0.0
+        self._thread_id = threading.get_ident()
+        self._indices: dict[Frame, int] = {}
+        self._stop = threading.Event()
+        self._thread = threading.Thread(target=self._run, name="stack-sampler", daemon=True)
+
+    def __enter__(self) -> "StackSampler":
+        # Let the sampler take the GIL as often as it samples
+        self._switch_interval = sys.getswitchinterval()
+        sys.setswitchinterval(min(self._switch_interval, self.interval))
+        self._thread.start()
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self._stop.set()
+        self._thread.join()
+        sys.setswitchinterval(self._switch_interval)
+
+    def collapsed(self) -> str:
+        """Stacks in collapsed format, weighted by microseconds of wall time."""
+        weights: Counter[tuple[int, ...]] = Counter()
+        for stack, seconds in self._stacks():
+            weights[stack] += seconds
+        return "".join(
+            ";".join(_label(self.frames[index]) for index in stack) + f" {round(seconds * 1e6)}\n"
+            for stack, seconds in weights.items()
+        )
+
+    def speedscope(self, name: str) -> dict:
+        """Samples as a speedscope sampled profile."""
+        from .manifest import package_version
+
+        return {
+            "$schema": SPEEDSCOPE_SCHEMA,
+            "name": name,
+            "exporter": f"gh-space-shooter {package_version()}",
+            "shared": {
+                "frames": [
+                    {"name": qualname, "file": file, "line": line} if file else {"name": qualname}
+                    for qualname, file, line in self.frames
+                ]
+            },
+            "profiles": [
+                {
+                    "type": "sampled",
+                    "name": name,
+                    "unit": "seconds",
+                    "startValue": 0,
+                    "endValue": self.duration,
+                    "samples": [list(stack) for stack, _ in self._stacks()],
+                    "weights": [seconds for _, _, seconds in self.samples],
+                }
+            ],
+        }
+
+    def _run(self) -> None:
+        started = previous = time.perf_counter()
+        while not self._stop.wait(self.interval):
+            frame = sys._current_frames().get(self._thread_id)
+            now = time.perf_counter()
+            if frame is not None:
+                self.samples.append((*self._sample(frame), now - previous))
+            previous = now
+        self.duration = previous - started
+
+    def _sample(self, frame: FrameType | None) -> tuple[int, tuple[int, ...]]:
+        """Frame indices of a stack's phase and of its frames, innermost last."""
+        stack: list[Frame] = []
+        phase = None
+        while frame is not None:
+            code = frame.f_code
+            stack.append((code.co_qualname, _short_path(code.co_filename), code.co_firstlineno))
+            if phase is None:
+                phase = next((name for suffix, name in PHASES if code.co_qualname.endswith(suffix)), None)
+            frame = frame.f_back
+        phase_frame = (f"[{phase or 'other'}]", "", 0)
+        return self._index(phase_frame), tuple(self._index(entry) for entry in reversed(stack))
+
+    def _stacks(self) -> Iterator[tuple[tuple[int, ...], float]]:
+        """Samples in time order as their phase followed by the frames below the shared ones."""
+        stacks = [stack for _, stack, _ in self.samples]
+        shared = len(os.path.commonprefix(stacks)) if stacks else 0
+        # Keep the innermost shared frame as the root of every phase
+        start = max(shared - 1, 0)
+        for phase, stack, seconds in self.samples:
+            yield (phase, *stack[start:]), seconds
+
+    def _index(self, entry: Frame) -> int:
+        index = self._indices.get(entry)
+        if index is None:
+            index = self._indices[entry] = len(self.frames)
+            self.frames.append(entry)
+        return index
+
+
+def _label(frame: Frame) -> str:
+    qualname, file, line = frame
+    return f"{qualname} ({file}:{line})" if file else qualname
+
+
+@lru_cache(maxsize=None)
+def _short_path(filename: str) -> str:
+    """A source file's path relative to the sys.path entry it was imported from."""
+    for entry in sorted(filter(None, sys.path), key=len, reverse=True):
+        if filename.startswith(entry.rstrip(os.sep) + os.sep):
+            return os.path.relpath(filename, entry)
+    return filename
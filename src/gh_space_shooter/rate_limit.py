@@ -0,0 +1,113 @@
+"""Rate-limit tracking and retry policy for GitHub API requests."""
+
+import random
+import time
+from dataclasses import dataclass
+from typing import Literal
+
+import httpx
+
+# Statuses worth retrying with backoff
+TRANSIENT_STATUSES = {429, 500, 502, 503, 504}
+
+
+@dataclass
+class RateLimitStatus:
+    """Rate-limit budget reported by GitHub's X-RateLimit-* response headers."""
+
+    limit: int
+    remaining: int
+    used: int
+    reset_at: float  # Unix timestamp when the budget resets
+    resource: str = "graphql"
+
+    @classmethod
+    def from_headers(cls, headers: httpx.Headers) -> "RateLimitStatus | None":
+        """Parse rate-limit headers; returns None if they are absent or malformed."""
+        try:
+            remaining = int(headers["x-ratelimit-remaining"])
+            limit = int(headers.get("x-ratelimit-limit", remaining))
+            return cls(
+                limit=limit,
+                remaining=remaining,
+                used=int(headers.get("x-ratelimit-used", limit - remaining)),
+                reset_at=float(headers.get("x-ratelimit-reset", 0)),
+                resource=headers.get("x-ratelimit-resource", "graphql"),
+            )
+        except (KeyError, ValueError):
+            return None
+
+    def seconds_until_reset(self) -> float:
+        return max(0.0, self.reset_at - time.time())
+
+
+@dataclass
+class RetryPolicy:
+    """
+    How to react to transient failures and exhausted rate limits.
+
+    Transient failures (network errors, 5xx, 429 without guidance) are retried
+    with full-jitter exponential backoff. Secondary rate limits are waited out
+    according to Retry-After. An exhausted primary quota is either waited out
+    until reset or failed fast, depending on on_exhausted.
+    """
+
+    max_retries: int = 3
+    backoff_base: float = 1.0  # Seconds; doubles with every attempt
+    backoff_max: float = 30.0
+    on_exhausted: Literal["wait", "fail"] = "fail"
+    max_wait: float = 60.0  # Longest single wait for Retry-After or a quota reset
+
+    def backoff(self, attempt: int) -> float:
+        """Full-jitter exponential backoff for the given attempt (0-based)."""
+        return random.uniform(0, min(self.backoff_max, self.backoff_base * 2 ** attempt))
+
+    def wait_before_request(self, rate_limit: RateLimitStatus | None) -> float | None:
+        """
+        Seconds to wait before sending a request given the last known budget.
+
+        Returns:
+            0 when there is budget left, the wait until reset, or None to fail fast
+        """
+        if rate_limit is None or rate_limit.remaining > 0:
+            return 0.0
+        wait = rate_limit.seconds_until_reset()
+        if wait == 0:
+            return 0.0
+        if self.on_exhausted == "fail" or wait > self.max_wait:
+            return None
+        return wait
+
+    def retry_delay(
+        self,
+        attempt: int,
+        response: httpx.Response | None,
+        rate_limit: RateLimitStatus | None,
+        rate_limited: bool,
+    ) -> float | None:
+        """
+        Seconds to wait before retrying, or None to give up.
+
+        Args:
+            attempt: Number of retries already made
+            response: The failed response, or None for a network error
+            rate_limit: Budget parsed from the response headers
+            rate_limited: Whether the response indicates a rate limit
+        """
+        if attempt >= self.max_retries:
+            return None
+        if response is None or not rate_limited:
+            return self.backoff(attempt)
+
+        retry_after = response.headers.get("retry-after")
+        if retry_after is not None:
+            try:
+                wait = float(retry_after)
+            except ValueError:
+                return self.backoff(attempt)
+            return wait if wait <= self.max_wait else None
+
+        if rate_limit is not None and rate_limit.remaining == 0:
+            return self.wait_before_request(rate_limit)
+
+        return self.backoff(attempt)
@@ -0,0 +1,103 @@
+"""Made-up contribution graphs for benchmarks and offline testing."""
+
+import random
+from datetime import date, datetime, timedelta, timezone
+from typing import TYPE_CHECKING
+
+from .constants import NUM_WEEKS
+from .contribution_history import group_weeks
+
+if TYPE_CHECKING:
+    from .github_client import ContributionData, ContributionDay
+
+# GraphQL contributionLevel names, indexed by level
+LEVEL_NAMES = ("NONE", "FIRST_QUARTILE", "SECOND_QUARTILE", "THIRD_QUARTILE", "FOURTH_QUARTILE")
+
+# Largest contribution count of a synthetic day
+MAX_DAILY_COUNT = 20
+
+# Fixed last day for graphs that must not change from one day to the next, e.g. for profiling
+REFERENCE_END = date(2025, 6, 28)
+
+
+def synthetic_contribution_data(
+    username: str,
+    density: float = 0.5,
+    seed: int = 0,
+    end: date | None = None,
+    num_weeks: int = NUM_WEEKS,
+) -> "ContributionData":
+    """
+    Generate a contribution graph shaped like GitHub's trailing-year calendar.
+
+    The same username, density, seed and end date always give the same graph.
+
+    Args:
+        username: User the graph is for; also varies the contributions
+        density: Fraction of days with at least one contribution (0-1)
+        seed: Varies the contributions independently of the username
+        end: Last day of the calendar (defaults to today in UTC)
+        num_weeks: Number of Sunday-to-Saturday weeks, the last one partial
+
+    Raises:
+        ValueError: If density is not between 0 and 1
+    """
+    if not 0 <= density <= 1:
+        raise ValueError(f"Density must be between 0 and 1, got {density}")
+
+    end = end or datetime.now(timezone.utc).date()
+    start = end - timedelta(days=(end.weekday() + 1) % 7 + (num_weeks - 1) * 7)
+    rng = random.Random(f"{seed}:{username}")
+
+    days: list[ContributionDay] = []
+    for offset in range((end - start).days + 1):
+        count = rng.randint(1, MAX_DAILY_COUNT) if rng.random() < density else 0
+        days.append(
+            {
+                "date": (start + timedelta(days=offset)).isoformat(),
+                "count": count,
+                "level": _level(count),
+            }
+        )
+
+    return {
+        "username": username,
+        "total_contributions": sum(day["count"] for day in days),
+        "weeks": group_weeks(days),
+    }
+
+
+def calendar_response(data: "ContributionData | None") -> dict:
+    """Wrap a graph in the GraphQL response GitHub sends for it (None for an unknown user)."""
+    return {"data": {"user": user_node(data) if data is not None else None}}
+
+
+def user_node(data: "ContributionData") -> dict:
+    """Convert a graph into the GraphQL user node holding its contributionCalendar."""
+    return {
+        "contributionsCollection": {
+            "contributionCalendar": {
+                "totalContributions": data["total_contributions"],
+                "weeks": [
+                    {
+                        "contributionDays": [
+                            {
+                                "date": day["date"],
+                                "contributionCount": day["count"],
+                                "contributionLevel": LEVEL_NAMES[day["level"]],
+                            }
+                            for day in week["days"]
+                        ]
+                    }
+                    for week in data["weeks"]
+                ],
+            }
+        }
+    }
+
+
+def _level(count: int) -> int:
+    """Quartile of a count within 1..MAX_DAILY_COUNT, as GitHub buckets them."""
+    if count == 0:
+        return 0
+    return min(4, 1 + (count - 1) * 4 // MAX_DAILY_COUNT)
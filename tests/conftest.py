@@ -1,8 +1,17 @@
 """Shared test fixtures for gh-space-shooter tests."""
 
+import json
+from datetime import date
+from typing import Callable
+
+import httpx
 import pytest
 from gh_space_shooter.game.game_state import GameState
 from gh_space_shooter.github_client import ContributionData
+from gh_space_shooter.synthetic import synthetic_contribution_data, user_node
+
+# Last day of the calendars served by mock GitHub transports; a Saturday, so every week is complete
+CALENDAR_END = date(2024, 1, 13)
 
 
 @pytest.fixture
@@ -24,4 +33,82 @@ def empty_contribution_data() -> ContributionData:
 @pytest.fixture
 def default_game_state(empty_contribution_data):
     """Create a game state with no enemies."""
-    return GameState(empty_contribution_data)
\ No newline at end of file
+    return GameState(empty_contribution_data)
+
+
+@pytest.fixture
+def sample_data() -> ContributionData:
+    """Create a single week of contribution data with a few enemies."""
+    return {
+        "username": "testuser",
+        "total_contributions": 9,
+        "weeks": [
+            {
+                "days": [
+                    {"level": 1, "date": "2024-01-01", "count": 1},
+                    {"level": 0, "date": "2024-01-02", "count": 0},
+                    {"level": 2, "date": "2024-01-03", "count": 3},
+                    {"level": 0, "date": "2024-01-04", "count": 0},
+                    {"level": 0, "date": "2024-01-05", "count": 0},
+                    {"level": 3, "date": "2024-01-06", "count": 5},
+                    {"level": 0, "date": "2024-01-07", "count": 0},
+                ]
+            }
+        ],
+    }
+
+
+@pytest.fixture
+def make_contribution_data() -> Callable[..., ContributionData]:
+    """Build a synthetic user's graph of complete weeks, as mock GitHub transports serve it."""
+
+    def build(num_weeks: int = 2, username: str = "octocat") -> ContributionData:
+        return synthetic_contribution_data(username, end=CALENDAR_END, num_weeks=num_weeks)
+
+    return build
+
+
+@pytest.fixture
+def make_transport() -> Callable[..., httpx.MockTransport]:
+    """Build a mock transport answering every request with the payload."""
+
+    def build(payload: dict, status_code: int = 200, requests: list | None = None) -> httpx.MockTransport:
+        def handler(request: httpx.Request) -> httpx.Response:
+            if requests is not None:
+                requests.append(request)
+            return httpx.Response(status_code, json=payload)
+
+        return httpx.MockTransport(handler)
+
+    return build
+
+
+@pytest.fixture
+def batch_transport(make_contribution_data) -> Callable[..., httpx.MockTransport]:
+    """Build a mock transport answering aliased batch queries like GitHub does."""
+
+    def build(known_users: set[str], requests: list | None = None) -> httpx.MockTransport:
+        def handler(request: httpx.Request) -> httpx.Response:
+            if requests is not None:
+                requests.append(request)
+            variables = json.loads(request.content)["variables"]
+            data = {}
+            errors = []
+            for alias, login in variables.items():
+                if login in known_users:
+                    data[alias] = user_node(make_contribution_data(username=login))
+                else:
+                    data[alias] = None
+                    errors.append({
+                        "type": "NOT_FOUND",
+                        "path": [alias],
+                        "message": f"Could not resolve to a User with the login of '{login}'.",
+                    })
+            payload: dict = {"data": data}
+            if errors:
+                payload["errors"] = errors
+            return httpx.Response(200, json=payload)
+
+        return httpx.MockTransport(handler)
+
+    return build
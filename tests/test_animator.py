@@ -1,6 +1,6 @@
 """Tests for Animator."""
 
-from gh_space_shooter.game import Animator, ColumnStrategy
+from gh_space_shooter.game import Animator, ColumnStrategy, RandomStrategy
 from gh_space_shooter.github_client import ContributionData
 
 
@@ -33,3 +33,35 @@ def test_generate_frames_returns_iterator():
 
     assert len(frames) > 0
     assert all(hasattr(f, "save") for f in frames)  # PIL Images have save method
+
+
+def test_max_frames_beyond_animation_length():
+    """max_frames larger than the animation should just yield every frame."""
+    animator = Animator(SAMPLE_DATA, ColumnStrategy(), fps=30)
+
+    all_frames = list(animator.generate_frames())
+    capped = list(animator.generate_frames(max_frames=len(all_frames) + 100))
+
+    assert len(capped) == len(all_frames)
+
+
+def test_seed_makes_frames_reproducible():
+    """The same seed should give identical frames; a different seed should not."""
+
+    def render(seed):
+        animator = Animator(SAMPLE_DATA, RandomStrategy(), fps=30, seed=seed)
+        return [frame.tobytes() for frame in animator.generate_frames(max_frames=40)]
+
+    assert render(7) == render(7)
+    assert render(7) != render(8)
+
+
+def test_count_frames_matches_generated_frames():
+    """count_frames should predict the length of a seeded animation, with or without a cap."""
+    animator = Animator(SAMPLE_DATA, RandomStrategy(), fps=30, seed=3)
+
+    total = len(list(animator.generate_frames()))
+
+    assert animator.count_frames() == total
+    assert animator.count_frames(max_frames=10) == 10
+    assert animator.count_frames(max_frames=total + 50) == total
@@ -0,0 +1,116 @@
+"""Tests for the batch CLI command."""
+
+import json
+
+from typer.testing import CliRunner
+from gh_space_shooter.cli import app
+from gh_space_shooter.synthetic import synthetic_contribution_data
+
+runner = CliRunner()
+
+
+def write_users(tmp_path, lines: list[str]):
+    users = tmp_path / "users.txt"
+    users.write_text("\n".join(lines) + "\n")
+    return users
+
+
+def test_batch_renders_every_entry(tmp_path):
+    """Each saved-data entry should be rendered to its templated path."""
+    for username in ("alice", "bob"):
+        (tmp_path / f"{username}.json").write_text(json.dumps(synthetic_contribution_data(username)))
+    users = write_users(tmp_path, [
+        "# saved data only",
+        json.dumps({"raw_input": str(tmp_path / "alice.json")}),
+        json.dumps({"raw_input": str(tmp_path / "bob.json")}),
+    ])
+    report = tmp_path / "report.json"
+
+    result = runner.invoke(app, [
+        "batch", str(users),
+        "--output-template", str(tmp_path / "out" / "{username}-{strategy}.gif"),
+        "--strategy", "column",
+        "--max-frame", "5",
+        "--workers", "1",
+        "--report", str(report),
+    ])
+
+    assert result.exit_code == 0, result.output
+    assert (tmp_path / "out" / "alice-column.gif").read_bytes().startswith(b"GIF89a")
+    assert (tmp_path / "out" / "bob-column.gif").exists()
+    summary = json.loads(report.read_text())
+    assert (summary["total"], summary["succeeded"], summary["failed"]) == (2, 2, 0)
+
+
+def test_batch_keeps_going_past_failures(tmp_path, monkeypatch):
+    """Failed entries should be reported without stopping the others."""
+    monkeypatch.delenv("GH_TOKEN", raising=False)
+    (tmp_path / "alice.json").write_text(json.dumps(synthetic_contribution_data("alice")))
+    users = write_users(tmp_path, [
+        json.dumps({"raw_input": str(tmp_path / "missing.json")}),
+        "someone",
+        json.dumps({"raw_input": str(tmp_path / "alice.json")}),
+    ])
+    report = tmp_path / "report.json"
+
+    result = runner.invoke(app, [
+        "batch", str(users),
+        "--output-template", str(tmp_path / "{username}.gif"),
+        "--max-frame", "5",
+        "--workers", "1",
+        "--report", str(report),
+    ])
+
+    assert result.exit_code == 1
+    assert (tmp_path / "alice.gif").exists()
+    errors = {entry["name"]: entry["error"] for entry in json.loads(report.read_text())["results"]}
+    assert errors["alice"] is None
+    assert "not found" in errors[str(tmp_path / "missing.json")]
+    assert "GH_TOKEN" in errors["someone"]
+
+
+def test_batch_rejects_unknown_placeholders(tmp_path):
+    """A bad output template should fail before anything is rendered."""
+    users = write_users(tmp_path, ["someone"])
+
+    result = runner.invoke(app, ["batch", str(users), "--output-template", "{user}.gif"])
+
+    assert result.exit_code == 1
+    assert "{username}" in result.output
+
+
+def test_username_without_command_still_renders(tmp_path):
+    """Arguments not starting with a command name should go to the render command."""
+    raw = tmp_path / "raw.json"
+    raw.write_text(json.dumps(synthetic_contribution_data("alice")))
+    out = tmp_path / "alice.gif"
+
+    result = runner.invoke(app, ["alice", "--raw-input", str(raw), "--output", str(out), "--max-frame", "5"])
+
+    assert result.exit_code == 0, result.output
+    assert out.exists()
+
+
+def test_user_named_like_a_command_renders_through_render(tmp_path):
+    """`render batch` should render the user "batch" rather than run the batch command."""
+    raw = tmp_path / "raw.json"
+    raw.write_text(json.dumps(synthetic_contribution_data("batch")))
+    out = tmp_path / "batch.gif"
+
+    result = runner.invoke(app, ["render", "batch", "--raw-input", str(raw), "--output", str(out), "--max-frame", "5"])
+
+    assert result.exit_code == 0, result.output
+    assert out.exists()
+
+
+def test_help_without_command_shows_render_options_and_commands():
+    """Bare --help should document the default render command and still list every command."""
+    result = runner.invoke(app, ["--help"])
+
+    assert result.exit_code == 0, result.output
+    assert "[username]" in result.output
+    for option in ("--raw-input", "--output", "--strategy", "--profile"):
+        assert option in result.output
+    for command in ("render", "batch", "watch"):
+        assert command in result.output
+    assert "gh-space-shooter render batch" in result.output
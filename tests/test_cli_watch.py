@@ -0,0 +1,49 @@
+"""Tests for the watch CLI command."""
+
+import json
+from datetime import date
+
+import httpx
+import pytest
+from gh_space_shooter.batch import parse_duration, watch_cycle
+from gh_space_shooter.cli import CLIError
+from gh_space_shooter.github_client import GitHubClient
+from gh_space_shooter.synthetic import calendar_response, synthetic_contribution_data
+
+END = date(2024, 6, 12)
+
+
+@pytest.mark.parametrize("text, seconds", [("90", 90), ("90s", 90), ("15m", 900), ("1.5h", 5400), ("1d", 86400)])
+def test_parse_duration(text, seconds):
+    assert parse_duration(text) == seconds
+
+
+@pytest.mark.parametrize("text", ["", "m", "fast", "0s", "-5m"])
+def test_parse_duration_rejects_invalid(text):
+    with pytest.raises(CLIError):
+        parse_duration(text)
+
+
+def test_watch_renders_only_changed_users(tmp_path):
+    """A check should re-render users whose data changed and skip the rest."""
+    seeds = {"alice": 0, "bob": 0}
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        username = json.loads(request.content)["variables"]["username"]
+        return httpx.Response(200, json=calendar_response(synthetic_contribution_data(username, seed=seeds[username], end=END)))
+
+    client = GitHubClient("token", client=httpx.Client(transport=httpx.MockTransport(handler)))
+    rendered: dict[str, str] = {}
+
+    def check() -> list[str]:
+        template = str(tmp_path / "{username}.gif")
+        results = watch_cycle(client, ["alice", "bob"], rendered, template, "column", 30, False, 3, 0, 1)
+        return sorted(result.name for result in results)
+
+    assert check() == ["alice", "bob"]
+    bob_written = (tmp_path / "bob.gif").stat().st_mtime_ns
+    assert check() == []
+
+    seeds["alice"] = 1
+    assert check() == ["alice"]
+    assert (tmp_path / "bob.gif").stat().st_mtime_ns == bob_written
@@ -0,0 +1,132 @@
+"""Tests for the on-disk contribution cache."""
+
+import json
+
+import httpx
+import pytest
+from gh_space_shooter.contribution_cache import ContributionCache
+from gh_space_shooter.github_client import GitHubClient, GitHubUserNotFoundError
+from gh_space_shooter.synthetic import calendar_response
+
+
+def counting_transport(payload: dict, requests: list) -> httpx.MockTransport:
+    """Mock transport that records requests and answers revalidation queries too."""
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        query = json.loads(request.content)["query"]
+        requests.append(query)
+        return httpx.Response(200, json=payload)
+
+    return httpx.MockTransport(handler)
+
+
+def test_fresh_entry_skips_network(tmp_path, make_contribution_data):
+    """A fresh cache entry should be served without any request."""
+    requests: list[str] = []
+    cache = ContributionCache(tmp_path)
+    payload = calendar_response(make_contribution_data())
+    client = GitHubClient("token", client=httpx.Client(transport=counting_transport(payload, requests)), cache=cache)
+
+    first = client.get_contribution_graph("octocat")
+    second = client.get_contribution_graph("octocat")
+
+    assert first == second
+    assert len(requests) == 1
+
+
+def test_stale_entry_is_revalidated_cheaply(tmp_path, make_contribution_data):
+    """A stale but unchanged entry should be revalidated with the total-only query."""
+    requests: list[str] = []
+    cache = ContributionCache(tmp_path, ttl=0)
+    payload = calendar_response(make_contribution_data())
+    client = GitHubClient("token", client=httpx.Client(transport=counting_transport(payload, requests)), cache=cache)
+
+    first = client.get_contribution_graph("octocat")
+    second = client.get_contribution_graph("octocat")
+
+    assert first == second
+    assert len(requests) == 2
+    assert "weeks" not in requests[1]
+
+
+def test_stale_changed_entry_is_refetched(tmp_path, make_contribution_data):
+    """A stale entry whose total changed should trigger a full fetch."""
+    cache = ContributionCache(tmp_path, ttl=0)
+    one_week, two_weeks = calendar_response(make_contribution_data(1)), calendar_response(make_contribution_data(2))
+    GitHubClient(
+        "token", client=httpx.Client(transport=counting_transport(one_week, [])), cache=cache
+    ).get_contribution_graph("octocat")
+
+    requests: list[str] = []
+    data = GitHubClient(
+        "token", client=httpx.Client(transport=counting_transport(two_weeks, requests)), cache=cache
+    ).get_contribution_graph("octocat")
+
+    assert len(data["weeks"]) == 2
+    assert len(requests) == 2
+    assert "weeks" in requests[1]
+
+
+def test_user_not_found_is_cached(tmp_path):
+    """A "user not found" result should be served from the cache."""
+    requests: list[str] = []
+    cache = ContributionCache(tmp_path)
+    client = GitHubClient("token", client=httpx.Client(transport=counting_transport({"data": {"user": None}}, requests)), cache=cache)
+
+    for _ in range(2):
+        with pytest.raises(GitHubUserNotFoundError):
+            client.get_contribution_graph("ghost")
+
+    assert len(requests) == 1
+
+
+def test_batch_user_not_found_is_cached(tmp_path, batch_transport):
+    """A user a batched fetch reports as not found should be served from the cache."""
+    requests: list[httpx.Request] = []
+    cache = ContributionCache(tmp_path)
+    client = GitHubClient("token", client=httpx.Client(transport=batch_transport({"alice"}, requests)), cache=cache)
+
+    first = client.get_contribution_graphs(["alice", "ghost"])
+    second = client.get_contribution_graphs(["alice", "ghost"])
+
+    assert len(requests) == 1
+    assert second == first
+    assert "ghost" in second["errors"]["ghost"]
+    with pytest.raises(GitHubUserNotFoundError):
+        client.get_contribution_graph("ghost")
+
+
+def test_expired_negative_entry_is_ignored(tmp_path):
+    """An expired "user not found" result should not be served."""
+    cache = ContributionCache(tmp_path, negative_ttl=0)
+    cache.put_missing("ghost", "window", "User 'ghost' not found")
+
+    assert cache.get("ghost", "window") is None
+
+
+def test_entries_are_keyed_by_window_and_case_insensitive(tmp_path):
+    """Entries should be keyed by lowercased username and date window."""
+    cache = ContributionCache(tmp_path)
+    data = {"username": "Octocat", "total_contributions": 0, "weeks": []}
+    cache.put("Octocat", "2024-01-01", data)
+
+    entry = cache.get("octocat", "2024-01-01")
+    assert entry is not None
+    assert entry.fresh
+    assert entry.data == data
+    assert cache.get("octocat", "2024-01-02") is None
+
+
+def test_batch_fetch_uses_cache(tmp_path):
+    """Batched fetches should skip users with fresh cache entries."""
+    cache = ContributionCache(tmp_path)
+    data = {"username": "alice", "total_contributions": 0, "weeks": []}
+    client = GitHubClient("token", client=httpx.Client(transport=counting_transport({}, [])), cache=cache)
+    cache.put("alice", client._cache_window(), data)
+
+    requests: list[str] = []
+    client.client = httpx.Client(transport=counting_transport({}, requests))
+    batch = client.get_contribution_graphs(["alice"])
+
+    assert batch["results"] == {"alice": data}
+    assert requests == []
@@ -0,0 +1,100 @@
+"""Tests for the binary contribution data format."""
+
+import json
+from datetime import date, timedelta
+
+import pytest
+from typer.testing import CliRunner
+from gh_space_shooter.cli import app
+from gh_space_shooter.contribution_format import (
+    decode_contribution_data,
+    encode_contribution_data,
+    load_contribution_archive,
+    load_contribution_data,
+    save_contribution_data,
+)
+from gh_space_shooter.contribution_history import group_weeks
+
+runner = CliRunner()
+
+
+def contribution_data(username: str = "octocat", num_days: int = 364) -> dict:
+    """Build a year of data starting on a Sunday, with a few large counts."""
+    start = date(2024, 1, 7)
+    days = [
+        {"date": (start + timedelta(days=idx)).isoformat(), "count": (idx * 37) % 11 * (idx % 5 == 0) + (300 if idx == 100 else 0), "level": idx % 5}
+        for idx in range(num_days)
+    ]
+    return {"username": username, "total_contributions": 1234, "weeks": group_weeks(days)}
+
+
+def test_round_trip():
+    """Decoding an encoded record should reproduce the data exactly."""
+    data = contribution_data()
+
+    assert decode_contribution_data(encode_contribution_data(data)) == data
+
+
+def test_much_smaller_than_json():
+    """A year should take a fraction of the JSON size (one nibble plus ~one byte per day)."""
+    data = contribution_data()
+
+    encoded = encode_contribution_data(data)
+
+    assert len(encoded) < 600
+    assert len(json.dumps(data, indent=2)) > 30 * len(encoded)
+
+
+def test_odd_day_count_and_empty_data():
+    """Odd numbers of days and empty data should round-trip."""
+    for data in (contribution_data(num_days=5), {"username": "ghost", "total_contributions": 0, "weeks": []}):
+        assert decode_contribution_data(encode_contribution_data(data)) == data
+
+
+def test_file_is_memory_mapped_on_load(tmp_path):
+    """Files should load through the memory-mapped reader."""
+    data = contribution_data()
+    path = tmp_path / "data.ghss"
+
+    save_contribution_data(data, path)
+
+    assert load_contribution_data(path) == data
+
+
+def test_archive_of_concatenated_records(tmp_path):
+    """An archive of concatenated records should decode record by record."""
+    users = [contribution_data(f"user{idx}", num_days=30 + idx) for idx in range(3)]
+    path = tmp_path / "archive.ghss"
+    path.write_bytes(b"".join(encode_contribution_data(data) for data in users))
+
+    assert load_contribution_archive(path) == users
+    with pytest.raises(ValueError, match="trailing bytes"):
+        load_contribution_data(path)
+
+
+def test_rejects_invalid_input():
+    """Bad magic, truncation and gaps between days should raise ValueError."""
+    encoded = encode_contribution_data(contribution_data())
+
+    with pytest.raises(ValueError, match="Not a gh-space-shooter"):
+        decode_contribution_data(b"JSON" + encoded[4:])
+    with pytest.raises(ValueError, match="Truncated"):
+        decode_contribution_data(encoded[:-1])
+
+    data = contribution_data(num_days=14)
+    del data["weeks"][0]["days"][3]
+    with pytest.raises(ValueError, match="not consecutive"):
+        encode_contribution_data(data)
+
+
+def test_cli_converts_json_to_binary(tmp_path):
+    """--raw-input/--raw-output should pick the binary format by extension."""
+    data = contribution_data()
+    json_path = tmp_path / "data.json"
+    binary_path = tmp_path / "data.ghss"
+    json_path.write_text(json.dumps(data))
+
+    result = runner.invoke(app, ["octocat", "--raw-input", str(json_path), "--raw-output", str(binary_path), "--output", str(tmp_path / "out.gif"), "--max-frame", "1"])
+
+    assert result.exit_code == 0, result.output
+    assert load_contribution_data(binary_path) == data
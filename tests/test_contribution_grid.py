@@ -0,0 +1,105 @@
+"""Tests for ContributionGrid."""
+
+import pickle
+
+import httpx
+import pytest
+from gh_space_shooter.contribution_grid import ContributionGrid
+from gh_space_shooter.game.game_state import GameState
+from gh_space_shooter.github_client import GitHubClient
+from gh_space_shooter.synthetic import calendar_response
+
+PARTIAL_DATA = {
+    "username": "octocat",
+    "total_contributions": 12,
+    "weeks": [
+        {"days": [{"date": "2024-01-05", "count": 2, "level": 1}, {"date": "2024-01-06", "count": 0, "level": 0}]},
+        {"days": [{"date": f"2024-01-{7 + day:02d}", "count": day, "level": min(day, 4)} for day in range(7)]},
+        {"days": [{"date": "2024-01-14", "count": 400, "level": 4}]},
+    ],
+}
+
+
+def test_round_trip_is_lossless(sample_data):
+    """Converting to a grid and back should reproduce the data exactly."""
+    for data in (PARTIAL_DATA, sample_data):
+        assert ContributionGrid.from_contribution_data(data).to_contribution_data() == data
+
+
+def test_cell_access_and_views():
+    """Cells, columns and rows should follow ContributionData positions."""
+    grid = ContributionGrid.from_contribution_data(PARTIAL_DATA)
+
+    assert grid.num_weeks == 3
+    assert grid.week_lengths == (2, 7, 1)
+    assert grid.level(1, 5) == 4 and grid.count(1, 5) == 5 and grid.date(1, 5) == "2024-01-12"
+    assert grid.count(2, 0) == 400
+    assert grid.level(0, 6) == 0 and grid.date(0, 6) == ""  # padding
+    assert grid.column(1) == bytes([0, 1, 2, 3, 4, 4, 4])
+    assert grid.row(0) == bytes([1, 0, 4])
+    assert list(grid.active_cells())[:2] == [(0, 0, 1), (1, 1, 1)]
+    with pytest.raises(IndexError):
+        grid.level(3, 0)
+    with pytest.raises(IndexError):
+        grid.row(7)
+
+
+def test_content_hash_is_stable_and_content_based():
+    """Equal content should hash equally; any change should change the hash."""
+    grid = ContributionGrid.from_contribution_data(PARTIAL_DATA)
+    same = ContributionGrid.from_contribution_data(PARTIAL_DATA)
+    changed = ContributionGrid.from_contribution_data(
+        {**PARTIAL_DATA, "weeks": PARTIAL_DATA["weeks"][:2] + [{"days": [{"date": "2024-01-14", "count": 401, "level": 4}]}]}
+    )
+
+    assert grid.content_hash == same.content_hash
+    assert grid == same and hash(grid) == hash(same)
+    assert grid.content_hash != changed.content_hash
+
+
+def test_render_hash_covers_only_what_is_drawn():
+    """Dates, counts, the username and trailing empty cells should not change the render hash; levels should."""
+    grid = ContributionGrid.from_contribution_data(PARTIAL_DATA)
+    relabelled = ContributionGrid.from_contribution_data({
+        "username": "someone-else",
+        "total_contributions": 0,
+        "weeks": [
+            {"days": [{**day, "date": "", "count": 0} for day in week["days"]]} for week in PARTIAL_DATA["weeks"]
+        ] + [{"days": [{"date": "2024-01-15", "count": 0, "level": 0}]}],
+    })
+    moved = ContributionGrid.from_contribution_data({**PARTIAL_DATA, "weeks": PARTIAL_DATA["weeks"][1:]})
+
+    assert relabelled.render_hash == grid.render_hash
+    assert relabelled.content_hash != grid.content_hash
+    assert moved.render_hash != grid.render_hash
+
+def test_grid_is_immutable_and_picklable():
+    """Grids should reject mutation and survive pickling."""
+    grid = ContributionGrid.from_contribution_data(PARTIAL_DATA)
+
+    with pytest.raises(AttributeError):
+        grid.username = "other"  # type: ignore[misc]
+    assert pickle.loads(pickle.dumps(grid)) == grid
+
+
+def test_client_builds_grid_from_response(make_transport, make_contribution_data):
+    """get_contribution_grid should match the grid of get_contribution_graph."""
+    payload = calendar_response(make_contribution_data(53))
+    client = GitHubClient("token", client=httpx.Client(transport=make_transport(payload)))
+
+    grid = client.get_contribution_grid("octocat")
+
+    assert grid == ContributionGrid.from_contribution_data(client.get_contribution_graph("octocat"))
+    assert grid.num_weeks == 52
+
+
+def test_game_state_accepts_grid():
+    """GameState should place the same enemies from a grid as from ContributionData."""
+    from_data = GameState(PARTIAL_DATA)
+    from_grid = GameState(ContributionGrid.from_contribution_data(PARTIAL_DATA))
+
+    def positions(state):
+        return [(enemy.x, enemy.y, enemy.health) for enemy in state.enemies]
+
+    assert positions(from_grid) == positions(from_data)
+    assert (2, 0, 4) in positions(from_grid)
@@ -0,0 +1,150 @@
+"""Tests for incremental updates and multi-year contribution ranges."""
+
+import asyncio
+import json
+import threading
+from datetime import date, datetime, timedelta, timezone
+
+import httpx
+from gh_space_shooter.contribution_history import merge_contribution_data
+from gh_space_shooter.github_client import AsyncGitHubClient, GitHubClient
+from gh_space_shooter.synthetic import calendar_response
+
+
+def contribution_data(start: date, num_days: int, count: int = 1, level: int = 1) -> dict:
+    """Build ContributionData with Sunday-start weeks from start onwards."""
+    weeks: list[dict] = []
+    for offset in range(num_days):
+        day = start + timedelta(days=offset)
+        if not weeks or day.weekday() == 6:
+            weeks.append({"days": []})
+        weeks[-1]["days"].append({"date": day.isoformat(), "count": count, "level": level})
+    return {"username": "octocat", "total_contributions": count * num_days, "weeks": weeks}
+
+
+def test_merge_rolls_weeks_forward():
+    """New days should start a new week and push the oldest week out."""
+    base = contribution_data(date(2024, 1, 7), 52 * 7)  # Sunday, exactly 52 weeks
+    update = contribution_data(date(2025, 1, 4), 2, count=5)  # Saturday and Sunday
+
+    merged = merge_contribution_data(base, update)
+
+    assert len(merged["weeks"]) == 52
+    assert merged["weeks"][0]["days"][0]["date"] == "2024-01-14"
+    assert merged["weeks"][-2]["days"][-1] == {"date": "2025-01-04", "count": 5, "level": 1}
+    assert merged["weeks"][-1]["days"] == [{"date": "2025-01-05", "count": 5, "level": 1}]
+    assert merged["total_contributions"] == sum(day["count"] for week in merged["weeks"] for day in week["days"])
+
+
+def test_merge_rescales_window_levels():
+    """Levels of the narrow window should be mapped onto the base data's ranges."""
+    base = contribution_data(date(2024, 1, 7), 7, count=1, level=1)
+    base["weeks"][0]["days"][1].update(count=10, level=4)
+    # GitHub reports the window's only contribution as top quartile
+    update = contribution_data(date(2024, 1, 14), 1, count=2, level=4)
+
+    merged = merge_contribution_data(base, update)
+
+    assert merged["weeks"][-1]["days"][0]["level"] == 1
+
+
+def test_merge_keeps_zero_count_days_at_level_zero():
+    """Days without contributions should stay at level 0."""
+    base = contribution_data(date(2024, 1, 7), 7)
+    update = contribution_data(date(2024, 1, 13), 1, count=0, level=0)
+
+    merged = merge_contribution_data(base, update)
+
+    assert merged["weeks"][0]["days"][-1] == {"date": "2024-01-13", "count": 0, "level": 0}
+    assert merged["total_contributions"] == 6
+
+
+def test_update_fetches_only_recent_window(make_transport, make_contribution_data):
+    """update_contribution_graph should request the days since the last saved day."""
+    today = datetime.now(timezone.utc).date()
+    previous = contribution_data(today - timedelta(days=30), 29)
+    requests: list[httpx.Request] = []
+    payload = calendar_response(make_contribution_data(1))
+    client = GitHubClient("token", client=httpx.Client(transport=make_transport(payload, requests=requests)))
+
+    merged = client.update_contribution_graph(previous)
+
+    variables = json.loads(requests[0].content)["variables"]
+    assert variables["from"] == f"{(today - timedelta(days=3)).isoformat()}T00:00:00Z"
+    assert variables["to"] == f"{today.isoformat()}T23:59:59Z"
+    assert merged["username"] == "octocat"
+
+
+def test_update_of_outdated_data_fetches_full_graph(make_transport, make_contribution_data):
+    """Data older than the graph should be replaced by a full fetch."""
+    previous = contribution_data(date(2020, 1, 5), 7)
+    requests: list[httpx.Request] = []
+    payload = calendar_response(make_contribution_data())
+    client = GitHubClient("token", client=httpx.Client(transport=make_transport(payload, requests=requests)))
+
+    data = client.update_contribution_graph(previous)
+
+    assert "from" not in json.loads(requests[0].content)["variables"]
+    assert data["total_contributions"] == make_contribution_data()["total_contributions"]
+
+
+def window_transport(requests: list, barrier: threading.Barrier | None = None) -> httpx.MockTransport:
+    """Mock transport answering window queries with one contribution per day, optionally after a barrier."""
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        variables = json.loads(request.content)["variables"]
+        requests.append(variables)
+        if barrier is not None:
+            barrier.wait()
+        start = date.fromisoformat(variables["from"][:10])
+        end = date.fromisoformat(variables["to"][:10])
+        days = [
+            {"date": (start + timedelta(days=offset)).isoformat(), "contributionCount": 1, "contributionLevel": "FIRST_QUARTILE"}
+            for offset in range((end - start).days + 1)
+        ]
+        calendar = {"totalContributions": len(days), "weeks": [{"contributionDays": days[idx:idx + 7]} for idx in range(0, len(days), 7)]}
+        return httpx.Response(200, json={"data": {"user": {"contributionsCollection": {"contributionCalendar": calendar}}}})
+
+    return httpx.MockTransport(handler)
+
+
+def test_range_is_split_into_year_windows_and_stitched():
+    """A multi-year range should be fetched per year and stitched without gaps."""
+    requests: list[dict] = []
+    client = GitHubClient("token", client=httpx.Client(transport=window_transport(requests)))
+
+    data = client.get_contribution_range("octocat", date(2020, 1, 1), date(2024, 12, 31))
+
+    days = [day["date"] for week in data["weeks"] for day in week["days"]]
+    assert len(requests) == 5
+    assert days[0] == "2020-01-01" and days[-1] == "2024-12-31"
+    assert len(days) == len(set(days)) == (date(2024, 12, 31) - date(2020, 1, 1)).days + 1
+    assert data["total_contributions"] == len(days)
+    assert all(len(week["days"]) == 7 for week in data["weeks"][1:-1])
+
+
+def test_range_windows_are_fetched_concurrently():
+    """Windows should be fetched in parallel, not one after another."""
+    requests: list[dict] = []
+    # Only lets requests through once all four are in flight; sequential fetches would break it
+    barrier = threading.Barrier(4, timeout=10)
+    client = GitHubClient("token", client=httpx.Client(transport=window_transport(requests, barrier)))
+
+    client.get_contribution_range("octocat", date(2021, 1, 1), date(2024, 12, 31), max_concurrency=4)
+
+    assert len(requests) == 4
+    assert not barrier.broken
+
+
+def test_async_range_fetch():
+    """AsyncGitHubClient should stitch ranges the same way."""
+    requests: list[dict] = []
+
+    async def fetch():
+        async with AsyncGitHubClient("token", client=httpx.AsyncClient(transport=window_transport(requests))) as client:
+            return await client.get_contribution_range("octocat", date(2022, 6, 1), date(2024, 5, 31), max_concurrency=2)
+
+    data = asyncio.run(fetch())
+
+    assert len(requests) == 2
+    assert data["total_contributions"] == (date(2024, 5, 31) - date(2022, 6, 1)).days + 1
@@ -0,0 +1,155 @@
+"""Tests for GitHub API clients."""
+
+import asyncio
+import json
+
+import httpx
+import pytest
+from gh_space_shooter.github_client import AsyncGitHubClient, GitHubAPIError, GitHubClient
+from gh_space_shooter.rate_limit import RetryPolicy
+from gh_space_shooter.synthetic import calendar_response
+
+NO_RETRY = RetryPolicy(max_retries=0)
+
+
+def test_parses_contribution_graph(make_transport, make_contribution_data):
+    """GitHubClient should parse weeks, days and levels."""
+    expected = make_contribution_data()
+    requests: list[httpx.Request] = []
+    http_client = httpx.Client(transport=make_transport(calendar_response(expected), requests=requests))
+
+    with GitHubClient("token", client=http_client) as client:
+        data = client.get_contribution_graph("octocat")
+
+    assert data["username"] == "octocat"
+    assert len(data["weeks"]) == 2
+    assert data == expected
+    assert requests[0].headers["Authorization"] == "Bearer token"
+    assert json.loads(requests[0].content)["variables"] == {"username": "octocat"}
+
+
+def test_truncates_to_52_weeks(make_transport, make_contribution_data):
+    """GitHubClient should keep only the most recent 52 weeks."""
+    http_client = httpx.Client(transport=make_transport(calendar_response(make_contribution_data(53))))
+
+    data = GitHubClient("token", client=http_client).get_contribution_graph("octocat")
+
+    assert len(data["weeks"]) == 52
+
+
+def test_shared_client_is_not_closed(make_transport, make_contribution_data):
+    """A client passed in by the caller should outlive the GitHubClient."""
+    http_client = httpx.Client(transport=make_transport(calendar_response(make_contribution_data())))
+
+    with GitHubClient("token", client=http_client):
+        pass
+
+    assert not http_client.is_closed
+
+
+def test_user_not_found(make_transport):
+    """A null user should raise GitHubAPIError."""
+    http_client = httpx.Client(transport=make_transport({"data": {"user": None}}))
+
+    with pytest.raises(GitHubAPIError, match="not found"):
+        GitHubClient("token", client=http_client).get_contribution_graph("ghost")
+
+
+def test_graphql_errors(make_transport):
+    """GraphQL errors should raise GitHubAPIError with their messages."""
+    http_client = httpx.Client(transport=make_transport({"errors": [{"message": "Bad credentials"}]}))
+
+    with pytest.raises(GitHubAPIError, match="Bad credentials"):
+        GitHubClient("token", client=http_client).get_contribution_graph("octocat")
+
+
+def test_http_errors(make_transport):
+    """HTTP errors should raise GitHubAPIError."""
+    http_client = httpx.Client(transport=make_transport({}, status_code=502))
+
+    with pytest.raises(GitHubAPIError, match="Failed to fetch"):
+        GitHubClient("token", client=http_client, retry_policy=NO_RETRY).get_contribution_graph("octocat")
+
+
+def test_async_client_matches_sync_client(make_transport, make_contribution_data):
+    """AsyncGitHubClient should return the same data as GitHubClient."""
+    sync_data = GitHubClient(
+        "token", client=httpx.Client(transport=make_transport(calendar_response(make_contribution_data())))
+    ).get_contribution_graph("octocat")
+
+    async def fetch():
+        http_client = httpx.AsyncClient(transport=make_transport(calendar_response(make_contribution_data())))
+        async with AsyncGitHubClient("token", client=http_client) as client:
+            data = await client.get_contribution_graph("octocat")
+        assert not http_client.is_closed
+        await http_client.aclose()
+        return data
+
+    assert asyncio.run(fetch()) == sync_data
+
+
+def test_graphql_url_override(monkeypatch, make_transport, make_contribution_data):
+    """GH_SPACE_SHOOTER_GRAPHQL_URL should redirect requests; the Actions-set GITHUB_API_URL should not."""
+    monkeypatch.setenv("GITHUB_API_URL", "https://api.github.com")
+    requests: list[httpx.Request] = []
+    transport = make_transport(calendar_response(make_contribution_data()), requests=requests)
+
+    GitHubClient("token", client=httpx.Client(transport=transport)).get_contribution_graph("octocat")
+    monkeypatch.setenv("GH_SPACE_SHOOTER_GRAPHQL_URL", "http://127.0.0.1:8900/graphql")
+    GitHubClient("token", client=httpx.Client(transport=transport)).get_contribution_graph("octocat")
+
+    assert [str(request.url) for request in requests] == [
+        "https://api.github.com/graphql",
+        "http://127.0.0.1:8900/graphql",
+    ]
+
+
+def test_batch_fetch_splits_results_and_errors(batch_transport, make_contribution_data):
+    """get_contribution_graphs should return per-user results and errors."""
+    requests: list[httpx.Request] = []
+    http_client = httpx.Client(transport=batch_transport({"alice", "bob"}, requests))
+
+    batch = GitHubClient("token", client=http_client).get_contribution_graphs(["alice", "ghost", "bob"])
+
+    assert set(batch["results"]) == {"alice", "bob"}
+    assert batch["results"]["bob"] == make_contribution_data(username="bob")
+    assert "ghost" in batch["errors"]["ghost"]
+    assert len(requests) == 1
+    assert "u2: user(login: $u2)" in json.loads(requests[0].content)["query"]
+
+
+def test_batch_fetch_chunks_requests(batch_transport):
+    """Usernames should be chunked into batches and deduplicated."""
+    requests: list[httpx.Request] = []
+    usernames = [f"user{idx}" for idx in range(5)]
+    http_client = httpx.Client(transport=batch_transport(set(usernames), requests))
+
+    batch = GitHubClient("token", client=http_client).get_contribution_graphs(usernames + ["user0"], batch_size=2)
+
+    assert len(requests) == 3
+    assert set(batch["results"]) == set(usernames)
+    assert batch["errors"] == {}
+
+
+def test_batch_fetch_reports_failed_requests_per_user(make_transport):
+    """A failed request should be reported for every user in its batch."""
+    http_client = httpx.Client(transport=make_transport({}, status_code=502))
+
+    batch = GitHubClient("token", client=http_client, retry_policy=NO_RETRY).get_contribution_graphs(["alice", "bob"])
+
+    assert batch["results"] == {}
+    assert set(batch["errors"]) == {"alice", "bob"}
+
+
+def test_async_batch_fetch(batch_transport):
+    """AsyncGitHubClient should support batched fetches."""
+
+    async def fetch():
+        http_client = httpx.AsyncClient(transport=batch_transport({"alice"}))
+        async with AsyncGitHubClient("token", client=http_client) as client:
+            return await client.get_contribution_graphs(["alice", "ghost"])
+
+    batch = asyncio.run(fetch())
+
+    assert set(batch["results"]) == {"alice"}
+    assert set(batch["errors"]) == {"ghost"}
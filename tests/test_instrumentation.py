@@ -0,0 +1,106 @@
+"""Tests for timing hooks."""
+
+import json
+
+import httpx
+from typer.testing import CliRunner
+from gh_space_shooter import instrumentation
+from gh_space_shooter.cli import app
+from gh_space_shooter.game import Animator, ColumnStrategy
+from gh_space_shooter.github_client import GitHubClient
+from gh_space_shooter.output import GifOutputProvider
+from gh_space_shooter.synthetic import calendar_response, synthetic_contribution_data
+
+
+def test_recording_collects_phase_observations(make_transport, make_contribution_data, sample_data):
+    """Fetching, rendering and encoding should each report their phases."""
+    payload = calendar_response(make_contribution_data(52))
+    client = GitHubClient("token", client=httpx.Client(transport=make_transport(payload)))
+    animator = Animator(sample_data, ColumnStrategy(), fps=30)
+
+    with instrumentation.recording() as samples:
+        client.get_contribution_graph("octocat")
+        data = GifOutputProvider("out.gif").encode(animator.generate_frames(), frame_duration=33)
+
+    names = [name for name, _ in samples]
+    frames = [value for name, value in samples if name == instrumentation.FRAMES]
+    assert names.count(instrumentation.GITHUB_FETCH) == 1
+    assert names.count(instrumentation.SIMULATE) == 1
+    assert names.count(instrumentation.FRAME_RENDER) == frames[0] > 0
+    assert names.count(instrumentation.ENCODE) == 1
+    assert (instrumentation.OUTPUT_BYTES, len(data)) in samples
+    assert all(value >= 0 for _, value in samples)
+
+
+def test_stopping_early_still_reports(sample_data):
+    """An animation cut short by max_frames should report the frames it produced."""
+    animator = Animator(sample_data, ColumnStrategy(), fps=30)
+
+    with instrumentation.recording() as samples:
+        frames = list(animator.generate_frames(max_frames=3))
+
+    assert len(frames) == 3
+    assert (instrumentation.FRAMES, 3) in samples
+    assert [name for name, _ in samples].count(instrumentation.SIMULATE) == 1
+
+
+def test_streamed_encoding_reports_total_size(sample_data):
+    """iter_encode should report the size of all chunks together."""
+    animator = Animator(sample_data, ColumnStrategy(), fps=30)
+
+    with instrumentation.recording() as samples:
+        data = b"".join(GifOutputProvider("out.gif").iter_encode(animator.generate_frames(), frame_duration=33))
+
+    assert (instrumentation.OUTPUT_BYTES, len(data)) in samples
+    assert [name for name, _ in samples].count(instrumentation.ENCODE) == 1
+
+
+def test_write_reports_its_time(tmp_path):
+    """Writing an output to disk should be reported separately from encoding."""
+    with instrumentation.recording() as samples:
+        GifOutputProvider(str(tmp_path / "out.gif")).write(b"GIF89a")
+
+    assert [name for name, _ in samples] == [instrumentation.WRITE]
+
+
+def test_cli_profile_prints_phases(tmp_path, monkeypatch):
+    """--profile should break the run down by phase once the output is written."""
+    monkeypatch.chdir(tmp_path)
+    (tmp_path / "data.json").write_text(json.dumps(synthetic_contribution_data("octocat")))
+
+    result = CliRunner().invoke(app, [
+        "octocat", "-ri", "data.json", "-o", "out.gif", "--max-frame", "5", "--no-manifest", "--profile",
+    ])
+
+    assert result.exit_code == 0, result.output
+    for phase in ("Data load", "Simulation", "Rendering", "Encoding", "Writing", "Total"):
+        assert phase in result.output
+    assert f"Output bytes: {(tmp_path / 'out.gif').stat().st_size:,}" in result.output
+    assert "Peak RSS:" in result.output
+
+
+def test_cli_profile_renders_even_when_up_to_date(tmp_path, monkeypatch):
+    """A repeated --profile run should render again rather than report the output up to date."""
+    monkeypatch.chdir(tmp_path)
+    (tmp_path / "data.json").write_text(json.dumps(synthetic_contribution_data("octocat")))
+    args = ["octocat", "-ri", "data.json", "-o", "out.gif", "--max-frame", "5"]
+
+    assert CliRunner().invoke(app, args).exit_code == 0
+    result = CliRunner().invoke(app, [*args, "--profile"])
+
+    assert result.exit_code == 0, result.output
+    assert "up to date" not in result.output
+    for phase in ("Rendering", "Encoding", "Writing"):
+        assert phase in result.output
+
+def test_hooks_are_removed():
+    """Observations after a hook is removed should not reach it."""
+    seen = []
+    hook = lambda name, value: seen.append(name)
+
+    instrumentation.add_hook(hook)
+    instrumentation.observe("a", 1)
+    instrumentation.remove_hook(hook)
+    instrumentation.observe("b", 1)
+
+    assert seen == ["a"]
@@ -0,0 +1,83 @@
+"""Tests for output manifests."""
+
+import json
+from datetime import date
+
+from typer.testing import CliRunner
+from gh_space_shooter.cli import app
+from gh_space_shooter.manifest import is_up_to_date, manifest_path, write_manifest
+from gh_space_shooter.synthetic import synthetic_contribution_data
+
+runner = CliRunner()
+INPUTS = {"data": "abc", "strategy": "column", "fps": 30, "seed": None}
+
+
+def test_manifest_matches_same_inputs(tmp_path):
+    """An output should be up to date only for the inputs it was written with."""
+    output = str(tmp_path / "out.gif")
+    (tmp_path / "out.gif").write_bytes(b"GIF")
+
+    assert not is_up_to_date(output, INPUTS)
+    write_manifest(output, INPUTS)
+
+    assert is_up_to_date(output, INPUTS)
+    assert not is_up_to_date(output, {**INPUTS, "fps": 40})
+
+
+def test_changed_output_is_not_up_to_date(tmp_path):
+    """An output modified or removed since its manifest was written should be rendered again."""
+    path = tmp_path / "out.gif"
+    path.write_bytes(b"GIF")
+    write_manifest(str(path), INPUTS)
+
+    path.write_bytes(b"GIF, edited")
+    assert not is_up_to_date(str(path), INPUTS)
+    assert is_up_to_date(str(path), INPUTS, verify_output=False)
+
+    path.unlink()
+    assert not is_up_to_date(str(path), INPUTS)
+
+
+def test_other_package_version_is_not_up_to_date(tmp_path):
+    """Outputs rendered by another version of the package should be rendered again."""
+    path = tmp_path / "out.gif"
+    path.write_bytes(b"GIF")
+    write_manifest(str(path), INPUTS)
+    manifest = json.loads(manifest_path(str(path)).read_text())
+    manifest_path(str(path)).write_text(json.dumps({**manifest, "package_version": "0.0.1"}))
+
+    assert not is_up_to_date(str(path), INPUTS)
+
+
+def test_cli_skips_up_to_date_output(tmp_path, monkeypatch):
+    """A second run with the same data and settings should not render."""
+    monkeypatch.chdir(tmp_path)
+    (tmp_path / "raw.json").write_text(json.dumps(synthetic_contribution_data("alice")))
+    args = ["alice", "--raw-input", "raw.json", "--output", "alice.gif", "--max-frame", "5", "--seed", "1"]
+
+    first = runner.invoke(app, args)
+    written = (tmp_path / "alice.gif").stat().st_mtime_ns
+    second = runner.invoke(app, args)
+    changed = runner.invoke(app, [*args, "--strategy", "row"])
+
+    assert first.exit_code == second.exit_code == changed.exit_code == 0
+    assert "alice.gif is up to date" in second.output
+    assert "up to date" not in changed.output
+    assert (tmp_path / "alice.gif.manifest.json").exists()
+    assert (tmp_path / "alice.gif").stat().st_mtime_ns != written
+
+
+def test_cli_inactive_user_stays_up_to_date_across_days(tmp_path, monkeypatch):
+    """An empty calendar that moved on by a day draws the same animation, so it should not render again."""
+    monkeypatch.chdir(tmp_path)
+    args = ["alice", "--raw-input", "raw.json", "--output", "alice.gif", "--max-frame", "5", "--seed", "1"]
+
+    results = []
+    for end in (date(2024, 6, 11), date(2024, 6, 12)):
+        data = synthetic_contribution_data("alice", density=0, end=end)
+        (tmp_path / "raw.json").write_text(json.dumps(data))
+        results.append(runner.invoke(app, args))
+
+    assert [result.exit_code for result in results] == [0, 0]
+    assert "up to date" not in results[0].output
+    assert "alice.gif is up to date" in results[1].output
@@ -1,6 +1,9 @@
 """Tests for output providers."""
 
-from PIL import Image
+import os
+from io import BytesIO
+
+from PIL import Image, ImageChops
 import pytest
 from gh_space_shooter.output import GifOutputProvider, WebPOutputProvider, resolve_output_provider
 
@@ -32,6 +35,39 @@ def test_gif_provider_empty_frames():
     assert result == b""
 
 
+def test_gif_provider_streams_frames_incrementally():
+    """iter_encode should yield a chunk per frame before later frames are produced."""
+    provider = GifOutputProvider("test_output.gif")
+    produced = []
+
+    def frames():
+        for color in ("red", "red", "blue"):
+            produced.append(color)
+            yield create_test_frame(color)
+
+    chunks = provider.iter_encode(frames(), frame_duration=100)
+    first = next(chunks)
+
+    assert first.startswith(b"GIF89")
+    assert produced == ["red"]
+    data = first + b"".join(chunks)
+    assert data.endswith(b";")
+
+    image = Image.open(BytesIO(data))
+    assert image.n_frames == 3
+    assert image.info["duration"] == 100 and image.info["loop"] == 0
+    for index, color in enumerate(("red", "red", "blue")):
+        image.seek(index)
+        assert ImageChops.difference(image.convert("RGB"), create_test_frame(color)).getbbox() is None
+
+
+def test_gif_provider_streams_nothing_for_empty_frames():
+    """iter_encode should yield no chunks for an empty frame list."""
+    provider = GifOutputProvider("test_output.gif")
+
+    assert list(provider.iter_encode(iter([]), frame_duration=100)) == []
+
+
 def test_webp_provider_encodes_frames():
     """WebPOutputProvider should encode frames to WebP format."""
     provider = WebPOutputProvider("test_output.webp")
@@ -81,3 +117,18 @@ def test_resolve_case_insensitive():
 
     provider = resolve_output_provider("output.WEBP", )
     assert isinstance(provider, WebPOutputProvider)
+
+
+def test_write_replaces_file_atomically(tmp_path):
+    """Writing should replace the whole file, leave no temporary files and honour the umask."""
+    path = tmp_path / "out.gif"
+    path.write_bytes(b"old")
+    provider = GifOutputProvider(str(path))
+
+    provider.write(b"new")
+
+    assert path.read_bytes() == b"new"
+    assert [p.name for p in tmp_path.iterdir()] == ["out.gif"]
+    umask = os.umask(0)
+    os.umask(umask)
+    assert path.stat().st_mode & 0o777 == 0o666 & ~umask
@@ -0,0 +1,78 @@
+"""Tests for render profiles."""
+
+import json
+import pstats
+
+import pytest
+from typer.testing import CliRunner
+from gh_space_shooter.cli import app
+from gh_space_shooter.game import Animator, ColumnStrategy
+from gh_space_shooter.profiling import profile_format, profile_to
+
+
+def render_frames(data, count: int = 30) -> None:
+    list(Animator(data, ColumnStrategy(), fps=30).generate_frames(max_frames=count))
+
+
+def test_unknown_suffix_is_rejected():
+    """Only the suffixes of known formats should be accepted."""
+    assert profile_format("run.PSTATS") == "pstats"
+    with pytest.raises(ValueError, match="Unknown profile format"):
+        profile_format("run.html")
+
+
+def test_pstats_profile_holds_render_calls(tmp_path, sample_data):
+    """A .pstats profile should load with pstats and count every rendered frame."""
+    path = tmp_path / "run.pstats"
+
+    with profile_to(str(path)):
+        render_frames(sample_data, 5)
+
+    stats = pstats.Stats(str(path)).stats  # type: ignore[attr-defined]
+    calls = [value[1] for (_, _, function), value in stats.items() if function == "render_frame"]
+    assert calls == [5]
+
+
+def test_collapsed_profile_is_rooted_at_phases(tmp_path, sample_data):
+    """Collapsed stacks should start with their phase and carry a weight."""
+    path = tmp_path / "run.collapsed"
+
+    with profile_to(str(path), interval=0.0005):
+        render_frames(sample_data)
+
+    lines = path.read_text().splitlines()
+    assert lines
+    for line in lines:
+        stack, weight = line.rsplit(" ", 1)
+        assert stack.startswith("[") and int(weight) >= 0
+    assert any(line.startswith("[rendering];") for line in lines)
+
+
+def test_speedscope_profile_is_consistent(tmp_path, sample_data):
+    """Every speedscope sample should reference known frames and have a weight."""
+    path = tmp_path / "run.json"
+
+    with profile_to(str(path), interval=0.0005):
+        render_frames(sample_data)
+
+    document = json.loads(path.read_text())
+    frames = document["shared"]["frames"]
+    profile = document["profiles"][0]
+    assert profile["type"] == "sampled"
+    assert len(profile["samples"]) == len(profile["weights"]) > 0
+    assert all(0 <= index < len(frames) for sample in profile["samples"] for index in sample)
+    assert sum(profile["weights"]) == pytest.approx(profile["endValue"])
+
+
+def test_cli_profiles_synthetic_render(tmp_path, monkeypatch):
+    """--synthetic with --profile-out should render without a token, even when up to date."""
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.delenv("GH_TOKEN", raising=False)
+    args = ["octocat", "--synthetic", "--seed", "1", "-o", "out.gif", "--max-frame", "5"]
+
+    assert CliRunner().invoke(app, args).exit_code == 0
+    result = CliRunner().invoke(app, [*args, "--profile-out", "run.collapsed"])
+
+    assert result.exit_code == 0, result.output
+    assert "up to date" not in result.output
+    assert (tmp_path / "run.collapsed").read_text()
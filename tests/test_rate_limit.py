@@ -0,0 +1,175 @@
+"""Tests for rate-limit handling against a local stub GraphQL server."""
+
+import json
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+from gh_space_shooter.github_client import GitHubAPIError, GitHubClient, GitHubRateLimitError
+from gh_space_shooter.rate_limit import RetryPolicy
+from gh_space_shooter.synthetic import calendar_response
+
+FAST = dict(backoff_base=0.01, backoff_max=0.05)
+
+
+class StubServer:
+    """Serves scripted (status, headers, body) responses, then repeats the last one."""
+
+    def __init__(self) -> None:
+        self.responses: list[tuple[int, dict[str, str], dict]] = []
+        self.request_count = 0
+        stub = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_POST(self) -> None:
+                self.rfile.read(int(self.headers["Content-Length"]))
+                idx = min(stub.request_count, len(stub.responses) - 1)
+                stub.request_count += 1
+                status, headers, body = stub.responses[idx]
+                payload = json.dumps(body).encode()
+                self.send_response(status)
+                for key, value in headers.items():
+                    self.send_header(key, value)
+                self.send_header("Content-Type", "application/json")
+                self.send_header("Content-Length", str(len(payload)))
+                self.end_headers()
+                self.wfile.write(payload)
+
+            def log_message(self, format, *args) -> None:
+                pass
+
+        self.server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+        self.url = f"http://127.0.0.1:{self.server.server_address[1]}/graphql"
+        self.thread = threading.Thread(target=self.server.serve_forever, daemon=True)
+        self.thread.start()
+
+    def client(self, **policy) -> GitHubClient:
+        client = GitHubClient("token", retry_policy=RetryPolicy(**{**FAST, **policy}))
+        client.GITHUB_API_URL = self.url
+        return client
+
+
+@pytest.fixture
+def stub():
+    server = StubServer()
+    yield server
+    server.server.shutdown()
+
+
+def budget_headers(remaining: int, reset_in: float = 3600) -> dict[str, str]:
+    return {
+        "X-RateLimit-Limit": "5000",
+        "X-RateLimit-Remaining": str(remaining),
+        "X-RateLimit-Used": str(5000 - remaining),
+        "X-RateLimit-Reset": str(int(time.time() + reset_in)),
+        "X-RateLimit-Resource": "graphql",
+    }
+
+
+def test_retries_transient_errors(stub: StubServer, make_contribution_data) -> None:
+    """5xx responses should be retried until success."""
+    payload = calendar_response(make_contribution_data())
+    stub.responses = [(502, {}, {}), (503, {}, {}), (200, budget_headers(4998), payload)]
+
+    with stub.client() as client:
+        data = client.get_contribution_graph("octocat")
+
+    assert data["total_contributions"] == make_contribution_data()["total_contributions"]
+    assert stub.request_count == 3
+
+
+def test_reports_budget(stub: StubServer, make_contribution_data) -> None:
+    """The client should expose the budget from the latest response."""
+    stub.responses = [(200, budget_headers(4321), calendar_response(make_contribution_data()))]
+
+    with stub.client() as client:
+        client.get_contribution_graph("octocat")
+
+    assert client.rate_limit is not None
+    assert client.rate_limit.remaining == 4321
+    assert client.rate_limit.used == 679
+    assert client.rate_limit.limit == 5000
+    assert client.rate_limit.seconds_until_reset() > 3000
+
+
+def test_gives_up_after_max_retries(stub: StubServer) -> None:
+    """Persistent failures should raise after max_retries retries."""
+    stub.responses = [(500, {}, {})]
+
+    with stub.client(max_retries=2) as client:
+        with pytest.raises(GitHubAPIError, match="500"):
+            client.get_contribution_graph("octocat")
+
+    assert stub.request_count == 3
+
+
+def test_honors_retry_after(stub: StubServer, make_contribution_data) -> None:
+    """Secondary rate limits should be waited out using Retry-After."""
+    payload = calendar_response(make_contribution_data())
+    stub.responses = [(403, {"Retry-After": "0"}, {"message": "secondary rate limit"}), (200, {}, payload)]
+
+    with stub.client() as client:
+        client.get_contribution_graph("octocat")
+
+    assert stub.request_count == 2
+
+
+def test_exhausted_quota_fails_fast(stub: StubServer) -> None:
+    """An exhausted quota should fail immediately under the fail policy."""
+    stub.responses = [(403, budget_headers(0), {"message": "API rate limit exceeded"})]
+
+    with stub.client(on_exhausted="fail") as client:
+        with pytest.raises(GitHubRateLimitError) as exc_info:
+            client.get_contribution_graph("octocat")
+        assert exc_info.value.reset_at is not None
+
+        # The known budget stops further requests before they are sent
+        with pytest.raises(GitHubRateLimitError):
+            client.get_contribution_graph("octocat")
+
+    assert stub.request_count == 1
+
+
+def test_exhausted_quota_waits_for_reset(stub: StubServer, make_contribution_data) -> None:
+    """An exhausted quota should be waited out under the wait policy."""
+    payload = calendar_response(make_contribution_data())
+    stub.responses = [(429, budget_headers(0, reset_in=1), {}), (200, budget_headers(5000), payload)]
+
+    with stub.client(on_exhausted="wait", max_wait=5) as client:
+        client.get_contribution_graph("octocat")
+
+    assert stub.request_count == 2
+
+
+def test_exhausted_quota_beyond_max_wait_fails(stub: StubServer) -> None:
+    """Waiting longer than max_wait should fail instead."""
+    stub.responses = [(429, budget_headers(0, reset_in=3600), {})]
+
+    with stub.client(on_exhausted="wait", max_wait=5) as client:
+        with pytest.raises(GitHubRateLimitError):
+            client.get_contribution_graph("octocat")
+
+
+def test_graphql_rate_limited_error_is_retried(stub: StubServer, make_contribution_data) -> None:
+    """GraphQL RATE_LIMITED errors in a 200 response should be retried."""
+    stub.responses = [
+        (200, {}, {"errors": [{"type": "RATE_LIMITED", "message": "API rate limit exceeded"}]}),
+        (200, {}, calendar_response(make_contribution_data())),
+    ]
+
+    with stub.client() as client:
+        client.get_contribution_graph("octocat")
+
+    assert stub.request_count == 2
+
+
+def test_permission_errors_are_not_retried(stub: StubServer) -> None:
+    """A 403 unrelated to rate limits should not be retried."""
+    stub.responses = [(403, {}, {"message": "Resource not accessible"})]
+
+    with stub.client() as client:
+        with pytest.raises(GitHubAPIError):
+            client.get_contribution_graph("octocat")
+
+    assert stub.request_count == 1
@@ -0,0 +1,69 @@
+"""Tests for size-budget encoding."""
+
+import random
+
+from PIL import Image
+import pytest
+from gh_space_shooter.output import (
+    GifOutputProvider,
+    SpriteSheetOutputProvider,
+    WebPOutputProvider,
+    WebpDataUrlOutputProvider,
+    fit_to_budget,
+)
+
+
+def create_noisy_frame(seed: int, size: int = 64) -> Image.Image:
+    """Helper to create a frame that does not compress well."""
+    rng = random.Random(seed)
+    return Image.frombytes("RGB", (size, size), bytes(rng.randrange(256) for _ in range(size * size * 3)))
+
+
+FRAMES = [create_noisy_frame(i) for i in range(8)]
+
+
+def test_keeps_settings_when_output_already_fits():
+    """Original settings should be kept when the budget is generous."""
+    provider = GifOutputProvider("out.gif")
+    unconstrained = provider.encode(iter(FRAMES), frame_duration=25)
+
+    result = fit_to_budget(provider, FRAMES, 25, len(unconstrained))
+
+    assert result.data == unconstrained
+    assert result.frame_step == 1
+    assert result.frame_count == len(FRAMES)
+    assert result.scale == 1.0
+
+
+@pytest.mark.parametrize(
+    "provider",
+    [
+        GifOutputProvider("out.gif"),
+        WebPOutputProvider("out.webp"),
+        WebpDataUrlOutputProvider("out.txt"),
+    ],
+)
+def test_output_fits_budget(provider):
+    """Output should be reduced until it fits the budget."""
+    unconstrained = provider.encode(iter(FRAMES), frame_duration=25)
+    budget = len(unconstrained) // 3
+
+    result = fit_to_budget(provider, FRAMES, 25, budget)
+
+    assert len(result.data) <= budget
+    assert result.frame_duration == 25 * result.frame_step
+    # Provider is left configured with the chosen settings
+    for key, value in result.encoder_settings.items():
+        assert getattr(provider, key) == value
+
+
+def test_impossible_budget_raises():
+    """A budget smaller than any possible output should raise ValueError."""
+    with pytest.raises(ValueError, match="cannot be reduced"):
+        fit_to_budget(GifOutputProvider("out.gif"), FRAMES, 25, 10)
+
+
+def test_unsupported_provider_raises():
+    """Providers without tunable settings should be rejected."""
+    with pytest.raises(ValueError, match="not supported"):
+        fit_to_budget(SpriteSheetOutputProvider("out.png"), FRAMES, 25, 1000)
@@ -0,0 +1,116 @@
+"""Tests for sprite sheet output provider."""
+
+from PIL import Image
+import pytest
+from gh_space_shooter.cli import CLIError, _resolve_provider
+from gh_space_shooter.output import SpriteSheetOutputProvider, resolve_output_provider
+from gh_space_shooter.output.section_injection import (
+    _SECTION_START_MARKER,
+    _SECTION_END_MARKER,
+)
+import tempfile
+import os
+
+
+def create_test_frame(color="red"):
+    """Helper to create a test frame."""
+    img = Image.new("RGB", (10, 10), color)
+    return img
+
+
+def test_encodes_png_sheet():
+    """Provider should encode frames as a PNG sprite sheet."""
+    provider = SpriteSheetOutputProvider("sheet.png")
+    frames = [create_test_frame("red"), create_test_frame("blue")]
+
+    result = provider.encode(iter(frames), frame_duration=100)
+
+    assert result.startswith(b"\x89PNG")
+    assert provider.snippet is not None
+    assert "steps(1,end)" in provider.snippet
+
+
+def test_encodes_webp_sheet():
+    """Provider should encode a WebP sheet for .webp paths."""
+    provider = SpriteSheetOutputProvider("sheet.webp")
+    result = provider.encode(iter([create_test_frame("red")]), frame_duration=100)
+
+    assert result.startswith(b"RIFF")
+    assert b"WEBP" in result
+
+
+def test_deduplicates_identical_frames():
+    """Identical frames should be stored once in the sheet."""
+    provider = SpriteSheetOutputProvider("sheet.png")
+    frames = [
+        create_test_frame("red"),
+        create_test_frame("red"),
+        create_test_frame("blue"),
+        create_test_frame("red"),
+    ]
+
+    result = provider.encode(iter(frames), frame_duration=100)
+
+    with tempfile.TemporaryDirectory() as tmpdir:
+        sheet_path = os.path.join(tmpdir, "sheet.png")
+        with open(sheet_path, "wb") as f:
+            f.write(result)
+        with Image.open(sheet_path) as sheet:
+            # Two unique tiles
+            assert sheet.size[0] * sheet.size[1] == 2 * 10 * 10
+
+    assert provider.snippet is not None
+    # Runs of identical frames share a keyframe: red, blue, red, plus the 100% stop
+    assert provider.snippet.count("background-position") == 4
+    assert "0.400s" in provider.snippet
+
+
+def test_empty_frames():
+    """Provider should handle empty frame list."""
+    provider = SpriteSheetOutputProvider("sheet.png")
+    result = provider.encode(iter([]), frame_duration=100)
+
+    assert result == b""
+    assert provider.snippet == ""
+
+
+def test_write_requires_encode():
+    """write() should fail when nothing has been encoded."""
+    provider = SpriteSheetOutputProvider("sheet.png")
+
+    with pytest.raises(ValueError, match="encode"):
+        provider.write(b"")
+
+
+def test_writes_sheet_and_snippet_with_markers():
+    """Provider should write the sheet and inject the snippet between markers."""
+    with tempfile.TemporaryDirectory() as tmpdir:
+        sheet_path = os.path.join(tmpdir, "game.png")
+        provider = SpriteSheetOutputProvider(sheet_path)
+
+        data = provider.encode(iter([create_test_frame("red")]), frame_duration=100)
+        provider.write(data)
+
+        assert os.path.exists(sheet_path)
+        assert provider.snippet_path == os.path.join(tmpdir, "game.html")
+        with open(provider.snippet_path, "r") as f:
+            content = f.read()
+
+        lines = content.splitlines()
+        assert lines[0] == _SECTION_START_MARKER
+        assert "url('game.png')" in content
+        assert lines[-1] == _SECTION_END_MARKER
+
+
+def test_png_is_not_resolved_by_extension():
+    """A .png output should only become a sprite sheet when asked for explicitly."""
+    with pytest.raises(ValueError, match="Unsupported output format"):
+        resolve_output_provider("output.png")
+
+
+def test_cli_png_requires_sprite_sheet_flag():
+    """The CLI should explain how to get a sprite sheet instead of writing one unasked."""
+    with pytest.raises(CLIError, match="--sprite-sheet"):
+        _resolve_provider("output.png", is_dataurl=False)
+
+    assert isinstance(_resolve_provider("output.png", is_dataurl=False, is_sprite_sheet=True), SpriteSheetOutputProvider)
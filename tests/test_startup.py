@@ -0,0 +1,71 @@
+"""Tests guarding the CLI's startup cost with python -X importtime."""
+
+import json
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+import gh_space_shooter
+from gh_space_shooter.synthetic import synthetic_contribution_data
+
+SRC = Path(__file__).parent.parent / "src"
+
+# Modules only needed to fetch from GitHub or to render, which paths doing neither must not import
+HEAVY_MODULES = ("httpx", "PIL", "asyncio", "gh_space_shooter.game", "gh_space_shooter.output")
+
+# Cumulative import time of the CLI, generous enough for slow CI machines
+STARTUP_BUDGET_US = 400_000
+
+
+def import_times(*args: str, cwd: Path | None = None) -> dict[str, int]:
+    """Run Python with -X importtime; returns cumulative microseconds by imported module."""
+    env = {**os.environ, "PYTHONPATH": str(SRC)}
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", *args], capture_output=True, text=True, cwd=cwd, env=env
+    )
+    assert result.returncode == 0, result.stdout + result.stderr
+    times = {}
+    for line in result.stderr.splitlines():
+        if line.startswith("import time:") and not line.endswith("imported package"):
+            _, cumulative, module = line.split("|")
+            times[module.strip()] = int(cumulative)
+    return times
+
+
+def assert_light(times: dict[str, int]) -> None:
+    heavy = sorted(
+        module for module in times if any(module == name or module.startswith(name + ".") for name in HEAVY_MODULES)
+    )
+    assert not heavy, f"Imported {heavy}"
+
+
+def test_cli_import_is_light():
+    """Importing the CLI should stay within budget and not load httpx, Pillow or the game."""
+    times = import_times("-c", "import gh_space_shooter.cli")
+
+    assert_light(times)
+    assert times["gh_space_shooter.cli"] < STARTUP_BUDGET_US
+
+
+def test_help_is_light():
+    times = import_times("-m", "gh_space_shooter.cli", "render", "--help")
+
+    assert_light(times)
+
+
+def test_up_to_date_run_is_light(tmp_path):
+    """A run that stops at the manifest check should not import anything used for rendering."""
+    (tmp_path / "raw.json").write_text(json.dumps(synthetic_contribution_data("alice")))
+    args = ["-m", "gh_space_shooter.cli", "alice", "-ri", "raw.json", "-o", "alice.gif", "--max-frame", "3"]
+    import_times(*args, cwd=tmp_path)
+
+    times = import_times(*args, cwd=tmp_path)
+
+    assert_light(times)
+
+
+def test_package_exports_load_on_access():
+    """Names exported by the package should still be importable from it."""
+    assert gh_space_shooter.GitHubClient.__name__ == "GitHubClient"
+    assert set(gh_space_shooter.__all__) <= set(dir(gh_space_shooter))
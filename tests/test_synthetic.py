@@ -0,0 +1,49 @@
+"""Tests for synthetic contribution graphs."""
+
+from datetime import date
+
+import httpx
+import pytest
+from gh_space_shooter.constants import NUM_WEEKS
+from gh_space_shooter.github_client import GitHubClient
+from gh_space_shooter.synthetic import calendar_response, synthetic_contribution_data
+
+END = date(2024, 6, 12)  # a Wednesday
+
+
+def test_same_inputs_give_same_graph():
+    """A graph should depend only on its username, density, seed and end date."""
+    first = synthetic_contribution_data("octocat", density=0.3, seed=1, end=END)
+
+    assert synthetic_contribution_data("octocat", density=0.3, seed=1, end=END) == first
+    assert synthetic_contribution_data("octocat", density=0.3, seed=2, end=END) != first
+    assert synthetic_contribution_data("hubot", density=0.3, seed=1, end=END)["weeks"] != first["weeks"]
+
+
+def test_graph_is_shaped_like_the_calendar():
+    """Weeks should run Sunday to Saturday and end, partially, on the end date."""
+    data = synthetic_contribution_data("octocat", end=END)
+    days = [day for week in data["weeks"] for day in week["days"]]
+
+    assert len(data["weeks"]) == NUM_WEEKS
+    assert date.fromisoformat(days[0]["date"]).weekday() == 6
+    assert days[-1]["date"] == END.isoformat()
+    assert len(data["weeks"][-1]["days"]) == 4
+    assert data["total_contributions"] == sum(day["count"] for day in days)
+    assert all((day["count"] == 0) == (day["level"] == 0) for day in days)
+
+
+@pytest.mark.parametrize("density", [0.0, 1.0])
+def test_density_bounds(density):
+    """Density 0 should give an empty graph and density 1 a full one."""
+    data = synthetic_contribution_data("octocat", density=density, end=END)
+
+    assert {day["count"] > 0 for week in data["weeks"] for day in week["days"]} == {bool(density)}
+
+
+def test_calendar_response_round_trips_through_the_client(make_transport):
+    """The GraphQL response should parse back into the same graph."""
+    data = synthetic_contribution_data("octocat", end=END)
+    client = GitHubClient("token", client=httpx.Client(transport=make_transport(calendar_response(data))))
+
+    assert client.get_contribution_graph("octocat") == data